@@ -1,18 +1,37 @@
 # controles/avaliacao_controler.py
-from typing import Tuple, Optional, Dict, List, Any
-from dados.database import perfis, jogos, salvar_jogos, avaliacoes, salvar_avaliacoes
+from typing import Tuple, Optional, Dict, List, Any, Iterable, Union
+from dados.database import perfis, jogos, salvar_jogos, avaliacoes, salvar_avaliacoes, geracoes
 from utils.codigos import OK, DADOS_INVALIDOS, CONFLITO, NAO_ENCONTRADO
+from utils import travas
+from utils.travas import protegido, sob_indices
+from utils import versoes
+from utils import paginacao, tempo
+from controles import busca_controler
+from controles import eventos
+from controles import jogo_controler
 
 __all__ = [
-    "Avaliar_jogo", "Listar_avaliacao", "Listar_avaliacao_por_id", 
-    "Editar_avaliacao", "Remover_avaliacao"
+    "Avaliar_jogo", "Listar_avaliacao", "Listar_avaliacao_paginado", "Listar_avaliacao_por_id", 
+    "Editar_avaliacao", "Remover_avaliacao", "Buscar_avaliacao",
+    "Avaliar_jogos_em_lote"
 ]
 
+# Ordenações aceitas na listagem paginada (score: maior primeiro)
+ORDENACOES_AVALIACAO = {
+    "id": lambda a: (a.get("id", 0),),
+    "score": lambda a: (-float(a.get("score", 0.0)), a.get("id", 0)),
+}
+
 def _encontrar_jogo(id_jogo: int) -> Optional[Dict[str, Any]]:
     return next((j for j in jogos if j.get("id") == id_jogo), None)
 
+@sob_indices
 def _recalcular_nota_geral(id_jogo: int) -> None:
-    """Recalcula a média do jogo usando todas as avaliações."""
+    """
+    Recalcula a média do jogo usando todas as avaliações. Roda sob a trava
+    dos índices para que dois recálculos do mesmo jogo não se cruzem
+    (edições concorrentes só travam a própria avaliação).
+    """
     notas = [a["score"] for a in avaliacoes if a.get("id_jogo") == id_jogo]
     jogo = _encontrar_jogo(id_jogo)
     if jogo:
@@ -21,11 +40,38 @@ def _recalcular_nota_geral(id_jogo: int) -> None:
             jogo["nota_geral"] = round(media, 2)
         else:
             jogo["nota_geral"] = 0.0
+        jogo_controler._indexar_facetas(jogo)
         salvar_jogos()
 
-def Avaliar_jogo(id_jogo: int, score: float, descricao: str, id_perfil: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+@sob_indices
+def _recalcular_notas(ids_jogos: set) -> None:
+    """Recalcula a média de vários jogos com uma única passada e uma única gravação."""
+    somas = {id_j: [0.0, 0] for id_j in ids_jogos}
+    for a in avaliacoes:
+        acum = somas.get(a.get("id_jogo"))
+        if acum is not None:
+            acum[0] += a["score"]
+            acum[1] += 1
+    for j in jogos:
+        acum = somas.get(j.get("id"))
+        if acum is not None:
+            j["nota_geral"] = round(acum[0] / acum[1], 2) if acum[1] else 0.0
+            jogo_controler._indexar_facetas(j)
+    salvar_jogos()
+
+def _validar_score(score: Any) -> Optional[float]:
+    try:
+        s = float(score)
+    except (ValueError, TypeError):
+        return None
+    return s if 0.0 <= s <= 10.0 else None
+
+@protegido(leitura=("perfis", "jogos"), escrita=("avaliacoes",))
+def Avaliar_jogo(id_jogo: int, score: float, descricao: str, id_perfil: int, id_avaliacao: Optional[int] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """`id_avaliacao` impõe o id (usado pelo motor fragmentado, que aloca ids globais)."""
     # Valida IDs
-    if not any(p.get("id") == id_perfil for p in perfis):
+    autor = next((p for p in perfis if p.get("id") == id_perfil), None)
+    if autor is None:
         return NAO_ENCONTRADO, None
     if not _encontrar_jogo(id_jogo):
         return NAO_ENCONTRADO, None
@@ -43,31 +89,52 @@ def Avaliar_jogo(id_jogo: int, score: float, descricao: str, id_perfil: int) ->
     if ja_existe:
         return CONFLITO, None
 
-    novo_id = max((a.get("id", 0) for a in avaliacoes), default=0) + 1
+    if id_avaliacao is None:
+        novo_id = max((a.get("id", 0) for a in avaliacoes), default=0) + 1
+    elif any(a.get("id") == id_avaliacao for a in avaliacoes):
+        return CONFLITO, None
+    else:
+        novo_id = id_avaliacao
     
     nova_avaliacao = {
         "id": novo_id,
         "id_jogo": id_jogo,
         "id_perfil": id_perfil,
         "score": s,
-        "descricao": descricao or ""
+        "descricao": descricao or "",
+        "criada_em": tempo.agora(),
+        "versao": versoes.VERSAO_INICIAL
     }
     
     avaliacoes.append(nova_avaliacao)
+    eventos.avaliacao_criada(nova_avaliacao)
+    eventos.atividade_registrada(autor, "avaliacao", id_jogo, s)
     salvar_avaliacoes()
     _recalcular_nota_geral(id_jogo) # Recalcula nota geral
     return OK, nova_avaliacao
 
+@protegido(leitura=("avaliacoes",))
 def Listar_avaliacao() -> Tuple[int, List[Dict[str, Any]]]:
     return OK, avaliacoes
 
+@protegido(leitura=("avaliacoes",), usa_indices=True, le_indices=True)
+def Listar_avaliacao_paginado(tamanho_pagina: int, cursor: Optional[str] = None, ordenar_por: str = "id") -> Tuple[int, Dict[str, Any]]:
+    """Lista avaliações uma página por vez (ver jogo_controler.Listar_Jogo_paginado)."""
+    return paginacao.paginar("avaliacoes", avaliacoes, ORDENACOES_AVALIACAO, geracoes["avaliacoes"], tamanho_pagina, cursor, ordenar_por)
+
+@protegido(leitura=("avaliacoes",))
 def Listar_avaliacao_por_id(id_avaliacao: int) -> Tuple[int, Optional[Dict[str, Any]]]:
     avaliacao = next((a for a in avaliacoes if a.get("id") == id_avaliacao), None)
     if avaliacao is None:
         return NAO_ENCONTRADO, None
     return OK, avaliacao
 
-def Editar_avaliacao(id_avaliacao: int, score: Optional[float], descricao: Optional[str]) -> Tuple[int, Optional[Dict[str, Any]]]:
+@protegido(leitura=("jogos", "avaliacoes"), entidades=lambda id_avaliacao, *args, **kwargs: (id_avaliacao,), colecao_entidades="avaliacoes")
+def Editar_avaliacao(id_avaliacao: int, score: Optional[float], descricao: Optional[str], versao: Optional[int] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Com `versao`, só edita se a avaliação ainda estiver nessa versão
+    (senão CONFLITO). Edições de avaliações diferentes não se bloqueiam.
+    """
     avaliacao = next((a for a in avaliacoes if a.get("id") == id_avaliacao), None)
     if avaliacao is None:
         return NAO_ENCONTRADO, None
@@ -77,17 +144,31 @@ def Editar_avaliacao(id_avaliacao: int, score: Optional[float], descricao: Optio
             s = float(score)
             if not (0.0 <= s <= 10.0):
                 return DADOS_INVALIDOS, None
-            avaliacao["score"] = s
         except ValueError:
             return DADOS_INVALIDOS, None
 
-    if descricao is not None:
-        avaliacao["descricao"] = descricao
+    if not versoes.confere(avaliacao, versao):
+        return CONFLITO, None
 
+    # Só há leitura de "avaliacoes": a alteração e o aviso aos índices são um
+    # passo só sob `indices`, senão um índice construído no meio do caminho
+    # já veria a nota nova e o aviso a contaria de novo
+    with travas.travar_indices():
+        anterior = dict(avaliacao)
+        if score is not None:
+            avaliacao["score"] = s
+
+        if descricao is not None:
+            avaliacao["descricao"] = descricao
+
+        avaliacao["atualizada_em"] = tempo.agora()
+        versoes.avancar(avaliacao)
+        eventos.avaliacao_alterada(anterior, avaliacao)
     salvar_avaliacoes()
     _recalcular_nota_geral(avaliacao["id_jogo"])
     return OK, avaliacao
 
+@protegido(leitura=("jogos",), escrita=("avaliacoes",))
 def Remover_avaliacao(id_avaliacao: int) -> Tuple[int, Optional[None]]:
     avaliacao = next((a for a in avaliacoes if a.get("id") == id_avaliacao), None)
     if avaliacao is None:
@@ -95,6 +176,82 @@ def Remover_avaliacao(id_avaliacao: int) -> Tuple[int, Optional[None]]:
 
     id_jogo_afetado = avaliacao["id_jogo"]
     avaliacoes.remove(avaliacao)
+    travas.descartar_entidade("avaliacoes", id_avaliacao)
+    eventos.avaliacao_removida(avaliacao)
     salvar_avaliacoes()
     _recalcular_nota_geral(id_jogo_afetado)
-    return OK, None
\ No newline at end of file
+    return OK, None
+
+def Buscar_avaliacao(consulta: str, id_jogo: Optional[int] = None, id_perfil: Optional[int] = None, limite: int = 10) -> Tuple[int, List[Dict[str, Any]]]:
+    """Busca textual (BM25) nas descrições, com filtros opcionais por jogo e autor."""
+    return busca_controler.Buscar_Avaliacoes(consulta, id_jogo, id_perfil, limite)
+
+@protegido(leitura=("perfis", "jogos"), escrita=("avaliacoes",))
+def Avaliar_jogos_em_lote(itens: Iterable[Union[Dict[str, Any], Tuple]]) -> Tuple[int, List[Tuple[int, Optional[Dict[str, Any]]]]]:
+    """
+    Ingestão em lote com as mesmas regras de Avaliar_jogo.
+    Cada item é um dict (id_jogo, score, descricao, id_perfil) ou uma tupla
+    nessa ordem. Valida contra conjuntos de ids, detecta duplicatas
+    (perfil, jogo) em uma passada, recalcula a nota de cada jogo afetado
+    uma vez e grava cada arquivo uma vez. Cada avaliação aceita chega ao
+    feed dos seguidores, como em Avaliar_jogo.
+    Retorna a lista de (codigo, avaliacao) na ordem dos itens.
+    """
+    autores = {p.get("id"): p for p in perfis}
+    ids_jogos = {j.get("id") for j in jogos}
+    pares = {(a.get("id_perfil"), a.get("id_jogo")) for a in avaliacoes}
+    proximo_id = max((a.get("id", 0) for a in avaliacoes), default=0) + 1
+    momento = tempo.agora()
+
+    resultados = []
+    afetados = set()
+    for item in itens:
+        if isinstance(item, dict):
+            id_jogo, score = item.get("id_jogo"), item.get("score")
+            descricao, id_perfil = item.get("descricao"), item.get("id_perfil")
+        else:
+            try:
+                id_jogo, score, descricao, id_perfil = item
+            except (TypeError, ValueError):
+                resultados.append((DADOS_INVALIDOS, None))
+                continue
+
+        try:
+            autor = autores.get(id_perfil)
+            existe_jogo = id_jogo in ids_jogos
+        except TypeError:
+            # id não hashável (lista, dict...): inválido só para este item
+            resultados.append((DADOS_INVALIDOS, None))
+            continue
+        if autor is None or not existe_jogo:
+            resultados.append((NAO_ENCONTRADO, None))
+            continue
+        s = _validar_score(score)
+        if s is None:
+            resultados.append((DADOS_INVALIDOS, None))
+            continue
+        if (id_perfil, id_jogo) in pares:
+            resultados.append((CONFLITO, None))
+            continue
+
+        pares.add((id_perfil, id_jogo))
+        nova_avaliacao = {
+            "id": proximo_id,
+            "id_jogo": id_jogo,
+            "id_perfil": id_perfil,
+            "score": s,
+            "descricao": descricao or "",
+            "criada_em": momento,
+            "versao": versoes.VERSAO_INICIAL
+        }
+        proximo_id += 1
+        avaliacoes.append(nova_avaliacao)
+        eventos.avaliacao_criada(nova_avaliacao)
+        eventos.atividade_registrada(autor, "avaliacao", id_jogo, s)
+        afetados.add(id_jogo)
+        resultados.append((OK, nova_avaliacao))
+
+    if afetados:
+        salvar_avaliacoes()
+        _recalcular_notas(afetados)
+    return OK, resultados
\ No newline at end of file
@@ -8,7 +8,10 @@ from typing import Tuple, Optional, Dict, Any, List
 
 from dados.database import perfis, salvar_perfis
 from utils.codigos import OK, NAO_ENCONTRADO, DADOS_INVALIDOS, CONFLITO
+from utils.travas import protegido
+from utils import tempo
 from controles import jogo_controler
+from controles import eventos
 
 VALID_STATUSES = {"jogando", "jogado", "platinado"}
 
@@ -27,6 +30,7 @@ def _recalcular_contadores(perfil: Dict[str, Any]) -> None:
     perfil["jogados"] = sum(1 for e in bibli if e.get("status") == "jogado")
     perfil["platinados"] = sum(1 for e in bibli if e.get("status") == "platinado")
 
+@protegido(leitura=("perfis", "jogos"), entidades=lambda id_perfil, id_jogo, status: (id_perfil,))
 def Adicionar_Jogo(id_perfil: int, id_jogo: int, status: str) -> Tuple[int, Optional[Dict[str, Any]]]:
     """
     Adiciona jogo à biblioteca.
@@ -56,12 +60,15 @@ def Adicionar_Jogo(id_perfil: int, id_jogo: int, status: str) -> Tuple[int, Opti
         return CONFLITO, None
 
     # Criação do item na biblioteca
-    bibli.append({"id_jogo": id_jogo, "status": status})
+    bibli.append({"id_jogo": id_jogo, "status": status, "atualizado_em": tempo.agora()})
     
     _recalcular_contadores(perfil)
+    eventos.biblioteca_alterada(id_perfil, id_jogo, None, status)
+    eventos.atividade_registrada(perfil, "biblioteca", id_jogo, status)
     salvar_perfis()
     return OK, perfil
 
+@protegido(leitura=("perfis", "jogos"), entidades=lambda id_perfil, id_jogo: (id_perfil,))
 def Remover_Jogo(id_perfil: int, id_jogo: int) -> Tuple[int, Optional[None]]:
     """Remove jogo da biblioteca e recalcula contadores."""
     perfil = _encontrar_perfil(id_perfil)
@@ -76,9 +83,11 @@ def Remover_Jogo(id_perfil: int, id_jogo: int) -> Tuple[int, Optional[None]]:
 
     bibli.remove(entry)
     _recalcular_contadores(perfil)
+    eventos.biblioteca_alterada(id_perfil, id_jogo, entry.get("status"), None)
     salvar_perfis()
     return OK, None
 
+@protegido(leitura=("perfis", "jogos"), entidades=lambda id_perfil, id_jogo, status: (id_perfil,))
 def Atualizar_Status_Jogo(id_perfil: int, id_jogo: int, status: str) -> Tuple[int, Optional[Dict[str, Any]]]:
     """
     Atualiza status.
@@ -98,17 +107,23 @@ def Atualizar_Status_Jogo(id_perfil: int, id_jogo: int, status: str) -> Tuple[in
     if not entry:
         return NAO_ENCONTRADO, None # Jogo não está na biblioteca
 
+    anterior = entry.get("status")
     entry["status"] = status
+    entry["atualizado_em"] = tempo.agora()
     _recalcular_contadores(perfil)
+    eventos.biblioteca_alterada(id_perfil, id_jogo, anterior, status)
+    eventos.atividade_registrada(perfil, "biblioteca", id_jogo, status)
     salvar_perfis()
     return OK, perfil
 
+@protegido(leitura=("perfis",))
 def Listar_Biblioteca(id_perfil: int) -> Tuple[int, List[Dict[str, Any]]]:
     perfil = _encontrar_perfil(id_perfil)
     if perfil is None:
         return NAO_ENCONTRADO, []
     return OK, perfil.get("biblioteca", [])
 
+@protegido(leitura=("perfis",))
 def Listar_Biblioteca_por_status(id_perfil: int, status: str) -> Tuple[int, List[Dict[str, Any]]]:
     """Retorna itens filtrados por status."""
     perfil = _encontrar_perfil(id_perfil)
@@ -0,0 +1,121 @@
+# controles/busca_controler.py
+"""
+Busca textual nas descrições das avaliações.
+Mantém um índice invertido (termo -> {id_avaliacao: frequência}) com
+ranqueamento BM25. O índice é construído na primeira busca e, a partir
+daí, atualizado incrementalmente pelo módulo de avaliações.
+"""
+import heapq
+import math
+from collections import Counter
+from typing import Tuple, Optional, Dict, List, Any
+
+from dados.database import avaliacoes
+from utils.codigos import OK, DADOS_INVALIDOS
+from utils.travas import consulta_indice
+from utils.texto import tokenizar
+
+__all__ = ["Buscar_Avaliacoes"]
+
+# Parâmetros clássicos do BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_construido = False
+_postings: Dict[str, Dict[int, int]] = {}
+_termos_doc: Dict[int, Counter] = {}
+_tamanho_doc: Dict[int, int] = {}
+_docs: Dict[int, Dict[str, Any]] = {}
+_tamanho_total = 0
+
+def _descartar_indice() -> None:
+    """Esquece o índice; ele será reconstruído na próxima busca."""
+    global _construido, _tamanho_total
+    _postings.clear()
+    _termos_doc.clear()
+    _tamanho_doc.clear()
+    _docs.clear()
+    _tamanho_total = 0
+    _construido = False
+
+def _adicionar(avaliacao: Dict[str, Any]) -> None:
+    global _tamanho_total
+    id_av = avaliacao["id"]
+    termos = Counter(tokenizar(avaliacao.get("descricao", "")))
+    _docs[id_av] = avaliacao
+    _termos_doc[id_av] = termos
+    _tamanho_doc[id_av] = sum(termos.values())
+    _tamanho_total += _tamanho_doc[id_av]
+    for termo, freq in termos.items():
+        _postings.setdefault(termo, {})[id_av] = freq
+
+def _retirar(id_avaliacao: int) -> None:
+    global _tamanho_total
+    termos = _termos_doc.pop(id_avaliacao, None)
+    _docs.pop(id_avaliacao, None)
+    if termos is None:
+        return
+    _tamanho_total -= _tamanho_doc.pop(id_avaliacao)
+    for termo in termos:
+        lista = _postings.get(termo)
+        if lista is not None:
+            lista.pop(id_avaliacao, None)
+            if not lista:
+                del _postings[termo]
+
+def _construir_indice() -> None:
+    global _construido
+    _descartar_indice()
+    for a in avaliacoes:
+        _adicionar(a)
+    _construido = True
+
+# --- GANCHOS CHAMADOS PELO MÓDULO DE AVALIAÇÕES ---
+
+def _indexar_avaliacao(avaliacao: Dict[str, Any]) -> None:
+    """Indexa (ou reindexa) uma avaliação. Sem efeito se o índice ainda não existe."""
+    if not _construido:
+        return
+    _retirar(avaliacao["id"])
+    _adicionar(avaliacao)
+
+def _remover_avaliacao(id_avaliacao: int) -> None:
+    if not _construido:
+        return
+    _retirar(id_avaliacao)
+
+@consulta_indice
+def Buscar_Avaliacoes(consulta: str, id_jogo: Optional[int] = None, id_perfil: Optional[int] = None, limite: int = 10) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Retorna as avaliações mais relevantes para `consulta` (BM25),
+    opcionalmente filtradas por jogo e/ou autor.
+    """
+    termos = tokenizar(consulta)
+    if not termos or limite <= 0:
+        return DADOS_INVALIDOS, []
+
+    if not _construido:
+        _construir_indice()
+
+    n_docs = len(_docs)
+    if n_docs == 0:
+        return OK, []
+    media_tamanho = _tamanho_total / n_docs
+
+    pontuacao: Dict[int, float] = {}
+    for termo in set(termos):
+        lista = _postings.get(termo)
+        if not lista:
+            continue
+        idf = math.log(1 + (n_docs - len(lista) + 0.5) / (len(lista) + 0.5))
+        for id_av, freq in lista.items():
+            doc = _docs[id_av]
+            if id_jogo is not None and doc.get("id_jogo") != id_jogo:
+                continue
+            if id_perfil is not None and doc.get("id_perfil") != id_perfil:
+                continue
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * _tamanho_doc[id_av] / media_tamanho) if media_tamanho else BM25_K1
+            pontuacao[id_av] = pontuacao.get(id_av, 0.0) + idf * freq * (BM25_K1 + 1) / (freq + norm)
+
+    melhores = heapq.nlargest(limite, pontuacao.items(), key=lambda item: (item[1], -item[0]))
+    return OK, [_docs[id_av] for id_av, _ in melhores]
@@ -0,0 +1,110 @@
+# controles/contadores_controler.py
+"""
+Contadores aproximados de popularidade para painéis:
+
+- jogadores distintos por jogo (perfis que avaliaram, colocaram na
+  biblioteca ou favoritaram), com um HyperLogLog de tamanho fixo por jogo;
+- frequência de eventos por jogo ("avaliacao", "biblioteca", "favorito"),
+  com um único CountMin compartilhado.
+
+Os contadores são cumulativos: remoções não descontam. São montados na
+primeira consulta a partir dos dados atuais e depois alimentados pelos
+avisos de controles.eventos. Contadores de outro processo ou fragmento
+(Estado_Contadores) podem ser somados com Mesclar_Contadores.
+"""
+from typing import Tuple, Dict, Any
+
+from dados.database import perfis, avaliacoes
+from utils.codigos import OK, DADOS_INVALIDOS
+from utils.travas import consulta_indice
+from utils.esbocos import HyperLogLog, CountMin
+
+__all__ = ["Jogadores_Distintos", "Frequencia_Evento", "Estado_Contadores", "Mesclar_Contadores", "EVENTOS"]
+
+EVENTOS = ("avaliacao", "biblioteca", "favorito")
+PRECISAO_HLL = 10          # 1 KiB por jogo, erro típico ~3%
+LARGURA_CMS = 4096
+PROFUNDIDADE_CMS = 4
+
+_construido = False
+_distintos: Dict[int, HyperLogLog] = {}
+_frequencias = CountMin(LARGURA_CMS, PROFUNDIDADE_CMS)
+
+def _descartar() -> None:
+    global _construido, _frequencias
+    _distintos.clear()
+    _frequencias = CountMin(LARGURA_CMS, PROFUNDIDADE_CMS)
+    _construido = False
+
+def _contar(evento: str, id_perfil: int, id_jogo: int) -> None:
+    hll = _distintos.get(id_jogo)
+    if hll is None:
+        hll = _distintos[id_jogo] = HyperLogLog(PRECISAO_HLL)
+    hll.adicionar(id_perfil)
+    _frequencias.adicionar((evento, id_jogo))
+
+def _construir() -> None:
+    global _construido
+    _descartar()
+    for a in avaliacoes:
+        _contar("avaliacao", a.get("id_perfil"), a.get("id_jogo"))
+    for p in perfis:
+        for entrada in p.get("biblioteca", []):
+            _contar("biblioteca", p.get("id"), entrada.get("id_jogo"))
+        for id_jogo in p.get("favoritos", []):
+            _contar("favorito", p.get("id"), id_jogo)
+    _construido = True
+
+def _garantir() -> None:
+    if not _construido:
+        _construir()
+
+# --- GANCHO ---
+
+def _registrar(evento: str, id_perfil: int, id_jogo: int) -> None:
+    if _construido:
+        _contar(evento, id_perfil, id_jogo)
+
+# --- CONSULTAS ---
+
+@consulta_indice
+def Jogadores_Distintos(id_jogo: int) -> Tuple[int, int]:
+    """Estimativa de quantos perfis distintos interagiram com o jogo."""
+    _garantir()
+    hll = _distintos.get(id_jogo)
+    return OK, hll.estimar() if hll else 0
+
+@consulta_indice
+def Frequencia_Evento(id_jogo: int, evento: str) -> Tuple[int, int]:
+    """Estimativa (por cima) de quantos eventos do tipo o jogo recebeu."""
+    if evento not in EVENTOS:
+        return DADOS_INVALIDOS, 0
+    _garantir()
+    return OK, _frequencias.estimar((evento, id_jogo))
+
+@consulta_indice
+def Estado_Contadores() -> Tuple[int, Dict[str, Any]]:
+    """Esboços atuais ({"distintos": {id_jogo: HyperLogLog}, "frequencias": CountMin})."""
+    _garantir()
+    return OK, {"distintos": _distintos, "frequencias": _frequencias}
+
+@consulta_indice
+def Mesclar_Contadores(estado: Dict[str, Any]) -> Tuple[int, None]:
+    """Soma aos contadores locais os esboços de outro processo/fragmento."""
+    distintos = estado.get("distintos", {})
+    frequencias = estado.get("frequencias")
+    # valida tudo antes de alterar, para não mesclar pela metade
+    if any(getattr(h, "precisao", None) != PRECISAO_HLL for h in distintos.values()):
+        return DADOS_INVALIDOS, None
+    if frequencias is not None and (getattr(frequencias, "largura", None), getattr(frequencias, "profundidade", None)) != (LARGURA_CMS, PROFUNDIDADE_CMS):
+        return DADOS_INVALIDOS, None
+
+    _garantir()
+    for id_jogo, hll in distintos.items():
+        local = _distintos.get(id_jogo)
+        if local is None:
+            local = _distintos[id_jogo] = HyperLogLog(PRECISAO_HLL)
+        local.mesclar(hll)
+    if frequencias is not None:
+        _frequencias.mesclar(frequencias)
+    return OK, None
@@ -0,0 +1,151 @@
+# controles/estatisticas_controler.py
+"""
+Estatísticas das notas por jogo: quantidade, média, mediana, desvio padrão
+e histograma (0 a 10).
+As notas ficam agrupadas por jogo em vetores compactos (array('d'))
+mantidos ordenados, de modo que a mediana sai por indexação e soma /
+soma dos quadrados dão média e desvio sem percorrer as avaliações.
+O agrupamento é montado em uma passada sobre colunas (id_jogo, id_perfil,
+score) e atualizado incrementalmente pelo módulo de avaliações.
+
+Só a primeira construção lê `avaliacoes` sob trava de leitura (precisa
+casar com os avisos de alteração); depois disso as consultas ficam só sob
+a trava dos índices e não seguram os escritores. Colunas_Avaliacoes, que
+não depende dos avisos, é tirada do instantâneo imutável, sem trava.
+"""
+import bisect
+import functools
+import math
+from array import array
+from typing import Tuple, Optional, Dict, Any, Iterable, List
+
+from dados.database import avaliacoes, instantaneo
+from utils.codigos import OK, NAO_ENCONTRADO
+from utils.travas import consulta_indice, travar_indices
+
+__all__ = ["Estatisticas_Jogo", "Estatisticas_Catalogo", "Colunas_Avaliacoes"]
+
+BALDES_HISTOGRAMA = 11  # notas 0..10 (10.0 cai no último balde)
+
+_construido = False
+_notas: Dict[int, array] = {}          # id_jogo -> notas ordenadas
+_somas: Dict[int, List[float]] = {}    # id_jogo -> [soma, soma dos quadrados]
+_cache: Dict[int, Dict[str, Any]] = {}
+
+def _descartar() -> None:
+    global _construido
+    _notas.clear()
+    _somas.clear()
+    _cache.clear()
+    _construido = False
+
+def _colunas(registros: Iterable[Dict[str, Any]]) -> Dict[str, array]:
+    id_jogo = array("q")
+    id_perfil = array("q")
+    score = array("d")
+    for a in registros:
+        id_jogo.append(a.get("id_jogo", 0))
+        id_perfil.append(a.get("id_perfil", 0))
+        score.append(float(a.get("score", 0.0)))
+    return {"id_jogo": id_jogo, "id_perfil": id_perfil, "score": score}
+
+def Colunas_Avaliacoes() -> Tuple[int, Dict[str, array]]:
+    """Projeção colunar do instantâneo de `avaliacoes`: {"id_jogo", "id_perfil", "score"}."""
+    return OK, _colunas(instantaneo("avaliacoes").registros)
+
+def _construir() -> None:
+    global _construido
+    _descartar()
+    colunas = _colunas(avaliacoes)
+    grupos: Dict[int, List[float]] = {}
+    for id_jogo, nota in zip(colunas["id_jogo"], colunas["score"]):
+        grupos.setdefault(id_jogo, []).append(nota)
+    for id_jogo, notas in grupos.items():
+        notas.sort()
+        _notas[id_jogo] = array("d", notas)
+        _somas[id_jogo] = [math.fsum(notas), math.fsum(n * n for n in notas)]
+    _construido = True
+
+def _calcular(id_jogo: int) -> Dict[str, Any]:
+    notas = _notas.get(id_jogo)
+    n = len(notas) if notas is not None else 0
+    if n == 0:
+        return {"quantidade": 0, "media": 0.0, "mediana": 0.0, "desvio_padrao": 0.0,
+                "histograma": [0] * BALDES_HISTOGRAMA}
+    soma, soma_q = _somas[id_jogo]
+    media = soma / n
+    variancia = max(soma_q / n - media * media, 0.0)
+    meio = n // 2
+    mediana = notas[meio] if n % 2 else (notas[meio - 1] + notas[meio]) / 2
+    # Vetor ordenado: cada balde é uma fatia obtida por busca binária
+    limites = [bisect.bisect_left(notas, float(b)) for b in range(1, BALDES_HISTOGRAMA)] + [n]
+    histograma = [fim - ini for ini, fim in zip([0] + limites[:-1], limites)]
+    return {
+        "quantidade": n,
+        "media": round(media, 2),
+        "mediana": round(mediana, 2),
+        "desvio_padrao": round(math.sqrt(variancia), 2),
+        "histograma": histograma,
+    }
+
+# --- GANCHOS CHAMADOS A CADA ALTERAÇÃO DE AVALIAÇÃO ---
+
+def _registrar_nota(id_jogo: int, score: float) -> None:
+    if not _construido:
+        return
+    score = float(score)
+    bisect.insort(_notas.setdefault(id_jogo, array("d")), score)
+    somas = _somas.setdefault(id_jogo, [0.0, 0.0])
+    somas[0] += score
+    somas[1] += score * score
+    _cache.pop(id_jogo, None)
+
+def _retirar_nota(id_jogo: int, score: float) -> None:
+    if not _construido:
+        return
+    score = float(score)
+    notas = _notas.get(id_jogo)
+    if notas is None:
+        return
+    pos = bisect.bisect_left(notas, score)
+    if pos < len(notas) and notas[pos] == score:
+        del notas[pos]
+        somas = _somas[id_jogo]
+        somas[0] -= score
+        somas[1] -= score * score
+    if not notas:
+        del _notas[id_jogo]
+        del _somas[id_jogo]
+    _cache.pop(id_jogo, None)
+
+@consulta_indice
+def _construir_se_preciso() -> None:
+    if not _construido:
+        _construir()
+
+def _sobre_indice(funcao):
+    """Consulta sob a trava dos índices; se ainda não construídos, constrói (sob consulta_indice) e tenta de novo."""
+    @functools.wraps(funcao)
+    def envolvida(*args, **kwargs):
+        while True:
+            with travar_indices():
+                if _construido:
+                    return funcao(*args, **kwargs)
+            _construir_se_preciso()
+    return envolvida
+
+@_sobre_indice
+def Estatisticas_Jogo(id_jogo: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+    if id_jogo not in _notas:
+        return NAO_ENCONTRADO, None
+    if id_jogo not in _cache:
+        _cache[id_jogo] = _calcular(id_jogo)
+    return OK, _cache[id_jogo]
+
+@_sobre_indice
+def Estatisticas_Catalogo() -> Tuple[int, Dict[int, Dict[str, Any]]]:
+    """Estatísticas de todos os jogos com ao menos uma avaliação."""
+    for id_jogo in _notas:
+        if id_jogo not in _cache:
+            _cache[id_jogo] = _calcular(id_jogo)
+    return OK, {id_jogo: _cache[id_jogo] for id_jogo in _notas}
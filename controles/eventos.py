@@ -0,0 +1,124 @@
+# controles/eventos.py
+"""
+Propagação das alterações para os índices derivados (busca textual,
+estatísticas, rankings, recomendações, feed, grafo de seguidores, resumos
+de perfil, jogos em alta, contadores aproximados,
+perfis similares, ...). Os controladores chamam
+estas funções logo após alterar os dados; cada índice ignora o aviso se
+ainda não foi construído.
+
+Todos os avisos rodam sob a trava `indices` (ver utils/travas.py).
+"""
+from typing import Dict, Any, Optional
+
+from utils.travas import sob_indices
+
+from controles import busca_controler
+from controles import contadores_controler
+from controles import feed_controler
+from controles import grafo_controler
+from controles import estatisticas_controler
+from controles import ranking_controler
+from controles import recomendacao_controler
+from controles import resumo_controler
+from controles import similaridade_controler
+from controles import tendencias_controler
+
+@sob_indices
+def avaliacao_criada(avaliacao: Dict[str, Any]) -> None:
+    busca_controler._indexar_avaliacao(avaliacao)
+    estatisticas_controler._registrar_nota(avaliacao["id_jogo"], avaliacao["score"])
+    ranking_controler._registrar_nota(avaliacao["id_jogo"], avaliacao["score"])
+    recomendacao_controler._nota_alterada(avaliacao["id_perfil"], avaliacao["id_jogo"], avaliacao["score"])
+    resumo_controler._nota_alterada(avaliacao["id_perfil"], avaliacao["id_jogo"], None, avaliacao["score"])
+    tendencias_controler._registrar(avaliacao["id_jogo"], avaliacao.get("criada_em"))
+    contadores_controler._registrar("avaliacao", avaliacao["id_perfil"], avaliacao["id_jogo"])
+    similaridade_controler._nota_alterada(avaliacao["id_perfil"], avaliacao["id_jogo"], avaliacao["score"])
+
+@sob_indices
+def avaliacao_alterada(anterior: Dict[str, Any], atual: Dict[str, Any]) -> None:
+    """`anterior` é uma cópia da avaliação antes da edição."""
+    if anterior.get("descricao") != atual.get("descricao"):
+        busca_controler._indexar_avaliacao(atual)
+    if anterior.get("score") != atual.get("score"):
+        estatisticas_controler._retirar_nota(anterior["id_jogo"], anterior["score"])
+        estatisticas_controler._registrar_nota(atual["id_jogo"], atual["score"])
+        ranking_controler._retirar_nota(anterior["id_jogo"], anterior["score"])
+        ranking_controler._registrar_nota(atual["id_jogo"], atual["score"])
+        recomendacao_controler._nota_alterada(atual["id_perfil"], atual["id_jogo"], atual["score"])
+        resumo_controler._nota_alterada(atual["id_perfil"], atual["id_jogo"], anterior["score"], atual["score"])
+        similaridade_controler._nota_alterada(atual["id_perfil"], atual["id_jogo"], atual["score"])
+
+@sob_indices
+def avaliacao_removida(avaliacao: Dict[str, Any]) -> None:
+    busca_controler._remover_avaliacao(avaliacao["id"])
+    estatisticas_controler._retirar_nota(avaliacao["id_jogo"], avaliacao["score"])
+    ranking_controler._retirar_nota(avaliacao["id_jogo"], avaliacao["score"])
+    recomendacao_controler._nota_alterada(avaliacao["id_perfil"], avaliacao["id_jogo"], None)
+    resumo_controler._nota_alterada(avaliacao["id_perfil"], avaliacao["id_jogo"], avaliacao["score"], None)
+    tendencias_controler._retirar(avaliacao["id_jogo"], avaliacao.get("criada_em"))
+    similaridade_controler._nota_alterada(avaliacao["id_perfil"], avaliacao["id_jogo"], None)
+
+@sob_indices
+def biblioteca_alterada(id_perfil: int, id_jogo: int, status_anterior: Optional[str], status_novo: Optional[str]) -> None:
+    """Inclusão (anterior None), troca de status ou remoção (novo None) na biblioteca."""
+    recomendacao_controler._perfil_alterado(id_perfil)
+    resumo_controler._biblioteca_alterada(id_perfil, id_jogo, status_anterior, status_novo)
+    if status_novo is not None:
+        tendencias_controler._registrar(id_jogo)
+    if status_anterior is None:
+        contadores_controler._registrar("biblioteca", id_perfil, id_jogo)
+
+@sob_indices
+def favorito_alterado(id_perfil: int, id_jogo: int, favoritado: bool) -> None:
+    recomendacao_controler._perfil_alterado(id_perfil)
+    resumo_controler._favorito_alterado(id_perfil, id_jogo, favoritado)
+    if favoritado:
+        contadores_controler._registrar("favorito", id_perfil, id_jogo)
+
+@sob_indices
+def atividade_registrada(autor: Dict[str, Any], tipo: str, id_jogo: int, valor: Any) -> None:
+    """
+    Atividade visível para seguidores: tipo "avaliacao" (valor = nota) ou
+    "biblioteca" (valor = status). Emitida por Avaliar_jogo, Adicionar_Jogo
+    e Atualizar_Status_Jogo.
+    """
+    feed_controler._publicar(autor, tipo, id_jogo, valor)
+
+@sob_indices
+def jogo_cadastrado(jogo: Dict[str, Any]) -> None:
+    """Chamado por Cadastrar_Jogo e por cada linha aceita em Importar_Jogos."""
+    recomendacao_controler._jogo_cadastrado(jogo)
+    resumo_controler._jogo_cadastrado(jogo)
+    tendencias_controler._jogo_cadastrado(jogo)
+
+@sob_indices
+def jogo_atualizado(jogo: Dict[str, Any]) -> None:
+    ranking_controler._jogo_atualizado(jogo)
+    recomendacao_controler._jogo_cadastrado(jogo)
+    resumo_controler._jogo_atualizado(jogo)
+    tendencias_controler._jogo_cadastrado(jogo)
+
+@sob_indices
+def jogo_removido(id_jogo: int) -> None:
+    """Chamado depois da cascata de Remover_Jogo (avaliações, bibliotecas e favoritos)."""
+    recomendacao_controler._jogo_removido(id_jogo)
+    resumo_controler._jogo_removido(id_jogo)
+    tendencias_controler._jogo_removido(id_jogo)
+
+@sob_indices
+def seguimento_alterado(id_seguidor: int, id_alvo: int, seguindo: bool) -> None:
+    grafo_controler._seguimento_alterado(id_seguidor, id_alvo, seguindo)
+
+@sob_indices
+def perfil_criado(perfil: Dict[str, Any]) -> None:
+    feed_controler._perfil_criado(perfil)
+    recomendacao_controler._perfil_criado(perfil)
+
+@sob_indices
+def perfil_removido(id_perfil: int) -> None:
+    feed_controler._perfil_removido(id_perfil)
+    recomendacao_controler._perfil_removido(id_perfil)
+    grafo_controler._perfil_removido(id_perfil)
+    resumo_controler._perfil_removido(id_perfil)
+    similaridade_controler._perfil_removido(id_perfil)
@@ -0,0 +1,130 @@
+# controles/exportacao_controler.py
+"""
+Exportação do conjunto de dados (perfis, jogos, avaliações) para análise
+e backup. Cada coleção é escrita registro a registro em JSONL ou CSV,
+sem montar o documento inteiro em memória. Opcionalmente, os arrays
+aninhados dos perfis (biblioteca, favoritos, seguidores) viram tabelas
+de arestas próprias. A leitura é feita sobre os instantâneos imutáveis
+de dados.database, então a exportação não segura travas nem atrasa
+quem está gravando.
+
+Uso pela linha de comando:
+    python -m controles.exportacao_controler <diretorio> [--formato csv] [--arestas]
+"""
+import argparse
+import csv
+import json
+import os
+from typing import Tuple, Optional, Dict, Any, Iterable, Iterator, List
+
+from dados.database import instantaneo
+from utils.codigos import OK, DADOS_INVALIDOS, NAO_ENCONTRADO
+
+__all__ = ["Exportar_Dados"]
+
+FORMATOS = ("jsonl", "csv")
+
+# Buffer grande: a exportação fica limitada pela escrita em disco
+TAMANHO_BUFFER = 1 << 20
+
+# Colunas fixas do CSV (permitem escrever o cabeçalho antes de ler os dados)
+COLUNAS = {
+    "perfis": ["id", "nome", "nome_usuario", "descricao", "avatar", "jogando", "jogados", "platinados", "versao"],
+    "jogos": ["id", "titulo", "descricao", "genero", "nota_geral", "versao"],
+    "avaliacoes": ["id", "id_jogo", "id_perfil", "score", "descricao", "criada_em", "atualizada_em", "versao"],
+    "perfil_biblioteca": ["id_perfil", "id_jogo", "status", "atualizado_em"],
+    "perfil_favoritos": ["id_perfil", "id_jogo"],
+    "perfil_seguidores": ["id_perfil", "id_seguidor"],
+}
+ANINHADOS = ["seguidores", "seguindo", "favoritos", "biblioteca"]
+
+def _linhas_perfis(perfis: Iterable[Dict[str, Any]], arestas: bool) -> Iterator[Dict[str, Any]]:
+    for p in perfis:
+        yield {k: v for k, v in p.items() if not (arestas and k in ANINHADOS)}
+
+def _arestas_biblioteca(perfis: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for p in perfis:
+        for e in p.get("biblioteca", []):
+            yield {"id_perfil": p.get("id"), "id_jogo": e.get("id_jogo"), "status": e.get("status"),
+               "atualizado_em": e.get("atualizado_em")}
+
+def _arestas_favoritos(perfis: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for p in perfis:
+        for id_jogo in p.get("favoritos", []):
+            yield {"id_perfil": p.get("id"), "id_jogo": id_jogo}
+
+def _arestas_seguidores(perfis: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for p in perfis:
+        for id_seguidor in p.get("seguidores", []):
+            yield {"id_perfil": p.get("id"), "id_seguidor": id_seguidor}
+
+def _escrever(caminho: str, linhas: Iterable[Dict[str, Any]], formato: str, colunas: List[str]) -> int:
+    total = 0
+    with open(caminho, "w", encoding="utf-8", newline="", buffering=TAMANHO_BUFFER) as f:
+        if formato == "jsonl":
+            for linha in linhas:
+                f.write(json.dumps(linha, ensure_ascii=False))
+                f.write("\n")
+                total += 1
+        else:
+            escritor = csv.DictWriter(f, fieldnames=colunas, extrasaction="ignore")
+            escritor.writeheader()
+            for linha in linhas:
+                # Listas/dicts restantes vão como JSON dentro da célula
+                escritor.writerow({
+                    k: json.dumps(v, ensure_ascii=False) if isinstance(v, (list, tuple, dict)) else v
+                    for k, v in linha.items()
+                })
+                total += 1
+    return total
+
+def Exportar_Dados(diretorio: str, formato: str = "jsonl", arestas: bool = False) -> Tuple[int, Optional[Dict[str, int]]]:
+    """
+    Exporta as coleções para `diretorio` (um arquivo por coleção/tabela).
+    Retorna {nome_do_arquivo: quantidade_de_linhas}.
+    """
+    formato = (formato or "").lower()
+    if formato not in FORMATOS:
+        return DADOS_INVALIDOS, None
+    if not os.path.isdir(diretorio):
+        return NAO_ENCONTRADO, None
+
+    perfis = instantaneo("perfis").registros
+    tabelas = [
+        ("perfis", _linhas_perfis(perfis, arestas)),
+        ("jogos", iter(instantaneo("jogos").registros)),
+        ("avaliacoes", iter(instantaneo("avaliacoes").registros)),
+    ]
+    colunas_perfis = COLUNAS["perfis"] if arestas else COLUNAS["perfis"] + ANINHADOS
+    if arestas:
+        tabelas += [
+            ("perfil_biblioteca", _arestas_biblioteca(perfis)),
+            ("perfil_favoritos", _arestas_favoritos(perfis)),
+            ("perfil_seguidores", _arestas_seguidores(perfis)),
+        ]
+
+    resumo = {}
+    for nome, linhas in tabelas:
+        arquivo = f"{nome}.{formato}"
+        colunas = colunas_perfis if nome == "perfis" else COLUNAS[nome]
+        resumo[arquivo] = _escrever(os.path.join(diretorio, arquivo), linhas, formato, colunas)
+    return OK, resumo
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Exporta perfis, jogos e avaliações.")
+    parser.add_argument("diretorio", help="diretório de destino (deve existir)")
+    parser.add_argument("--formato", choices=FORMATOS, default="jsonl")
+    parser.add_argument("--arestas", action="store_true",
+                        help="exporta biblioteca/favoritos/seguidores como tabelas de arestas")
+    args = parser.parse_args(argv)
+
+    codigo, resumo = Exportar_Dados(args.diretorio, args.formato, args.arestas)
+    if codigo != OK:
+        print("❌ Diretório inexistente." if codigo == NAO_ENCONTRADO else "❌ Formato inválido.")
+        return 1
+    for arquivo, linhas in resumo.items():
+        print(f"  {arquivo}: {linhas} linha(s)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
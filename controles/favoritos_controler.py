@@ -3,17 +3,23 @@
 Módulo de Favoritos.
 Gerencia a lista de jogos favoritos de cada perfil.
 """
-from typing import Tuple, Optional, List, Dict, Any
+from typing import Tuple, Optional, List, Dict, Any, Iterable
 
-from dados.database import perfis, salvar_perfis
+from dados.database import perfis, salvar_perfis, jogos
 from utils.codigos import OK, NAO_ENCONTRADO, CONFLITO
+from utils.travas import protegido
 from controles import jogo_controler
+from controles import eventos
 
-__all__ = ["Favoritar_Jogo", "Desfavoritar_Jogo", "Listar_Favoritos"]
+__all__ = [
+    "Favoritar_Jogo", "Desfavoritar_Jogo", "Listar_Favoritos",
+    "Favoritar_Jogos_em_lote", "Desfavoritar_Jogos_em_lote"
+]
 
 def _encontrar_perfil(id_perfil: int) -> Optional[Dict[str, Any]]:
     return next((p for p in perfis if p.get("id") == id_perfil), None)
 
+@protegido(leitura=("perfis", "jogos"), entidades=lambda id_perfil, id_jogo: (id_perfil,))
 def Favoritar_Jogo(id_perfil: int, id_jogo: int) -> Tuple[int, Optional[Dict[str, Any]]]:
     """
     Adiciona jogo aos favoritos.
@@ -35,9 +41,11 @@ def Favoritar_Jogo(id_perfil: int, id_jogo: int) -> Tuple[int, Optional[Dict[str
         return CONFLITO, None
     
     favs.append(id_jogo)
+    eventos.favorito_alterado(id_perfil, id_jogo, True)
     salvar_perfis()
     return OK, perfil
 
+@protegido(leitura=("perfis", "jogos"), entidades=lambda id_perfil, id_jogo: (id_perfil,))
 def Desfavoritar_Jogo(id_perfil: int, id_jogo: int) -> Tuple[int, Optional[None]]:
     """
     Remove jogo dos favoritos.
@@ -54,12 +62,69 @@ def Desfavoritar_Jogo(id_perfil: int, id_jogo: int) -> Tuple[int, Optional[None]
         return NAO_ENCONTRADO, None
     
     favs.remove(id_jogo)
+    eventos.favorito_alterado(id_perfil, id_jogo, False)
     salvar_perfis()
     return OK, None
 
+@protegido(leitura=("perfis",))
 def Listar_Favoritos(id_perfil: int) -> Tuple[int, List[int]]:
     """Retorna a lista de IDs dos jogos favoritos."""
     perfil = _encontrar_perfil(id_perfil)
     if perfil is None:
         return NAO_ENCONTRADO, []
-    return OK, perfil.get("favoritos", [])
\ No newline at end of file
+    return OK, perfil.get("favoritos", [])
+
+@protegido(leitura=("perfis", "jogos"), entidades=lambda id_perfil, ids_jogos: (id_perfil,))
+def Favoritar_Jogos_em_lote(id_perfil: int, ids_jogos: Iterable[int]) -> Tuple[int, List[int]]:
+    """
+    Favorita vários jogos com uma única gravação (ex.: importar favoritos).
+    Retorna um código por jogo, na ordem recebida.
+    """
+    perfil = _encontrar_perfil(id_perfil)
+    if perfil is None:
+        return NAO_ENCONTRADO, []
+
+    existentes = {j.get("id") for j in jogos}
+    favs = perfil.setdefault("favoritos", [])
+    ja_favoritos = set(favs)
+    codigos = []
+    for id_jogo in ids_jogos:
+        if id_jogo not in existentes:
+            codigos.append(NAO_ENCONTRADO)
+        elif id_jogo in ja_favoritos:
+            codigos.append(CONFLITO)
+        else:
+            ja_favoritos.add(id_jogo)
+            favs.append(id_jogo)
+            eventos.favorito_alterado(id_perfil, id_jogo, True)
+            codigos.append(OK)
+
+    if OK in codigos:
+        salvar_perfis()
+    return OK, codigos
+
+@protegido(leitura=("perfis", "jogos"), entidades=lambda id_perfil, ids_jogos: (id_perfil,))
+def Desfavoritar_Jogos_em_lote(id_perfil: int, ids_jogos: Iterable[int]) -> Tuple[int, List[int]]:
+    """Remove vários jogos dos favoritos com uma única gravação."""
+    perfil = _encontrar_perfil(id_perfil)
+    if perfil is None:
+        return NAO_ENCONTRADO, []
+
+    favs = perfil.get("favoritos", [])
+    restantes = set(favs)
+    removidos = set()
+    codigos = []
+    for id_jogo in ids_jogos:
+        if id_jogo in restantes:
+            restantes.discard(id_jogo)
+            removidos.add(id_jogo)
+            codigos.append(OK)
+        else:
+            codigos.append(NAO_ENCONTRADO)
+
+    if removidos:
+        favs[:] = [i for i in favs if i not in removidos]
+        for id_jogo in removidos:
+            eventos.favorito_alterado(id_perfil, id_jogo, False)
+        salvar_perfis()
+    return OK, codigos
@@ -0,0 +1,124 @@
+# controles/feed_controler.py
+"""
+Feed de atividades dos perfis seguidos ("o que meus amigos estão jogando").
+
+Fan-out na escrita: cada atividade (avaliação, inclusão ou troca de status
+na biblioteca) é copiada para a linha do tempo de cada seguidor, um buffer
+circular limitado a TAMANHO_TIMELINE itens. Perfis com mais de
+LIMIAR_CELEBRIDADE seguidores não fazem fan-out: a atividade fica só na
+caixa de saída do autor e é mesclada na leitura (fan-out na leitura).
+
+Ler uma página custa O(tamanho da página + perfis célebres seguidos): o
+leitor é achado por um mapa id -> perfil mantido pelos avisos de criação
+e remoção de perfis.
+O feed vive apenas em memória; atividades anteriores a um novo "seguir"
+não são copiadas retroativamente.
+"""
+import heapq
+import itertools
+from collections import deque
+from typing import Tuple, Optional, Dict, Any, Iterator
+
+from dados.database import perfis
+from utils.codigos import OK, NAO_ENCONTRADO, DADOS_INVALIDOS
+from utils.travas import consulta_indice
+
+__all__ = ["Feed_Perfil"]
+
+TAMANHO_TIMELINE = 200
+LIMIAR_CELEBRIDADE = 1000
+
+_sequencia = itertools.count(1)
+_timelines: Dict[int, deque] = {}
+_publicacoes: Dict[int, deque] = {}
+_celebridades: set = set()
+_perfis_por_id: Dict[int, Dict[str, Any]] = {}
+_mapa_construido = False
+
+def _descartar() -> None:
+    global _mapa_construido
+    _timelines.clear()
+    _publicacoes.clear()
+    _celebridades.clear()
+    _perfis_por_id.clear()
+    _mapa_construido = False
+
+def _encontrar_perfil(id_perfil: int) -> Optional[Dict[str, Any]]:
+    global _mapa_construido
+    if not _mapa_construido:
+        _perfis_por_id.update((p.get("id"), p) for p in perfis)
+        _mapa_construido = True
+    return _perfis_por_id.get(id_perfil)
+
+# --- GANCHOS ---
+
+def _perfil_criado(perfil: Dict[str, Any]) -> None:
+    if _mapa_construido:
+        _perfis_por_id[perfil.get("id")] = perfil
+
+def _perfil_removido(id_perfil: int) -> None:
+    _perfis_por_id.pop(id_perfil, None)
+    _timelines.pop(id_perfil, None)
+    _publicacoes.pop(id_perfil, None)
+    _celebridades.discard(id_perfil)
+
+def _publicar(autor: Dict[str, Any], tipo: str, id_jogo: int, valor: Any) -> Dict[str, Any]:
+    atividade = {
+        "seq": next(_sequencia),
+        "tipo": tipo,
+        "id_perfil": autor.get("id"),
+        "id_jogo": id_jogo,
+        "valor": valor,
+    }
+    id_autor = autor.get("id")
+    _publicacoes.setdefault(id_autor, deque(maxlen=TAMANHO_TIMELINE)).append(atividade)
+
+    seguidores = autor.get("seguidores", [])
+    if len(seguidores) > LIMIAR_CELEBRIDADE:
+        _celebridades.add(id_autor)
+        return atividade
+    _celebridades.discard(id_autor)
+    for id_seguidor in seguidores:
+        _timelines.setdefault(id_seguidor, deque(maxlen=TAMANHO_TIMELINE)).append(atividade)
+    return atividade
+
+def _mais_recentes(buffer: deque, antes_de: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """Percorre o buffer do fim para o começo, pulando o que não é anterior ao cursor."""
+    for atividade in reversed(buffer):
+        if antes_de is None or atividade["seq"] < antes_de:
+            yield atividade
+
+@consulta_indice
+def Feed_Perfil(id_perfil: int, tamanho_pagina: int = 20, antes_de: Optional[int] = None) -> Tuple[int, Dict[str, Any]]:
+    """
+    Atividades recentes dos perfis seguidos, da mais nova para a mais antiga.
+    Retorna {"itens": [...], "proximo_cursor": seq | None}; passe o cursor em
+    `antes_de` para a próxima página.
+    """
+    if not isinstance(tamanho_pagina, int) or tamanho_pagina <= 0:
+        return DADOS_INVALIDOS, {}
+    leitor = _encontrar_perfil(id_perfil)
+    if leitor is None:
+        return NAO_ENCONTRADO, {}
+
+    seguindo = set(leitor.get("seguindo", []))
+    celebres = _celebridades & seguindo if len(_celebridades) < len(seguindo) else {i for i in seguindo if i in _celebridades}
+
+    fontes = [_mais_recentes(_timelines.get(id_perfil, ()), antes_de)]
+    fontes += [_mais_recentes(_publicacoes[c], antes_de) for c in celebres if c in _publicacoes]
+
+    itens = []
+    ultimo_seq = None
+    for atividade in heapq.merge(*fontes, key=lambda a: -a["seq"]):
+        # A mesma atividade pode vir da timeline e da caixa de saída
+        if atividade["seq"] == ultimo_seq:
+            continue
+        ultimo_seq = atividade["seq"]
+        if atividade["id_perfil"] not in seguindo:
+            continue  # deixou de seguir o autor
+        itens.append(atividade)
+        if len(itens) == tamanho_pagina:
+            break
+
+    proximo = itens[-1]["seq"] if len(itens) == tamanho_pagina else None
+    return OK, {"itens": itens, "proximo_cursor": proximo}
@@ -0,0 +1,440 @@
+# controles/fragmentos_controler.py
+"""
+Execução fragmentada em vários processos (um por núcleo).
+
+Cada processo trabalhador é dono de uma fatia dos perfis (escolhida pelo
+hash do id) e das avaliações escritas por eles, e guarda uma réplica
+completa do catálogo de jogos. Dentro do trabalhador rodam os próprios
+controladores, sobre as listas de dados.database daquele processo.
+
+O roteador (MotorFragmentado, no processo principal) encaminha cada
+chamada ao dono e define o protocolo das operações que cruzam fragmentos:
+
+- ids globais: o roteador aloca ids de perfis e avaliações e mantém o
+  diretório de nomes (nome de perfil é único no sistema todo);
+- seguir entre fragmentos: grava "seguindo" no fragmento do seguidor e
+  depois "seguidores" no do alvo; se o segundo passo falhar, o primeiro
+  é desfeito, e se o desfazer falhar é levantado RuntimeError;
+- desativar conta: o dono remove o perfil e as avaliações dele; os demais
+  fragmentos recebem "esquecer_perfil" para limpar as referências;
+- catálogo: escritas (cadastrar/remover jogo) vão para todos os
+  fragmentos, na mesma ordem, sob uma trava do roteador, o que mantém os
+  ids das réplicas iguais; a remoção faz a cascata local em cada um.
+  Réplicas que respondem diferente (código ou id) levantam RuntimeError,
+  depois de desfazer os cadastros que chegaram a ser feitos;
+- leituras do catálogo vão a um fragmento qualquer, e a nota geral é
+  recomposta somando (soma, quantidade) parciais de todos.
+
+Os índices derivados de cada trabalhador (busca, rankings, ...) cobrem só
+os dados locais. Operações em fragmentos diferentes rodam em paralelo;
+os métodos *_em_lote agrupam por fragmento e enviam um lote a cada um.
+"""
+import multiprocessing
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.codigos import OK, DADOS_INVALIDOS, CONFLITO, NAO_ENCONTRADO
+
+__all__ = ["MotorFragmentado", "fragmento_do_perfil"]
+
+def fragmento_do_perfil(id_perfil: int, quantidade: int) -> int:
+    """Fragmento dono do perfil: hash estável do id (igual em qualquer processo)."""
+    return zlib.crc32(str(id_perfil).encode("ascii")) % quantidade
+
+# --- LADO DO TRABALHADOR ---
+
+def _operacoes_do_trabalhador() -> Dict[str, Any]:
+    from dados import database as db
+    from controles import avaliacao_controler, biblioteca_controler, eventos, favoritos_controler
+    from controles import jogo_controler, perfil_controler, seguidores_controler
+    from utils import versoes
+    from utils.travas import protegido
+
+    # As metades locais seguem o caminho dos controladores: mesmas travas,
+    # avisos aos índices do trabalhador e versão do perfil alterado
+    @protegido(leitura=("perfis",), entidades=lambda id_perfil, campo, outro, presente: (id_perfil,))
+    def ligar(id_perfil: int, campo: str, outro: int, presente: bool) -> Tuple[int, None]:
+        """Metade local de um seguir/parar entre fragmentos."""
+        perfil = next((p for p in db.perfis if p.get("id") == id_perfil), None)
+        if perfil is None:
+            return NAO_ENCONTRADO, None
+        lista = perfil.setdefault(campo, [])
+        if presente == (outro in lista):
+            return (CONFLITO if presente else NAO_ENCONTRADO), None
+        lista.append(outro) if presente else lista.remove(outro)
+        versoes.avancar(perfil)
+        if campo == "seguindo":
+            eventos.seguimento_alterado(id_perfil, outro, presente)
+        else:
+            eventos.seguimento_alterado(outro, id_perfil, presente)
+        db.salvar_perfis()
+        return OK, None
+
+    @protegido(escrita=("perfis",))
+    def esquecer_perfil(id_perfil: int) -> Tuple[int, None]:
+        """Limpa as referências a um perfil removido em outro fragmento."""
+        for p in db.perfis:
+            alterado = False
+            for campo in ("seguindo", "seguidores"):
+                if id_perfil in p.get(campo, []):
+                    p[campo].remove(id_perfil)
+                    alterado = True
+            if alterado:
+                versoes.avancar(p)
+        eventos.perfil_removido(id_perfil)
+        db.salvar_perfis()
+        return OK, None
+
+    def parciais_notas(ids_jogos: List[int]) -> Tuple[int, Dict[int, Tuple[float, int]]]:
+        procurados = set(ids_jogos)
+        parciais: Dict[int, List[float]] = {}
+        for a in db.avaliacoes:
+            if a.get("id_jogo") in procurados:
+                par = parciais.setdefault(a["id_jogo"], [0.0, 0])
+                par[0] += a["score"]
+                par[1] += 1
+        return OK, {id_jogo: (s, n) for id_jogo, (s, n) in parciais.items()}
+
+    def exportar() -> Tuple[int, Dict[str, Any]]:
+        return OK, {"perfis": list(db.perfis), "avaliacoes": list(db.avaliacoes), "jogos": list(db.jogos)}
+
+    return {
+        "criar_perfil": perfil_controler.Criar_Perfil,
+        "busca_perfil": perfil_controler.Busca_Perfil,
+        "desativar_conta": perfil_controler.Desativar_Conta,
+        "seguir": seguidores_controler.Seguir_Perfil,
+        "parar_de_seguir": seguidores_controler.Parar_de_Seguir,
+        "ligar": ligar,
+        "esquecer_perfil": esquecer_perfil,
+        "avaliar": avaliacao_controler.Avaliar_jogo,
+        "remover_avaliacao": avaliacao_controler.Remover_avaliacao,
+        "favoritar": favoritos_controler.Favoritar_Jogo,
+        "desfavoritar": favoritos_controler.Desfavoritar_Jogo,
+        "adicionar_biblioteca": biblioteca_controler.Adicionar_Jogo,
+        "cadastrar_jogo": jogo_controler.Cadastrar_Jogo,
+        "remover_jogo": jogo_controler.Remover_Jogo,
+        "busca_jogo": jogo_controler.Busca_Jogo,
+        "listar_jogos": jogo_controler.Listar_Jogo,
+        "parciais_notas": parciais_notas,
+        "exportar": exportar,
+    }
+
+def _trabalhador(conexao, indice: int, perfis: list, jogos: list, avaliacoes: list, diretorio: Optional[str]) -> None:
+    from dados import database as db
+    db.configurar_arquivos(diretorio, f".frag{indice}")
+    db.perfis[:] = perfis
+    db.jogos[:] = jogos
+    db.avaliacoes[:] = avaliacoes
+    db.publicar_instantaneos()
+    operacoes = _operacoes_do_trabalhador()
+
+    def executar(nome: str, args: tuple):
+        try:
+            return operacoes[nome](*args)
+        except Exception as erro:  # devolvido ao roteador, que levanta lá
+            return ("excecao", f"{type(erro).__name__}: {erro}")
+
+    while True:
+        try:
+            mensagem = conexao.recv()
+        except EOFError:
+            break
+        if mensagem is None:
+            break
+        tipo, carga = mensagem
+        if tipo == "lote":
+            conexao.send([executar(nome, args) for nome, args in carga])
+        else:
+            conexao.send(executar(tipo, carga))
+    # processos filhos não rodam o atexit: garante as escritas pendentes
+    db.aguardar_gravacoes()
+    conexao.close()
+
+# --- ROTEADOR ---
+
+class MotorFragmentado:
+    """
+    Roteador sobre `quantidade` processos. Os dados iniciais vêm das
+    coleções de dados.database do processo atual. Com `diretorio`, cada
+    fragmento grava seus arquivos lá (perfis.fragN.json, ...); sem ele,
+    os fragmentos ficam só em memória e `consolidar()` traz tudo de volta.
+    Use como gerenciador de contexto ou chame `encerrar()`.
+    """
+
+    def __init__(self, quantidade: Optional[int] = None, diretorio: Optional[str] = None):
+        from dados.database import perfis, jogos, avaliacoes
+
+        self.quantidade = quantidade or multiprocessing.cpu_count()
+        self._trava = threading.Lock()            # diretório e contadores de id
+        self._trava_catalogo = threading.Lock()   # ordem das escritas replicadas
+        self._travas_conexao = [threading.Lock() for _ in range(self.quantidade)]
+        self._nomes = {self._chave_nome(p): p["id"] for p in perfis}
+        self._ids_perfis = {p["id"] for p in perfis}
+        self._proximo_perfil = max(self._ids_perfis, default=0) + 1
+        self._proxima_avaliacao = max((a.get("id", 0) for a in avaliacoes), default=0) + 1
+
+        fatias_perfis: List[list] = [[] for _ in range(self.quantidade)]
+        fatias_avaliacoes: List[list] = [[] for _ in range(self.quantidade)]
+        for p in perfis:
+            fatias_perfis[self._dono(p["id"])].append(p)
+        for a in avaliacoes:
+            fatias_avaliacoes[self._dono(a["id_perfil"])].append(a)
+
+        contexto = multiprocessing.get_context("spawn")
+        self._conexoes = []
+        self._processos = []
+        for i in range(self.quantidade):
+            local, remota = contexto.Pipe()
+            processo = contexto.Process(
+                target=_trabalhador, args=(remota, i, fatias_perfis[i], list(jogos), fatias_avaliacoes[i], diretorio),
+                daemon=True, name=f"fragmento-{i}",
+            )
+            processo.start()
+            remota.close()
+            self._conexoes.append(local)
+            self._processos.append(processo)
+        self._paralelo = ThreadPoolExecutor(max_workers=self.quantidade, thread_name_prefix="roteador")
+
+    def __enter__(self) -> "MotorFragmentado":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.encerrar()
+
+    @staticmethod
+    def _chave_nome(perfil_ou_nome) -> str:
+        nome = perfil_ou_nome if isinstance(perfil_ou_nome, str) else (perfil_ou_nome.get("nome_usuario") or perfil_ou_nome.get("nome") or "")
+        return nome.strip().lower()
+
+    def _dono(self, id_perfil: int) -> int:
+        return fragmento_do_perfil(id_perfil, self.quantidade)
+
+    # --- transporte ---
+
+    def _chamar(self, fragmento: int, operacao: str, *args):
+        with self._travas_conexao[fragmento]:
+            self._conexoes[fragmento].send((operacao, args))
+            resposta = self._conexoes[fragmento].recv()
+        return self._verificar(resposta)
+
+    def _lote(self, fragmento: int, chamadas: List[Tuple[str, tuple]]) -> list:
+        with self._travas_conexao[fragmento]:
+            self._conexoes[fragmento].send(("lote", chamadas))
+            respostas = self._conexoes[fragmento].recv()
+        return [self._verificar(r) for r in respostas]
+
+    @staticmethod
+    def _verificar(resposta):
+        if isinstance(resposta, tuple) and resposta and resposta[0] == "excecao":
+            raise RuntimeError(f"erro no fragmento: {resposta[1]}")
+        return resposta
+
+    def _todos(self, operacao: str, *args) -> list:
+        """Mesma chamada em todos os fragmentos, em paralelo, resultados na ordem dos fragmentos."""
+        futuros = [self._paralelo.submit(self._chamar, i, operacao, *args) for i in range(self.quantidade)]
+        return [f.result() for f in futuros]
+
+    # --- perfis ---
+
+    def criar_perfil(self, nome: str, descricao: Optional[str] = None, avatar: Optional[str] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+        if not nome or not nome.strip():
+            return DADOS_INVALIDOS, None
+        chave = self._chave_nome(nome)
+        with self._trava:
+            if chave in self._nomes:
+                return CONFLITO, None
+            id_perfil = self._proximo_perfil
+            self._proximo_perfil += 1
+            self._nomes[chave] = id_perfil  # reserva o nome
+        codigo, perfil = self._chamar(self._dono(id_perfil), "criar_perfil", nome, descricao, avatar, id_perfil)
+        with self._trava:
+            if codigo == OK:
+                self._ids_perfis.add(id_perfil)
+            else:
+                self._nomes.pop(chave, None)
+        return codigo, perfil
+
+    def busca_perfil(self, id_perfil: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+        return self._chamar(self._dono(id_perfil), "busca_perfil", id_perfil)
+
+    def desativar_conta(self, id_perfil: int) -> Tuple[int, None]:
+        codigo, perfil = self.busca_perfil(id_perfil)
+        if codigo != OK:
+            return codigo, None
+        dono = self._dono(id_perfil)
+        codigo, _ = self._chamar(dono, "desativar_conta", id_perfil)
+        if codigo != OK:
+            return codigo, None
+        futuros = [self._paralelo.submit(self._chamar, i, "esquecer_perfil", id_perfil)
+                   for i in range(self.quantidade) if i != dono]
+        for f in futuros:
+            f.result()
+        with self._trava:
+            self._ids_perfis.discard(id_perfil)
+            self._nomes.pop(self._chave_nome(perfil), None)
+        return OK, None
+
+    def seguir(self, id_seguidor: int, id_alvo: int) -> Tuple[int, None]:
+        return self._alterar_seguimento(id_seguidor, id_alvo, True)
+
+    def parar_de_seguir(self, id_seguidor: int, id_alvo: int) -> Tuple[int, None]:
+        return self._alterar_seguimento(id_seguidor, id_alvo, False)
+
+    def _alterar_seguimento(self, id_seguidor: int, id_alvo: int, seguir: bool) -> Tuple[int, None]:
+        if id_seguidor == id_alvo:
+            return DADOS_INVALIDOS, None
+        with self._trava:
+            existem = id_seguidor in self._ids_perfis and id_alvo in self._ids_perfis
+        if not existem:
+            return NAO_ENCONTRADO, None
+        origem, destino = self._dono(id_seguidor), self._dono(id_alvo)
+        if origem == destino:
+            codigo, _ = self._chamar(origem, "seguir" if seguir else "parar_de_seguir", id_seguidor, id_alvo)
+            return codigo, None
+        codigo, _ = self._chamar(origem, "ligar", id_seguidor, "seguindo", id_alvo, seguir)
+        if codigo != OK:
+            return codigo, None
+        try:
+            codigo, _ = self._chamar(destino, "ligar", id_alvo, "seguidores", id_seguidor, seguir)
+        except Exception:
+            self._desfazer_ligacao(origem, id_seguidor, id_alvo, seguir)
+            raise
+        if codigo not in (OK, CONFLITO if seguir else NAO_ENCONTRADO):
+            self._desfazer_ligacao(origem, id_seguidor, id_alvo, seguir)
+            return codigo, None
+        return OK, None
+
+    def _desfazer_ligacao(self, origem: int, id_seguidor: int, id_alvo: int, seguir: bool) -> None:
+        """Compensa o primeiro passo; se nem isso der certo, os fragmentos ficaram inconsistentes."""
+        codigo, _ = self._chamar(origem, "ligar", id_seguidor, "seguindo", id_alvo, not seguir)
+        if codigo != OK:
+            raise RuntimeError(f"não foi possível desfazer 'seguindo' de {id_seguidor} -> {id_alvo} "
+                               f"no fragmento {origem} (código {codigo})")
+
+    # --- avaliações, favoritos e biblioteca (roteados pelo perfil) ---
+
+    def _novo_id_avaliacao(self) -> int:
+        with self._trava:
+            novo = self._proxima_avaliacao
+            self._proxima_avaliacao += 1
+        return novo
+
+    def avaliar_jogo(self, id_jogo: int, score: float, descricao: str, id_perfil: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+        return self._chamar(self._dono(id_perfil), "avaliar", id_jogo, score, descricao, id_perfil, self._novo_id_avaliacao())
+
+    def avaliar_em_lote(self, itens: Iterable[Tuple[int, float, str, int]]) -> Tuple[int, List[Tuple[int, Optional[Dict[str, Any]]]]]:
+        """Itens (id_jogo, score, descricao, id_perfil); um lote por fragmento, todos em paralelo."""
+        por_fragmento: Dict[int, List[Tuple[int, Tuple[str, tuple]]]] = {}
+        for posicao, (id_jogo, score, descricao, id_perfil) in enumerate(itens):
+            chamada = ("avaliar", (id_jogo, score, descricao, id_perfil, self._novo_id_avaliacao()))
+            por_fragmento.setdefault(self._dono(id_perfil), []).append((posicao, chamada))
+
+        futuros = {
+            i: self._paralelo.submit(self._lote, i, [c for _, c in chamadas])
+            for i, chamadas in por_fragmento.items()
+        }
+        resultados: Dict[int, Any] = {}
+        for i, chamadas in por_fragmento.items():
+            for (posicao, _), resultado in zip(chamadas, futuros[i].result()):
+                resultados[posicao] = resultado
+        return OK, [resultados[p] for p in sorted(resultados)]
+
+    def remover_avaliacao(self, id_avaliacao: int) -> Tuple[int, None]:
+        # O roteador não guarda o dono de cada avaliação: pergunta a todos
+        codigos = [c for c, _ in self._todos("remover_avaliacao", id_avaliacao)]
+        return (OK if OK in codigos else NAO_ENCONTRADO), None
+
+    def favoritar(self, id_perfil: int, id_jogo: int):
+        return self._chamar(self._dono(id_perfil), "favoritar", id_perfil, id_jogo)
+
+    def desfavoritar(self, id_perfil: int, id_jogo: int):
+        return self._chamar(self._dono(id_perfil), "desfavoritar", id_perfil, id_jogo)
+
+    def adicionar_biblioteca(self, id_perfil: int, id_jogo: int, status: str):
+        return self._chamar(self._dono(id_perfil), "adicionar_biblioteca", id_perfil, id_jogo, status)
+
+    # --- catálogo (replicado) ---
+
+    def cadastrar_jogo(self, titulo: str, descricao: Optional[str], genero: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """
+        Cadastra em todas as réplicas. Se elas não concordarem no código e
+        no id, os cadastros feitos são desfeitos e é levantado RuntimeError.
+        """
+        with self._trava_catalogo:
+            resultados = self._todos("cadastrar_jogo", titulo, descricao, genero, None)
+            codigos = {c for c, _ in resultados}
+            ids = {j["id"] for c, j in resultados if c == OK}
+            if len(codigos) == 1 and len(ids) <= 1:
+                return resultados[0]
+            sem_desfazer = [i for i, (codigo, jogo) in enumerate(resultados)
+                            if codigo == OK and self._chamar(i, "remover_jogo", jogo["id"])[0] != OK]
+        raise RuntimeError(f"réplicas do catálogo divergiram ao cadastrar {titulo!r}: "
+                           f"{[(c, j and j['id']) for c, j in resultados]}; "
+                           f"cadastro não desfeito nos fragmentos {sem_desfazer}")
+
+    def remover_jogo(self, id_jogo: int) -> Tuple[int, None]:
+        """
+        Remove de todas as réplicas. A cascata local não tem volta: se só
+        parte delas remover, é levantado RuntimeError com os códigos.
+        """
+        with self._trava_catalogo:
+            codigos = [c for c, _ in self._todos("remover_jogo", id_jogo)]
+        if len(set(codigos)) != 1:
+            raise RuntimeError(f"réplicas do catálogo divergiram ao remover o jogo {id_jogo}: {codigos}")
+        return codigos[0], None
+
+    def busca_jogo(self, id_jogo: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Jogo de uma réplica, com a nota geral recomposta de todos os fragmentos."""
+        codigo, jogo = self._chamar(id_jogo % self.quantidade, "busca_jogo", id_jogo)
+        if codigo != OK:
+            return codigo, None
+        soma, quantidade = 0.0, 0
+        for _, parciais in self._todos("parciais_notas", [id_jogo]):
+            s, n = parciais.get(id_jogo, (0.0, 0))
+            soma, quantidade = soma + s, quantidade + n
+        jogo["nota_geral"] = round(soma / quantidade, 2) if quantidade else 0.0
+        return OK, jogo
+
+    def listar_jogos(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """Catálogo de uma réplica, com as notas gerais recompostas."""
+        _, lista = self._chamar(0, "listar_jogos")
+        lista = [dict(jogo) for jogo in lista]
+        totais: Dict[int, List[float]] = {}
+        for _, parciais in self._todos("parciais_notas", [j["id"] for j in lista]):
+            for id_jogo, (s, n) in parciais.items():
+                par = totais.setdefault(id_jogo, [0.0, 0])
+                par[0] += s
+                par[1] += n
+        for jogo in lista:
+            s, n = totais.get(jogo["id"], (0.0, 0))
+            jogo["nota_geral"] = round(s / n, 2) if n else 0.0
+        return OK, lista
+
+    # --- ciclo de vida ---
+
+    def consolidar(self) -> Tuple[int, Dict[str, list]]:
+        """Junta os dados de todos os fragmentos (perfis, avaliações e o catálogo com notas globais)."""
+        exportados = [dado for _, dado in self._todos("exportar")]
+        perfis = sorted((p for e in exportados for p in e["perfis"]), key=lambda p: p["id"])
+        avaliacoes = sorted((a for e in exportados for a in e["avaliacoes"]), key=lambda a: a["id"])
+        _, jogos = self.listar_jogos()
+        return OK, {"perfis": perfis, "jogos": jogos, "avaliacoes": avaliacoes}
+
+    def encerrar(self) -> None:
+        for i, conexao in enumerate(self._conexoes):
+            with self._travas_conexao[i]:
+                try:
+                    conexao.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+        for processo in self._processos:
+            processo.join(timeout=5)
+            if processo.is_alive():
+                processo.terminate()
+        for conexao in self._conexoes:
+            conexao.close()
+        self._conexoes = []
+        self._processos = []
+        self._paralelo.shutdown(wait=True)
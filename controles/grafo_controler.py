@@ -0,0 +1,183 @@
+# controles/grafo_controler.py
+"""
+Análises do grafo de seguidores: seguidores mútuos, sugestões de
+"amigos de amigos" e ranking dos perfis mais seguidos.
+
+O grafo é montado uma vez a partir das listas `seguindo` dos perfis em
+formato CSR (vetores compactos de deslocamentos e destinos), nos dois
+sentidos. Alterações posteriores entram em conjuntos de arestas
+adicionadas/removidas aplicados por cima do CSR; quando esses conjuntos
+passam de FRACAO_COMPACTACAO do total de arestas, o CSR é refeito.
+"""
+import heapq
+from array import array
+from collections import deque
+from typing import Tuple, Dict, List, Set
+
+from dados.database import perfis
+from utils.codigos import OK, NAO_ENCONTRADO, DADOS_INVALIDOS
+from utils.travas import consulta_indice
+
+__all__ = ["Seguidores_Mutuos", "Sugestoes_Amigos", "Mais_Seguidos"]
+
+FRACAO_COMPACTACAO = 0.25
+
+_construido = False
+_ids = array("q")                # índice -> id do perfil
+_indice: Dict[int, int] = {}     # id do perfil -> índice
+_desloc_saida = array("q")
+_destinos_saida = array("q")
+_desloc_entrada = array("q")
+_destinos_entrada = array("q")
+_adicionadas: Set[Tuple[int, int]] = set()
+_removidas: Set[Tuple[int, int]] = set()
+_saida_extra: Dict[int, Set[int]] = {}
+_entrada_extra: Dict[int, Set[int]] = {}
+_grau_entrada: Dict[int, int] = {}
+
+def _descartar() -> None:
+    global _construido
+    _construido = False
+
+def _csr(n: int, arestas: List[Tuple[int, int]]) -> Tuple[array, array]:
+    """Arestas (origem, destino) em índices -> (deslocamentos, destinos)."""
+    desloc = array("q", [0]) * (n + 1)
+    for origem, _ in arestas:
+        desloc[origem + 1] += 1
+    for i in range(n):
+        desloc[i + 1] += desloc[i]
+    destinos = array("q", [0]) * len(arestas)
+    proximo = array("q", desloc[:-1]) if n else array("q")
+    for origem, destino in arestas:
+        destinos[proximo[origem]] = destino
+        proximo[origem] += 1
+    return desloc, destinos
+
+def _construir() -> None:
+    global _construido, _ids, _desloc_saida, _destinos_saida, _desloc_entrada, _destinos_entrada
+    _ids = array("q", sorted(p.get("id") for p in perfis))
+    _indice.clear()
+    _indice.update({id_p: i for i, id_p in enumerate(_ids)})
+    arestas = []
+    for p in perfis:
+        origem = _indice[p.get("id")]
+        for alvo in set(p.get("seguindo", [])):
+            destino = _indice.get(alvo)
+            if destino is not None and destino != origem:
+                arestas.append((origem, destino))
+    _desloc_saida, _destinos_saida = _csr(len(_ids), arestas)
+    _desloc_entrada, _destinos_entrada = _csr(len(_ids), [(d, o) for o, d in arestas])
+    for estrutura in (_adicionadas, _removidas, _saida_extra, _entrada_extra, _grau_entrada):
+        estrutura.clear()
+    for i, id_p in enumerate(_ids):
+        grau = _desloc_entrada[i + 1] - _desloc_entrada[i]
+        if grau:
+            _grau_entrada[id_p] = grau
+    _construido = True
+
+def _garantir() -> None:
+    if not _construido:
+        _construir()
+
+def _vizinhos(id_perfil: int, entrada: bool) -> Set[int]:
+    i = _indice.get(id_perfil)
+    resultado = set()
+    if i is not None:
+        desloc, destinos = (_desloc_entrada, _destinos_entrada) if entrada else (_desloc_saida, _destinos_saida)
+        for d in destinos[desloc[i]:desloc[i + 1]]:
+            vizinho = _ids[d]
+            aresta = (vizinho, id_perfil) if entrada else (id_perfil, vizinho)
+            if aresta not in _removidas:
+                resultado.add(vizinho)
+    resultado |= (_entrada_extra if entrada else _saida_extra).get(id_perfil, set())
+    return resultado
+
+def _no_csr(origem: int, destino: int) -> bool:
+    i, j = _indice.get(origem), _indice.get(destino)
+    if i is None or j is None:
+        return False
+    return j in _destinos_saida[_desloc_saida[i]:_desloc_saida[i + 1]]
+
+# --- GANCHOS ---
+
+def _seguimento_alterado(id_seguidor: int, id_alvo: int, seguindo: bool) -> None:
+    if not _construido:
+        return
+    aresta = (id_seguidor, id_alvo)
+    if seguindo:
+        if aresta in _removidas:
+            _removidas.discard(aresta)
+        elif not _no_csr(*aresta):
+            _adicionadas.add(aresta)
+            _saida_extra.setdefault(id_seguidor, set()).add(id_alvo)
+            _entrada_extra.setdefault(id_alvo, set()).add(id_seguidor)
+        _grau_entrada[id_alvo] = _grau_entrada.get(id_alvo, 0) + 1
+    else:
+        if aresta in _adicionadas:
+            _adicionadas.discard(aresta)
+            _saida_extra[id_seguidor].discard(id_alvo)
+            _entrada_extra[id_alvo].discard(id_seguidor)
+        else:
+            _removidas.add(aresta)
+        _grau_entrada[id_alvo] -= 1
+        if not _grau_entrada[id_alvo]:
+            del _grau_entrada[id_alvo]
+
+    if len(_adicionadas) + len(_removidas) > FRACAO_COMPACTACAO * max(len(_destinos_saida), 64):
+        _descartar()  # refeito na próxima consulta
+
+def _perfil_removido(id_perfil: int) -> None:
+    # Remoção de conta apaga arestas nos dois sentidos: mais simples refazer o CSR
+    _descartar()
+
+# --- CONSULTAS ---
+
+@consulta_indice
+def Seguidores_Mutuos(id_perfil: int) -> Tuple[int, List[int]]:
+    """Perfis que id_perfil segue e que também o seguem."""
+    _garantir()
+    if not any(p.get("id") == id_perfil for p in perfis):
+        return NAO_ENCONTRADO, []
+    return OK, sorted(_vizinhos(id_perfil, False) & _vizinhos(id_perfil, True))
+
+@consulta_indice
+def Sugestoes_Amigos(id_perfil: int, profundidade: int = 2, n: int = 10) -> Tuple[int, List[Dict[str, int]]]:
+    """
+    Perfis alcançáveis em até `profundidade` passos que id_perfil ainda não
+    segue, ordenados por conexões em comum (quantos dos perfis seguidos
+    seguem o candidato), depois pela distância.
+    Cada item: {"id_perfil", "em_comum", "distancia"}.
+    """
+    if not isinstance(profundidade, int) or profundidade < 2 or not isinstance(n, int) or n <= 0:
+        return DADOS_INVALIDOS, []
+    _garantir()
+    if not any(p.get("id") == id_perfil for p in perfis):
+        return NAO_ENCONTRADO, []
+
+    seguidos = _vizinhos(id_perfil, False)
+    distancia = {id_perfil: 0}
+    fila = deque([id_perfil])
+    em_comum: Dict[int, int] = {}
+    while fila:
+        atual = fila.popleft()
+        if distancia[atual] == profundidade:
+            continue
+        for vizinho in _vizinhos(atual, False):
+            if distancia[atual] == 1 and vizinho != id_perfil and vizinho not in seguidos:
+                em_comum[vizinho] = em_comum.get(vizinho, 0) + 1
+            if vizinho not in distancia:
+                distancia[vizinho] = distancia[atual] + 1
+                fila.append(vizinho)
+
+    candidatos = [c for c, d in distancia.items() if d >= 2]
+    melhores = heapq.nsmallest(n, candidatos, key=lambda c: (-em_comum.get(c, 0), distancia[c], c))
+    return OK, [{"id_perfil": c, "em_comum": em_comum.get(c, 0), "distancia": distancia[c]} for c in melhores]
+
+@consulta_indice
+def Mais_Seguidos(n: int = 10) -> Tuple[int, List[Dict[str, int]]]:
+    """Ranking por número de seguidores: [{"id_perfil", "seguidores"}]."""
+    if not isinstance(n, int) or n <= 0:
+        return DADOS_INVALIDOS, []
+    _garantir()
+    melhores = heapq.nsmallest(n, _grau_entrada.items(), key=lambda par: (-par[1], par[0]))
+    return OK, [{"id_perfil": id_p, "seguidores": grau} for id_p, grau in melhores]
@@ -1,12 +1,136 @@
 # controles/jogo_controler.py
-from typing import Dict, List, Optional, Tuple, Any
+import bisect
+import csv
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Any, Iterable, Iterator, Union
 from utils.codigos import OK, DADOS_INVALIDOS, CONFLITO, NAO_ENCONTRADO
-from dados.database import jogos, salvar_jogos, perfis, salvar_perfis, avaliacoes, salvar_avaliacoes
+from utils import travas
+from utils.travas import protegido, sob_indices
+from utils import versoes
+from dados.database import jogos, salvar_jogos, perfis, salvar_perfis, avaliacoes, salvar_avaliacoes, geracoes, instantaneo
+from controles import eventos
+from utils.texto import remover_acentos
+from utils import paginacao
 
 __all__ = [
-    "Cadastrar_Jogo", "Listar_Jogo", "Busca_Jogo", "Atualizar_Jogo", "Remover_Jogo"
+    "Cadastrar_Jogo", "Listar_Jogo", "Busca_Jogo", "Atualizar_Jogo", "Remover_Jogo",
+    "Pesquisar_Jogo", "Estatisticas_Cache_Busca", "Filtrar_Jogos", "Importar_Jogos",
+    "Listar_Jogo_paginado", "Busca_Jogos", "Listar_Jogo_instantaneo"
 ]
 
+# Ordenações aceitas na listagem paginada (nota_geral: maior primeiro)
+ORDENACOES_JOGO = {
+    "id": lambda j: (j.get("id", 0),),
+    "titulo": lambda j: ((j.get("titulo") or "").lower(), j.get("id", 0)),
+    "nota_geral": lambda j: (-float(j.get("nota_geral", 0.0)), j.get("id", 0)),
+}
+
+# Capacidade máxima do cache LRU de resultados da busca por título
+TAMANHO_CACHE_BUSCA = 128
+
+# Geração do catálogo: incrementada por Cadastrar/Atualizar/Remover_Jogo.
+# Resultados de busca só são reaproveitados enquanto a geração não muda.
+_geracao_catalogo = 0
+# Trava-folha da checagem de título único em Atualizar_Jogo (que roda só
+# com leitura de "jogos"); nenhuma outra trava é tomada enquanto ela está presa
+_trava_titulos = threading.Lock()
+# Trava-folha do cache LRU: Pesquisar_Jogo roda só com leitura de `indices`
+_trava_cache_busca = threading.Lock()
+_cache_busca: "OrderedDict[Tuple[str, Optional[int]], List[Dict[str, Any]]]" = OrderedDict()
+_cache_geracao = 0
+_cache_contadores = {"hits": 0, "misses": 0}
+
+@sob_indices
+def _incrementar_geracao() -> None:
+    global _geracao_catalogo
+    _geracao_catalogo += 1
+
+# Índices de facetas (construídos na primeira consulta a Filtrar_Jogos):
+#   _postings_genero: gênero normalizado -> ids dos jogos
+#   _indice_notas:    lista ordenada de (nota_geral, id)
+_facetas_construidas = False
+_postings_genero: Dict[str, set] = {}
+_nome_genero: Dict[str, str] = {}
+_indice_notas: List[Tuple[float, int]] = []
+_entrada_facetas: Dict[int, Tuple[str, float]] = {}
+_jogos_por_id: Dict[int, Dict[str, Any]] = {}
+
+def _chave_genero(genero: str) -> str:
+    return remover_acentos((genero or "").strip().lower())
+
+def _descartar_facetas() -> None:
+    global _facetas_construidas
+    _postings_genero.clear()
+    _nome_genero.clear()
+    _indice_notas.clear()
+    _entrada_facetas.clear()
+    _jogos_por_id.clear()
+    _facetas_construidas = False
+
+def _retirar_facetas(id_jogo: int) -> None:
+    entrada = _entrada_facetas.pop(id_jogo, None)
+    _jogos_por_id.pop(id_jogo, None)
+    if entrada is None:
+        return
+    chave, nota = entrada
+    ids = _postings_genero.get(chave)
+    if ids is not None:
+        ids.discard(id_jogo)
+        if not ids:
+            del _postings_genero[chave]
+            _nome_genero.pop(chave, None)
+    pos = bisect.bisect_left(_indice_notas, (nota, id_jogo))
+    if pos < len(_indice_notas) and _indice_notas[pos] == (nota, id_jogo):
+        del _indice_notas[pos]
+
+def _adicionar_facetas(jogo: Dict[str, Any], em_ordem: bool = True) -> None:
+    """em_ordem=False só anexa a nota: quem chama reordena _indice_notas no fim."""
+    id_jogo = jogo["id"]
+    chave = _chave_genero(jogo.get("genero", ""))
+    nota = float(jogo.get("nota_geral", 0.0))
+    _postings_genero.setdefault(chave, set()).add(id_jogo)
+    _nome_genero.setdefault(chave, (jogo.get("genero") or "").strip())
+    if em_ordem:
+        bisect.insort(_indice_notas, (nota, id_jogo))
+    else:
+        _indice_notas.append((nota, id_jogo))
+    _entrada_facetas[id_jogo] = (chave, nota)
+    _jogos_por_id[id_jogo] = jogo
+
+def _construir_facetas() -> None:
+    global _facetas_construidas
+    _descartar_facetas()
+    for j in jogos:
+        _adicionar_facetas(j, em_ordem=False)
+    _indice_notas.sort()
+    _facetas_construidas = True
+
+@sob_indices
+def _indexar_facetas(jogo: Dict[str, Any]) -> None:
+    """Reflete gênero/nota atuais do jogo nos índices. Sem efeito se ainda não construídos."""
+    if not _facetas_construidas:
+        return
+    _retirar_facetas(jogo["id"])
+    _adicionar_facetas(jogo)
+
+@sob_indices
+def _indexar_facetas_em_lote(novos: List[Dict[str, Any]]) -> None:
+    """Jogos recém-cadastrados (ainda fora dos índices): anexa todos e ordena uma vez."""
+    if not _facetas_construidas or not novos:
+        return
+    for jogo in novos:
+        _adicionar_facetas(jogo, em_ordem=False)
+    _indice_notas.sort()
+
+@sob_indices
+def _desindexar_facetas(id_jogo: int) -> None:
+    if not _facetas_construidas:
+        return
+    _retirar_facetas(id_jogo)
+
 def _encontrar_por_id(id_jogo: int) -> Optional[Dict[str, Any]]:
     return next((j for j in jogos if j.get("id") == id_jogo), None)
 
@@ -22,6 +146,37 @@ def _titulo_ja_existe(titulo: str, ignorar_id: Optional[int] = None) -> bool:
 def _validar_campos_obrigatorios(titulo: Optional[str], genero: Optional[str]) -> bool:
     return bool(titulo and titulo.strip()) and bool(genero and genero.strip())
 
+def _normalizar(texto: str) -> str:
+    return ' '.join(''.join(ch for ch in texto.lower() if ch.isalnum() or ch.isspace()).split())
+
+def _e_subsequencia(consulta: str, texto: str) -> bool:
+    it = iter(texto)
+    return all(ch in it for ch in consulta)
+
+def _pontuar_titulos(consulta: str) -> List[Dict[str, Any]]:
+    """Busca inteligente por título (substring, iniciais, prefixo de palavra, subsequência)."""
+    resultados = []
+    for j in jogos:
+        norm = _normalizar(j.get("titulo", ""))
+        palavras = norm.split()
+        pontos = 0
+        if consulta in norm:
+            pontos += 100
+        iniciais = ''.join(w[0] for w in palavras if w)
+        if consulta in iniciais:
+            pontos += 90
+        if any(w.startswith(consulta) for w in palavras):
+            pontos += 70
+        if _e_subsequencia(consulta.replace(' ', ''), norm.replace(' ', '')):
+            pontos += 50
+        if len(consulta) <= 2 and norm.startswith(consulta):
+            pontos += 20
+        if pontos > 0:
+            resultados.append((pontos, j))
+    resultados.sort(key=lambda r: (-r[0], r[1].get("titulo", "")))
+    return [r[1] for r in resultados]
+
+@protegido(escrita=("jogos",))
 def Cadastrar_Jogo(titulo: str, descricao: Optional[str], genero: str, nota_geral: Optional[float]) -> Tuple[int, Optional[Dict[str, Any]]]:
     if not _validar_campos_obrigatorios(titulo, genero):
         return DADOS_INVALIDOS, None
@@ -37,22 +192,58 @@ def Cadastrar_Jogo(titulo: str, descricao: Optional[str], genero: str, nota_gera
         "titulo": titulo.strip(),
         "descricao": (descricao or "").strip(),
         "genero": genero.strip(),
-        "nota_geral": 0.0 
+        "nota_geral": 0.0,
+        "versao": versoes.VERSAO_INICIAL
     }
     jogos.append(jogo)
+    _indexar_facetas(jogo)
+    eventos.jogo_cadastrado(jogo)
+    _incrementar_geracao()
     salvar_jogos()
     return OK, jogo
 
+@protegido(leitura=("jogos",))
 def Listar_Jogo() -> Tuple[int, List[Dict[str, Any]]]:
     return OK, jogos
 
+def Listar_Jogo_instantaneo() -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Catálogo como no último salvamento, sem travas: os registros são
+    somente leitura (RegistroCongelado) e podem estar uma gravação atrás
+    de Listar_Jogo/Busca_Jogo.
+    """
+    return OK, list(instantaneo("jogos").registros)
+
+@protegido(leitura=("jogos",), usa_indices=True, le_indices=True)
+def Listar_Jogo_paginado(tamanho_pagina: int, cursor: Optional[str] = None, ordenar_por: str = "id") -> Tuple[int, Dict[str, Any]]:
+    """
+    Lista o catálogo uma página por vez.
+    Retorna {"itens": [...], "proximo_cursor": str | None}; passe o cursor
+    recebido para obter a página seguinte.
+    """
+    return paginacao.paginar("jogos", jogos, ORDENACOES_JOGO, geracoes["jogos"], tamanho_pagina, cursor, ordenar_por)
+
+@protegido(leitura=("jogos",))
 def Busca_Jogo(id_jogo: int) -> Tuple[int, Optional[Dict[str, Any]]]:
     jogo = _encontrar_por_id(id_jogo)
     if jogo is None:
         return NAO_ENCONTRADO, None
     return OK, jogo
 
-def Atualizar_Jogo(id_jogo: int, titulo: str, descricao: Optional[str], genero: str, nota_geral: Optional[float]) -> Tuple[int, Optional[Dict[str, Any]]]:
+@protegido(leitura=("jogos",))
+def Busca_Jogos(ids_jogos: Iterable[int]) -> Tuple[int, Dict[int, Dict[str, Any]]]:
+    """Resolve vários ids em uma única passada. Ids inexistentes ficam fora do dicionário."""
+    procurados = set(ids_jogos)
+    if not procurados:
+        return OK, {}
+    return OK, {j["id"]: j for j in jogos if j.get("id") in procurados}
+
+@protegido(leitura=("jogos",), entidades=lambda id_jogo, *args, **kwargs: (id_jogo,), colecao_entidades="jogos")
+def Atualizar_Jogo(id_jogo: int, titulo: str, descricao: Optional[str], genero: str, nota_geral: Optional[float], versao: Optional[int] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Com `versao`, só atualiza se o jogo ainda estiver nessa versão
+    (senão CONFLITO). Atualizações de jogos diferentes não se bloqueiam.
+    """
     jogo = _encontrar_por_id(id_jogo)
     if jogo is None:
         return NAO_ENCONTRADO, None
@@ -60,17 +251,27 @@ def Atualizar_Jogo(id_jogo: int, titulo: str, descricao: Optional[str], genero:
     if not _validar_campos_obrigatorios(titulo, genero):
         return DADOS_INVALIDOS, None
 
-    if _titulo_ja_existe(titulo, ignorar_id=id_jogo):
+    if not versoes.confere(jogo, versao):
         return CONFLITO, None
 
-    jogo["titulo"] = titulo.strip()
+    # Checagem de título único e escrita juntas, para dois renomes
+    # simultâneos não escolherem o mesmo título
+    with _trava_titulos:
+        if _titulo_ja_existe(titulo, ignorar_id=id_jogo):
+            return CONFLITO, None
+        jogo["titulo"] = titulo.strip()
     jogo["descricao"] = (descricao or "").strip()
     jogo["genero"] = genero.strip()
     # Nota geral NÃO é alterada manualmente aqui
+    versoes.avancar(jogo)
     
+    _indexar_facetas(jogo)
+    eventos.jogo_atualizado(jogo)
+    _incrementar_geracao()
     salvar_jogos()
     return OK, jogo
 
+@protegido(escrita=("perfis", "jogos", "avaliacoes"))
 def Remover_Jogo(id_jogo: int) -> Tuple[int, Optional[None]]:
     jogo = _encontrar_por_id(id_jogo)
     if jogo is None:
@@ -78,10 +279,12 @@ def Remover_Jogo(id_jogo: int) -> Tuple[int, Optional[None]]:
 
     # 1. Remover avaliações deste jogo (Cascata)
     global avaliacoes
-    tamanho_inicial = len(avaliacoes)
+    removidas = [a for a in avaliacoes if a.get("id_jogo") == id_jogo]
     avaliacoes[:] = [a for a in avaliacoes if a.get("id_jogo") != id_jogo]
     
-    if len(avaliacoes) != tamanho_inicial:
+    if removidas:
+        for a in removidas:
+            eventos.avaliacao_removida(a)
         salvar_avaliacoes()
 
     # 2. Remover referências nos perfis (Biblioteca e Favoritos)
@@ -117,5 +320,202 @@ def Remover_Jogo(id_jogo: int) -> Tuple[int, Optional[None]]:
         salvar_perfis()
     
     jogos.remove(jogo)
+    _desindexar_facetas(id_jogo)
+    travas.descartar_entidade("jogos", id_jogo)
+    eventos.jogo_removido(id_jogo)
+    _incrementar_geracao()
     salvar_jogos()
-    return OK, None
\ No newline at end of file
+    return OK, None
+
+def _linhas_importacao(origem: Iterable[str], formato: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """
+    Gera (numero_da_linha, registro) lendo a origem sob demanda; registro
+    None = linha ilegível. Bytes inválidos ou CSV malformado encerram a
+    leitura (o resto da origem não é confiável) com um último registro None.
+    """
+    if formato == "csv":
+        leitor = csv.DictReader(origem)
+        try:
+            for registro in leitor:
+                yield leitor.line_num, registro
+        except UnicodeDecodeError:
+            yield leitor.line_num + 1, None
+        except csv.Error:
+            yield leitor.line_num, None
+        return
+    numero = 0
+    try:
+        for numero, linha in enumerate(origem, start=1):
+            if not linha.strip():
+                continue
+            try:
+                registro = json.loads(linha)
+            except json.JSONDecodeError:
+                registro = None
+            yield numero, registro if isinstance(registro, dict) else None
+    except UnicodeDecodeError:
+        yield numero + 1, None
+
+@protegido(escrita=("jogos",))
+def Importar_Jogos(origem: Union[str, Iterable[str]], formato: Optional[str] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Importação em lote do catálogo a partir de CSV (cabeçalho titulo,genero,descricao)
+    ou JSONL (um objeto por linha). `origem` é um caminho ou um iterável de linhas.
+    Aplica as mesmas regras de Cadastrar_Jogo, mas com deduplicação por conjunto
+    de títulos e uma única gravação ao final.
+    Retorna {"importados": [jogos], "erros": [(linha, codigo)]}.
+    """
+    if formato is None and isinstance(origem, str):
+        formato = os.path.splitext(origem)[1].lstrip(".")
+    formato = (formato or "").lower()
+    if formato not in ("csv", "jsonl"):
+        return DADOS_INVALIDOS, None
+
+    arquivo = None
+    if isinstance(origem, str):
+        try:
+            arquivo = open(origem, "r", encoding="utf-8", newline="")
+        except OSError:
+            return NAO_ENCONTRADO, None
+        origem = arquivo
+
+    titulos = {(j.get("titulo") or "").strip().lower() for j in jogos}
+    proximo_id = max((j.get("id", 0) for j in jogos), default=0) + 1
+    importados = []
+    erros = []
+    try:
+        for numero, registro in _linhas_importacao(origem, formato):
+            if registro is None:
+                erros.append((numero, DADOS_INVALIDOS))
+                continue
+            titulo = registro.get("titulo")
+            genero = registro.get("genero")
+            if not isinstance(titulo, str) or not isinstance(genero, str) or not _validar_campos_obrigatorios(titulo, genero):
+                erros.append((numero, DADOS_INVALIDOS))
+                continue
+            chave = titulo.strip().lower()
+            if chave in titulos:
+                erros.append((numero, CONFLITO))
+                continue
+            titulos.add(chave)
+            jogo = {
+                "id": proximo_id,
+                "titulo": titulo.strip(),
+                "descricao": str(registro.get("descricao") or "").strip(),
+                "genero": genero.strip(),
+                "nota_geral": 0.0,
+                "versao": versoes.VERSAO_INICIAL
+            }
+            proximo_id += 1
+            jogos.append(jogo)
+            eventos.jogo_cadastrado(jogo)
+            importados.append(jogo)
+    finally:
+        if arquivo is not None:
+            arquivo.close()
+        # o que já entrou em `jogos` é indexado (uma ordenação só) e
+        # publicado mesmo que a leitura tenha sido interrompida
+        if importados:
+            _indexar_facetas_em_lote(importados)
+            _incrementar_geracao()
+            salvar_jogos()
+    return OK, {"importados": importados, "erros": erros}
+
+@protegido(leitura=("jogos",), usa_indices=True, le_indices=True)
+def Pesquisar_Jogo(termo: str, limite: Optional[int] = None) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Busca jogos por título, ordenados por relevância.
+    Resultados ficam em um cache LRU indexado por (consulta normalizada, limite),
+    invalidado sempre que a geração do catálogo muda.
+    """
+    global _cache_geracao
+    consulta = _normalizar(termo or "")
+    if not consulta or (limite is not None and limite <= 0):
+        return DADOS_INVALIDOS, []
+
+    # Só leitura de `indices` (a geração não muda durante a consulta); o
+    # LRU, alterado por leitores em paralelo, fica sob a trava-folha própria
+    chave = (consulta, limite)
+    with _trava_cache_busca:
+        if _cache_geracao != _geracao_catalogo:
+            _cache_busca.clear()
+            _cache_geracao = _geracao_catalogo
+        resultado = _cache_busca.get(chave)
+        if resultado is not None:
+            _cache_busca.move_to_end(chave)
+            _cache_contadores["hits"] += 1
+            return OK, list(resultado)
+        _cache_contadores["misses"] += 1
+
+    resultado = _pontuar_titulos(consulta)[:limite]
+    with _trava_cache_busca:
+        _cache_busca[chave] = resultado
+        if len(_cache_busca) > TAMANHO_CACHE_BUSCA:
+            _cache_busca.popitem(last=False)
+    return OK, list(resultado)
+
+@protegido(leitura=("jogos",), usa_indices=True)
+def Filtrar_Jogos(generos: Optional[List[str]] = None, nota_min: Optional[float] = None, nota_max: Optional[float] = None, limite: Optional[int] = None) -> Tuple[int, Dict[str, Any]]:
+    """
+    Consulta facetada do catálogo por gênero(s) e faixa de nota_geral.
+    Retorna {"jogos": [...], "total": n, "facetas": {genero: quantidade}},
+    com jogos ordenados por nota (maior primeiro). As contagens por gênero
+    consideram apenas o filtro de nota, para orientar o refinamento.
+    """
+    if limite is not None and limite <= 0:
+        return DADOS_INVALIDOS, {}
+    try:
+        nota_min = None if nota_min is None else float(nota_min)
+        nota_max = None if nota_max is None else float(nota_max)
+    except (ValueError, TypeError):
+        return DADOS_INVALIDOS, {}
+    if nota_min is not None and nota_max is not None and nota_min > nota_max:
+        return DADOS_INVALIDOS, {}
+
+    if not _facetas_construidas:
+        _construir_facetas()
+
+    # Fatia do índice de notas dentro da faixa (busca binária)
+    ini = 0 if nota_min is None else bisect.bisect_left(_indice_notas, (nota_min, float("-inf")))
+    fim = len(_indice_notas) if nota_max is None else bisect.bisect_right(_indice_notas, (nota_max, float("inf")))
+    faixa = _indice_notas[ini:fim]
+    faixa_total = ini == 0 and fim == len(_indice_notas)
+
+    if faixa_total:
+        facetas = {_nome_genero[g]: len(ids) for g, ids in _postings_genero.items()}
+    else:
+        ids_faixa = {id_j for _, id_j in faixa}
+        facetas = {_nome_genero[g]: len(ids & ids_faixa) for g, ids in _postings_genero.items()}
+        facetas = {g: n for g, n in facetas.items() if n}
+
+    if generos:
+        selecionados = set()
+        for g in generos:
+            selecionados |= _postings_genero.get(_chave_genero(g), set())
+        if len(selecionados) < len(faixa):
+            # Percorre o lado menor: os jogos dos gêneros pedidos
+            entradas = [(_entrada_facetas[i][1], i) for i in selecionados]
+            if nota_min is not None:
+                entradas = [e for e in entradas if e[0] >= nota_min]
+            if nota_max is not None:
+                entradas = [e for e in entradas if e[0] <= nota_max]
+            entradas.sort()
+        else:
+            entradas = [e for e in faixa if e[1] in selecionados]
+    else:
+        entradas = faixa
+
+    total = len(entradas)
+    entradas = entradas[::-1] if limite is None else entradas[:-limite - 1:-1]
+    resultado = [_jogos_por_id[id_j] for _, id_j in entradas]
+    return OK, {"jogos": resultado, "total": total, "facetas": facetas}
+
+@sob_indices
+def Estatisticas_Cache_Busca() -> Tuple[int, Dict[str, int]]:
+    """Retorna contadores de acerto/falha e ocupação do cache de busca."""
+    return OK, {
+        "hits": _cache_contadores["hits"],
+        "misses": _cache_contadores["misses"],
+        "tamanho": len(_cache_busca),
+        "geracao": _geracao_catalogo,
+    }
\ No newline at end of file
@@ -3,22 +3,40 @@
 Lógica de perfis: criação, busca, atualização e desativação.
 Gerencia dados do usuário e garante integridade referencial.
 """
-from typing import Tuple, Optional, Dict, Any, List
+import threading
+from typing import Tuple, Optional, Dict, Any, List, Iterable
 # Importa módulos relacionados para limpeza e delegação
 from controles import avaliacao_controler
 from controles import seguidores_controler as seguidores_ctrl
+from controles import similaridade_controler
+from controles import eventos
 
 # Importa avaliacoes/salvar para limpeza direta ao deletar perfil
-from dados.database import perfis, salvar_perfis, avaliacoes, salvar_avaliacoes
+from dados.database import perfis, salvar_perfis, avaliacoes, salvar_avaliacoes, geracoes
 from utils.codigos import OK, DADOS_INVALIDOS, CONFLITO, NAO_ENCONTRADO
+from utils import travas
+from utils.travas import protegido
+from utils import versoes
+from utils import paginacao
 
 __all__ = [
-    "Criar_Perfil", "Listar_Perfil", "Busca_Perfil", "Busca_Perfil_por_nome",
+    "Criar_Perfil", "Listar_Perfil", "Listar_Perfil_paginado", "Busca_Perfil", "Busca_Perfis", "Busca_Perfil_por_nome",
     "Atualizar_Dados", "Atualizar_Perfil", "Desativar_Conta", "Remover_Perfil",
     "Adicionar_Avaliacao", "Avaliar_Jogo", "Remover_Avaliacao", 
-    "Seguir_Perfil", "Parar_de_Seguir", "Listar_Seguidores", "Listar_Seguindo"
+    "Seguir_Perfil", "Parar_de_Seguir", "Listar_Seguidores", "Listar_Seguindo",
+    "Seguir_Perfis_em_lote", "Parar_de_Seguir_em_lote", "Perfis_Similares"
 ]
 
+# Trava-folha da checagem de nome único em Atualizar_Dados (que roda só com
+# leitura de "perfis"); nenhuma outra trava é tomada enquanto ela está presa
+_trava_nomes = threading.Lock()
+
+# Ordenações aceitas na listagem paginada
+ORDENACOES_PERFIL = {
+    "id": lambda p: (p.get("id", 0),),
+    "nome": lambda p: (_nome_do_perfil(p).lower(), p.get("id", 0)),
+}
+
 def _proximo_id(perfis_list: List[Dict[str, Any]]) -> int:
     return max((p.get("id", 0) for p in perfis_list), default=0) + 1
 
@@ -53,31 +71,51 @@ def _criar_estrutura_perfil(id_val: int, nome: str, descricao: Optional[str], av
         "jogados": 0,
         "platinados": 0,
         "favoritos": [],
-        "biblioteca": []
+        "biblioteca": [],
+        "versao": versoes.VERSAO_INICIAL
     }
 
-def Criar_Perfil(nome: str, descricao: Optional[str] = None, avatar: Optional[str] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+@protegido(escrita=("perfis",))
+def Criar_Perfil(nome: str, descricao: Optional[str] = None, avatar: Optional[str] = None, id_perfil: Optional[int] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """`id_perfil` impõe o id (usado pelo motor fragmentado, que aloca ids globais)."""
     if not _validar_nome(nome):
         return DADOS_INVALIDOS, None
 
-    if _nome_ja_existe(nome):
+    if _nome_ja_existe(nome) or (id_perfil is not None and _encontrar_por_id(id_perfil)):
         return CONFLITO, None
 
-    novo_id = _proximo_id(perfis)
+    novo_id = _proximo_id(perfis) if id_perfil is None else id_perfil
     novo_perfil = _criar_estrutura_perfil(novo_id, nome, descricao, avatar)
     perfis.append(novo_perfil)
+    eventos.perfil_criado(novo_perfil)
     salvar_perfis()
     return OK, novo_perfil
 
+@protegido(leitura=("perfis",))
 def Listar_Perfil() -> Tuple[int, List[Dict[str, Any]]]:
     return OK, perfis
 
+@protegido(leitura=("perfis",), usa_indices=True, le_indices=True)
+def Listar_Perfil_paginado(tamanho_pagina: int, cursor: Optional[str] = None, ordenar_por: str = "id") -> Tuple[int, Dict[str, Any]]:
+    """Lista perfis uma página por vez (ver jogo_controler.Listar_Jogo_paginado)."""
+    return paginacao.paginar("perfis", perfis, ORDENACOES_PERFIL, geracoes["perfis"], tamanho_pagina, cursor, ordenar_por)
+
+@protegido(leitura=("perfis",))
 def Busca_Perfil(id_perfil: int) -> Tuple[int, Optional[Dict[str, Any]]]:
     perfil = _encontrar_por_id(id_perfil)
     if perfil is None:
         return NAO_ENCONTRADO, None
     return OK, perfil
 
+@protegido(leitura=("perfis",))
+def Busca_Perfis(ids_perfis: Iterable[int]) -> Tuple[int, Dict[int, Dict[str, Any]]]:
+    """Resolve vários ids em uma única passada. Ids inexistentes ficam fora do dicionário."""
+    procurados = set(ids_perfis)
+    if not procurados:
+        return OK, {}
+    return OK, {p["id"]: p for p in perfis if p.get("id") in procurados}
+
+@protegido(leitura=("perfis",))
 def Busca_Perfil_por_nome(nome: str) -> Tuple[int, Optional[Dict[str, Any]]]:
     if not _validar_nome(nome):
         return DADOS_INVALIDOS, None
@@ -87,18 +125,28 @@ def Busca_Perfil_por_nome(nome: str) -> Tuple[int, Optional[Dict[str, Any]]]:
         return NAO_ENCONTRADO, None
     return OK, perfil
 
-def Atualizar_Dados(id_perfil: int, nome: Optional[str] = None, descricao: Optional[str] = None, avatar: Optional[str] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+@protegido(leitura=("perfis",), entidades=lambda id_perfil, *args, **kwargs: (id_perfil,))
+def Atualizar_Dados(id_perfil: int, nome: Optional[str] = None, descricao: Optional[str] = None, avatar: Optional[str] = None, versao: Optional[int] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Com `versao`, só atualiza se o perfil ainda estiver nessa versão
+    (senão CONFLITO). Atualizações de perfis diferentes não se bloqueiam.
+    """
     perfil = _encontrar_por_id(id_perfil)
     if perfil is None:
         return NAO_ENCONTRADO, None
 
+    if nome is not None and not _validar_nome(nome):
+        return DADOS_INVALIDOS, None
+
+    if not versoes.confere(perfil, versao):
+        return CONFLITO, None
+
     if nome is not None:
-        if not _validar_nome(nome):
-            return DADOS_INVALIDOS, None
-        if _nome_ja_existe(nome, ignorar_id=id_perfil):
-            return CONFLITO, None
-        perfil["nome_usuario"] = nome.strip()
-        perfil["nome"] = nome.strip()
+        with _trava_nomes:
+            if _nome_ja_existe(nome, ignorar_id=id_perfil):
+                return CONFLITO, None
+            perfil["nome_usuario"] = nome.strip()
+            perfil["nome"] = nome.strip()
 
     if descricao is not None:
         perfil["descricao"] = descricao.strip()
@@ -106,12 +154,14 @@ def Atualizar_Dados(id_perfil: int, nome: Optional[str] = None, descricao: Optio
     if avatar is not None:
         perfil["avatar"] = avatar.strip()
 
+    versoes.avancar(perfil)
     salvar_perfis()
     return OK, perfil
 
-def Atualizar_Perfil(id_perfil: int, nome: Optional[str] = None, descricao: Optional[str] = None, avatar: Optional[str] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
-    return Atualizar_Dados(id_perfil, nome, descricao, avatar)
+def Atualizar_Perfil(id_perfil: int, nome: Optional[str] = None, descricao: Optional[str] = None, avatar: Optional[str] = None, versao: Optional[int] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+    return Atualizar_Dados(id_perfil, nome, descricao, avatar, versao)
 
+@protegido(escrita=("perfis", "jogos", "avaliacoes"))
 def Desativar_Conta(id_perfil: int) -> Tuple[int, Optional[None]]:
     """Desativa perfil, remove referências de seguidores e AVALIAÇÕES feitas pelo usuário."""
     perfil = _encontrar_por_id(id_perfil)
@@ -149,6 +199,8 @@ def Desativar_Conta(id_perfil: int) -> Tuple[int, Optional[None]]:
 
     # 3. Remover o perfil
     perfis.remove(perfil)
+    travas.descartar_entidade("perfis", id_perfil)
+    eventos.perfil_removido(id_perfil)
     salvar_perfis()
     return OK, None
 
@@ -162,12 +214,22 @@ def Seguir_Perfil(id_seguidor: int, id_alvo: int):
 def Parar_de_Seguir(id_seguidor: int, id_alvo: int):
     return seguidores_ctrl.Parar_de_Seguir(id_seguidor, id_alvo)
 
+def Seguir_Perfis_em_lote(id_seguidor: int, ids_alvo):
+    return seguidores_ctrl.Seguir_Perfis_em_lote(id_seguidor, ids_alvo)
+
+def Parar_de_Seguir_em_lote(id_seguidor: int, ids_alvo):
+    return seguidores_ctrl.Parar_de_Seguir_em_lote(id_seguidor, ids_alvo)
+
 def Listar_Seguidores(id_perfil: int):
     return seguidores_ctrl.Listar_Seguidores(id_perfil)
 
 def Listar_Seguindo(id_perfil: int):
     return seguidores_ctrl.Listar_Seguindo(id_perfil)
 
+def Perfis_Similares(id_perfil: int, k: int = 10) -> Tuple[int, List[Dict[str, Any]]]:
+    """Perfis com notas mais parecidas (cosseno entre vetores de notas)."""
+    return similaridade_controler.Perfis_Similares(id_perfil, k)
+
 # --- WRAPPERS DE AVALIAÇÃO (Correção de Assinatura) ---
 def Avaliar_Jogo(id_perfil: int, id_jogo: int, nota: float, opiniao: Optional[str] = "") -> Tuple[int, Optional[Dict[str, Any]]]:
     """
@@ -0,0 +1,165 @@
+# controles/ranking_controler.py
+"""
+Rankings de jogos pela nota ponderada (bayesiana, estilo IMDb):
+
+    NP = (soma_das_notas + m * C) / (quantidade + m)
+
+onde m = MINIMO_VOTOS e C é a média global de todas as avaliações.
+Um jogo com poucas avaliações fica próximo de C até acumular votos.
+
+O ranking geral e o de cada gênero são listas materializadas, mantidas
+ordenadas por (-NP, id) e atualizadas a cada avaliação, de modo que o
+top-N é apenas uma fatia. C é fixado na construção e só provoca uma
+reordenação completa quando a média global se afasta mais que
+TOLERANCIA_MEDIA do valor usado.
+"""
+import bisect
+from typing import Tuple, Optional, Dict, Any, List
+
+from dados.database import avaliacoes, jogos
+from utils.codigos import OK, DADOS_INVALIDOS
+from utils.travas import consulta_indice
+from utils.texto import remover_acentos
+
+__all__ = ["Top_Jogos"]
+
+MINIMO_VOTOS = 5
+TOLERANCIA_MEDIA = 0.05
+
+_construido = False
+_contagem: Dict[int, int] = {}
+_soma: Dict[int, float] = {}
+_total = {"votos": 0, "soma": 0.0}
+_media_ref = 0.0
+_chave: Dict[int, Tuple[float, int]] = {}
+_genero: Dict[int, str] = {}
+_jogos_por_id: Dict[int, Dict[str, Any]] = {}
+_geral: List[Tuple[float, int]] = []
+_por_genero: Dict[str, List[Tuple[float, int]]] = {}
+
+def _chave_genero(genero: str) -> str:
+    return remover_acentos((genero or "").strip().lower())
+
+def _descartar() -> None:
+    global _construido, _media_ref
+    for estrutura in (_contagem, _soma, _chave, _genero, _jogos_por_id, _por_genero):
+        estrutura.clear()
+    _geral.clear()
+    _total["votos"] = 0
+    _total["soma"] = 0.0
+    _media_ref = 0.0
+    _construido = False
+
+def _nota_ponderada(id_jogo: int) -> float:
+    m = MINIMO_VOTOS
+    return (_soma[id_jogo] + m * _media_ref) / (_contagem[id_jogo] + m)
+
+def _media_global() -> float:
+    return _total["soma"] / _total["votos"] if _total["votos"] else 0.0
+
+def _retirar_das_listas(id_jogo: int) -> None:
+    chave = _chave.pop(id_jogo, None)
+    if chave is None:
+        return
+    for lista in (_geral, _por_genero.get(_genero.get(id_jogo), [])):
+        pos = bisect.bisect_left(lista, chave)
+        if pos < len(lista) and lista[pos] == chave:
+            del lista[pos]
+
+def _inserir_nas_listas(id_jogo: int) -> None:
+    chave = (-_nota_ponderada(id_jogo), id_jogo)
+    _chave[id_jogo] = chave
+    bisect.insort(_geral, chave)
+    bisect.insort(_por_genero.setdefault(_genero[id_jogo], []), chave)
+
+def _reordenar() -> None:
+    """Recalcula todas as notas ponderadas com a média global atual."""
+    global _media_ref
+    _media_ref = _media_global()
+    _chave.clear()
+    _geral.clear()
+    _por_genero.clear()
+    for id_jogo in _contagem:
+        if id_jogo in _genero:
+            chave = (-_nota_ponderada(id_jogo), id_jogo)
+            _chave[id_jogo] = chave
+            _geral.append(chave)
+            _por_genero.setdefault(_genero[id_jogo], []).append(chave)
+    _geral.sort()
+    for lista in _por_genero.values():
+        lista.sort()
+
+def _construir() -> None:
+    global _construido
+    _descartar()
+    for j in jogos:
+        _jogos_por_id[j["id"]] = j
+    for a in avaliacoes:
+        id_jogo = a.get("id_jogo")
+        _contagem[id_jogo] = _contagem.get(id_jogo, 0) + 1
+        _soma[id_jogo] = _soma.get(id_jogo, 0.0) + float(a.get("score", 0.0))
+        _total["votos"] += 1
+        _total["soma"] += float(a.get("score", 0.0))
+    for id_jogo in _contagem:
+        jogo = _jogos_por_id.get(id_jogo)
+        if jogo is not None:
+            _genero[id_jogo] = _chave_genero(jogo.get("genero", ""))
+    _reordenar()
+    _construido = True
+
+def _atualizar(id_jogo: int, delta_votos: int, delta_soma: float) -> None:
+    _retirar_das_listas(id_jogo)
+    _contagem[id_jogo] = _contagem.get(id_jogo, 0) + delta_votos
+    _soma[id_jogo] = _soma.get(id_jogo, 0.0) + delta_soma
+    _total["votos"] += delta_votos
+    _total["soma"] += delta_soma
+    if _contagem[id_jogo] <= 0:
+        for estrutura in (_contagem, _soma, _genero, _jogos_por_id):
+            estrutura.pop(id_jogo, None)
+    elif id_jogo not in _genero:
+        jogo = next((j for j in jogos if j.get("id") == id_jogo), None)
+        if jogo is not None:
+            _jogos_por_id[id_jogo] = jogo
+            _genero[id_jogo] = _chave_genero(jogo.get("genero", ""))
+
+    if abs(_media_global() - _media_ref) > TOLERANCIA_MEDIA:
+        _reordenar()
+    elif id_jogo in _genero:
+        _inserir_nas_listas(id_jogo)
+
+# --- GANCHOS ---
+
+def _registrar_nota(id_jogo: int, score: float) -> None:
+    if _construido:
+        _atualizar(id_jogo, 1, float(score))
+
+def _retirar_nota(id_jogo: int, score: float) -> None:
+    if _construido and id_jogo in _contagem:
+        _atualizar(id_jogo, -1, -float(score))
+
+def _jogo_atualizado(jogo: Dict[str, Any]) -> None:
+    """Move o jogo para a lista do novo gênero, se o gênero mudou."""
+    id_jogo = jogo["id"]
+    if not _construido or id_jogo not in _genero:
+        return
+    novo = _chave_genero(jogo.get("genero", ""))
+    if novo != _genero[id_jogo]:
+        _retirar_das_listas(id_jogo)
+        _genero[id_jogo] = novo
+        _inserir_nas_listas(id_jogo)
+
+@consulta_indice
+def Top_Jogos(n: int = 10, genero: Optional[str] = None) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Os n jogos mais bem ranqueados (geral ou de um gênero).
+    Cada item: {"jogo", "nota_ponderada", "quantidade"}.
+    """
+    if not isinstance(n, int) or n <= 0:
+        return DADOS_INVALIDOS, []
+    if not _construido:
+        _construir()
+    lista = _geral if genero is None else _por_genero.get(_chave_genero(genero), [])
+    return OK, [
+        {"jogo": _jogos_por_id[id_jogo], "nota_ponderada": round(-negativo, 2), "quantidade": _contagem[id_jogo]}
+        for negativo, id_jogo in lista[:n]
+    ]
@@ -0,0 +1,229 @@
+# controles/recomendacao_controler.py
+"""
+Recomendações "porque você gostou de X" por filtragem colaborativa item-item.
+
+Cada perfil vira um vetor esparso jogo -> valor: a nota da avaliação, ou,
+na falta dela, uma nota implícita derivada de favoritos e biblioteca.
+Os vetores são centralizados pela média do perfil (cosseno ajustado) e
+acumulados em uma matriz esparsa de produtos internos entre jogos
+(X^T X, guardada como dicionário de dicionários). Para cada jogo ficam
+apenas os VIZINHOS_POR_JOGO mais similares; a recomendação de um perfil
+soma as similaridades dos vizinhos dos jogos de que ele gostou.
+
+Atualização incremental: alterações marcam o perfil como pendente; antes
+de servir, a contribuição antiga de cada perfil pendente é subtraída da
+matriz, a nova é somada e só os jogos envolvidos têm os vizinhos recalculados.
+Perfis e jogos são resolvidos por mapas id -> registro mantidos pelos
+avisos de criação/remoção, sem percorrer as coleções a cada consulta.
+"""
+import heapq
+import math
+from typing import Tuple, Dict, Any, List, Optional
+
+from dados.database import avaliacoes, perfis, jogos
+from utils.codigos import OK, NAO_ENCONTRADO, DADOS_INVALIDOS
+from utils.travas import consulta_indice
+
+__all__ = ["Recomendar_Jogos", "Jogos_Similares"]
+
+VIZINHOS_POR_JOGO = 20
+LIMIAR_GOSTOU = 7.0
+
+# Notas implícitas para jogos sem avaliação explícita
+NOTA_IMPLICITA = {"favorito": 10.0, "platinado": 9.0, "jogado": 8.0, "jogando": 7.0}
+
+_construido = False
+_notas_usuario: Dict[int, Dict[int, float]] = {}   # perfil -> {jogo: nota explícita}
+_brutos: Dict[int, Dict[int, float]] = {}          # perfil -> vetor usado na matriz
+_usuarios_do_jogo: Dict[int, set] = {}
+_produtos: Dict[int, Dict[int, float]] = {}        # jogo -> {jogo: produto interno}
+_normas: Dict[int, float] = {}                     # jogo -> soma dos quadrados
+_vizinhos: Dict[int, List[Tuple[int, float]]] = {}
+_pendentes: set = set()
+_perfis: Dict[int, Dict[str, Any]] = {}            # id -> perfil
+_catalogo: Dict[int, Dict[str, Any]] = {}          # id -> jogo
+
+def _descartar() -> None:
+    global _construido
+    for estrutura in (_notas_usuario, _brutos, _usuarios_do_jogo, _produtos, _normas, _vizinhos, _pendentes,
+                      _perfis, _catalogo):
+        estrutura.clear()
+    _construido = False
+
+def _vetor_bruto(id_perfil: int, perfil: Optional[Dict[str, Any]]) -> Dict[int, float]:
+    valores: Dict[int, float] = {}
+    if perfil is not None:
+        for e in perfil.get("biblioteca", []):
+            valores[e.get("id_jogo")] = NOTA_IMPLICITA.get(e.get("status"), NOTA_IMPLICITA["jogando"])
+        for id_jogo in perfil.get("favoritos", []):
+            valores[id_jogo] = max(valores.get(id_jogo, 0.0), NOTA_IMPLICITA["favorito"])
+    valores.update(_notas_usuario.get(id_perfil, {}))
+    return valores
+
+def _centralizar(bruto: Dict[int, float]) -> Dict[int, float]:
+    if len(bruto) < 2:
+        return {}
+    media = sum(bruto.values()) / len(bruto)
+    return {j: v - media for j, v in bruto.items() if abs(v - media) > 1e-12}
+
+def _acumular(centralizado: Dict[int, float], sinal: float) -> None:
+    """Soma (sinal=1) ou subtrai (sinal=-1) a contribuição de um perfil em X^T X."""
+    itens = list(centralizado.items())
+    for a, (i, vi) in enumerate(itens):
+        _normas[i] = _normas.get(i, 0.0) + sinal * vi * vi
+        linha_i = _produtos.setdefault(i, {})
+        for j, vj in itens[a + 1:]:
+            valor = linha_i.get(j, 0.0) + sinal * vi * vj
+            linha_j = _produtos.setdefault(j, {})
+            if abs(valor) < 1e-9:
+                linha_i.pop(j, None)
+                linha_j.pop(i, None)
+            else:
+                linha_i[j] = valor
+                linha_j[i] = valor
+
+def _recalcular_vizinhos(id_jogo: int) -> None:
+    norma_i = _normas.get(id_jogo, 0.0)
+    linha = _produtos.get(id_jogo, {})
+    if norma_i <= 1e-9 or not linha:
+        _vizinhos.pop(id_jogo, None)
+        return
+    candidatos = (
+        (j, p / math.sqrt(norma_i * _normas[j]))
+        for j, p in linha.items() if p > 0 and _normas.get(j, 0.0) > 1e-9
+    )
+    melhores = heapq.nlargest(VIZINHOS_POR_JOGO, candidatos, key=lambda par: (par[1], -par[0]))
+    if melhores:
+        _vizinhos[id_jogo] = melhores
+    else:
+        _vizinhos.pop(id_jogo, None)
+
+def _aplicar_perfil(id_perfil: int, perfil: Optional[Dict[str, Any]]) -> set:
+    """Troca o vetor do perfil na matriz; devolve os jogos afetados."""
+    antigo = _brutos.pop(id_perfil, {})
+    _acumular(_centralizar(antigo), -1.0)
+    for j in antigo:
+        usuarios = _usuarios_do_jogo.get(j)
+        if usuarios is not None:
+            usuarios.discard(id_perfil)
+    novo = _vetor_bruto(id_perfil, perfil)
+    if novo:
+        _brutos[id_perfil] = novo
+        _acumular(_centralizar(novo), 1.0)
+        for j in novo:
+            _usuarios_do_jogo.setdefault(j, set()).add(id_perfil)
+    return set(antigo) | set(novo)
+
+def _construir() -> None:
+    global _construido
+    _descartar()
+    for a in avaliacoes:
+        _notas_usuario.setdefault(a.get("id_perfil"), {})[a.get("id_jogo")] = float(a.get("score", 0.0))
+    _perfis.update((p.get("id"), p) for p in perfis)
+    _catalogo.update((j.get("id"), j) for j in jogos)
+    for id_perfil in set(_perfis) | set(_notas_usuario):
+        _aplicar_perfil(id_perfil, _perfis.get(id_perfil))
+    for id_jogo in list(_produtos):
+        _recalcular_vizinhos(id_jogo)
+    _construido = True
+
+def _atualizar_pendentes() -> None:
+    if not _pendentes:
+        return
+    afetados = set()
+    for id_perfil in _pendentes:
+        afetados |= _aplicar_perfil(id_perfil, _perfis.get(id_perfil))
+    _pendentes.clear()
+    for id_jogo in afetados:
+        _recalcular_vizinhos(id_jogo)
+
+def _garantir_atualizado() -> None:
+    if not _construido:
+        _construir()
+    else:
+        _atualizar_pendentes()
+
+# --- GANCHOS ---
+
+def _nota_alterada(id_perfil: int, id_jogo: int, score: Optional[float]) -> None:
+    """score None = avaliação removida."""
+    if not _construido:
+        return
+    notas = _notas_usuario.setdefault(id_perfil, {})
+    if score is None:
+        notas.pop(id_jogo, None)
+    else:
+        notas[id_jogo] = float(score)
+    _pendentes.add(id_perfil)
+
+def _perfil_alterado(id_perfil: int) -> None:
+    if _construido:
+        _pendentes.add(id_perfil)
+
+def _perfil_criado(perfil: Dict[str, Any]) -> None:
+    if _construido:
+        _perfis[perfil.get("id")] = perfil
+
+def _perfil_removido(id_perfil: int) -> None:
+    if _construido:
+        _perfis.pop(id_perfil, None)
+        _notas_usuario.pop(id_perfil, None)
+        _pendentes.add(id_perfil)
+
+def _jogo_cadastrado(jogo: Dict[str, Any]) -> None:
+    if _construido:
+        _catalogo[jogo.get("id")] = jogo
+
+def _jogo_removido(id_jogo: int) -> None:
+    if not _construido:
+        return
+    _catalogo.pop(id_jogo, None)
+    usuarios = _usuarios_do_jogo.pop(id_jogo, set())
+    for id_perfil in usuarios:
+        _notas_usuario.get(id_perfil, {}).pop(id_jogo, None)
+    _pendentes.update(usuarios)
+
+def _jogos_por_id(ids: set) -> Dict[int, Dict[str, Any]]:
+    return {j: _catalogo[j] for j in ids if j in _catalogo}
+
+@consulta_indice
+def Jogos_Similares(id_jogo: int, n: int = 10) -> Tuple[int, List[Dict[str, Any]]]:
+    """Vizinhos mais próximos de um jogo: [{"jogo", "similaridade"}]."""
+    if not isinstance(n, int) or n <= 0:
+        return DADOS_INVALIDOS, []
+    _garantir_atualizado()
+    vizinhos = _vizinhos.get(id_jogo, [])[:n]
+    por_id = _jogos_por_id({j for j, _ in vizinhos})
+    return OK, [{"jogo": por_id[j], "similaridade": round(s, 4)} for j, s in vizinhos if j in por_id]
+
+@consulta_indice
+def Recomendar_Jogos(id_perfil: int, n: int = 10) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Recomendações para o perfil: [{"jogo", "pontuacao", "porque"}], onde
+    "porque" é o jogo que o perfil gostou que mais contribuiu.
+    """
+    if not isinstance(n, int) or n <= 0:
+        return DADOS_INVALIDOS, []
+    _garantir_atualizado()
+    if id_perfil not in _perfis:
+        return NAO_ENCONTRADO, []
+
+    bruto = _brutos.get(id_perfil, {})
+    pontuacao: Dict[int, float] = {}
+    melhor_motivo: Dict[int, Tuple[float, int]] = {}
+    for i, valor in bruto.items():
+        if valor < LIMIAR_GOSTOU:
+            continue
+        for j, s in _vizinhos.get(i, []):
+            if j in bruto:
+                continue
+            pontuacao[j] = pontuacao.get(j, 0.0) + s
+            if s > melhor_motivo.get(j, (0.0, 0))[0]:
+                melhor_motivo[j] = (s, i)
+
+    melhores = heapq.nlargest(n, pontuacao.items(), key=lambda par: (par[1], -par[0]))
+    por_id = _jogos_por_id({j for j, _ in melhores} | {m[1] for m in melhor_motivo.values()})
+    return OK, [
+        {"jogo": por_id[j], "pontuacao": round(p, 4), "porque": por_id.get(melhor_motivo[j][1])}
+        for j, p in melhores if j in por_id
+    ]
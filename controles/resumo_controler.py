@@ -0,0 +1,204 @@
+# controles/resumo_controler.py
+"""
+Resumo materializado de cada perfil: quantidade e soma das notas dadas,
+histograma de gêneros (jogos avaliados, favoritados e na biblioteca),
+contagem por status da biblioteca e número de favoritos.
+
+O resumo é montado em uma única passada sobre avaliações e perfis e
+depois mantido pelos avisos de controles.eventos, cada um em O(1). Troca
+de gênero e remoção de jogo custam O(perfis que tocaram o jogo), via o
+índice reverso _tocado_por; o gênero de cada jogo vem dos avisos do
+catálogo, sem percorrer `jogos`.
+"""
+from collections import Counter
+from typing import Tuple, Dict, Any, Optional
+
+from dados.database import perfis, jogos, avaliacoes
+from utils.codigos import OK, NAO_ENCONTRADO
+from utils.travas import consulta_indice
+
+__all__ = ["Resumo_Perfil"]
+
+GENEROS_NO_RESUMO = 3
+STATUS_CONCLUIDOS = ("jogado", "platinado")
+
+_construido = False
+_resumos: Dict[int, Dict[str, Any]] = {}
+_genero_jogo: Dict[int, Optional[str]] = {}
+_tocado_por: Dict[int, set] = {}   # jogo -> perfis com o jogo no histograma
+
+def _descartar() -> None:
+    global _construido
+    _construido = False
+    _resumos.clear()
+    _genero_jogo.clear()
+    _tocado_por.clear()
+
+def _novo_resumo() -> Dict[str, Any]:
+    # toques: jogo -> quantas vezes entra no histograma (nota, favorito, biblioteca);
+    # status_jogo e favoritados permitem desfazer a cascata de Remover_Jogo
+    return {"avaliacoes": 0, "soma_notas": 0.0, "favoritos": 0,
+            "generos": Counter(), "biblioteca": Counter(),
+            "toques": Counter(), "status_jogo": {}, "favoritados": set()}
+
+def _resumo(id_perfil: int) -> Dict[str, Any]:
+    resumo = _resumos.get(id_perfil)
+    if resumo is None:
+        resumo = _resumos[id_perfil] = _novo_resumo()
+    return resumo
+
+def _somar_genero(generos: Counter, genero: Optional[str], delta: int) -> None:
+    if not genero:
+        return
+    generos[genero] += delta
+    if generos[genero] <= 0:
+        del generos[genero]
+
+def _contar_genero(id_perfil: int, id_jogo: int, delta: int) -> None:
+    resumo = _resumo(id_perfil)
+    toques = resumo["toques"]
+    toques[id_jogo] += delta
+    if toques[id_jogo] <= 0:
+        del toques[id_jogo]
+        _tocado_por.get(id_jogo, set()).discard(id_perfil)
+    else:
+        _tocado_por.setdefault(id_jogo, set()).add(id_perfil)
+    _somar_genero(resumo["generos"], _genero_jogo.get(id_jogo), delta)
+
+def _construir() -> None:
+    global _construido
+    _descartar()
+    _genero_jogo.update((j.get("id"), j.get("genero")) for j in jogos)
+    for p in perfis:
+        id_perfil = p.get("id")
+        resumo = _resumo(id_perfil)
+        for id_jogo in p.get("favoritos", []):
+            resumo["favoritos"] += 1
+            resumo["favoritados"].add(id_jogo)
+            _contar_genero(id_perfil, id_jogo, 1)
+        for entrada in p.get("biblioteca", []):
+            resumo["biblioteca"][entrada.get("status")] += 1
+            resumo["status_jogo"][entrada.get("id_jogo")] = entrada.get("status")
+            _contar_genero(id_perfil, entrada.get("id_jogo"), 1)
+    for a in avaliacoes:
+        resumo = _resumo(a.get("id_perfil"))
+        resumo["avaliacoes"] += 1
+        resumo["soma_notas"] += a.get("score", 0.0)
+        _contar_genero(a.get("id_perfil"), a.get("id_jogo"), 1)
+    _construido = True
+
+# --- GANCHOS ---
+
+def _nota_alterada(id_perfil: int, id_jogo: int, anterior: Optional[float], atual: Optional[float]) -> None:
+    """Criação (anterior None), edição ou remoção (atual None) de avaliação."""
+    if not _construido:
+        return
+    resumo = _resumo(id_perfil)
+    if anterior is not None:
+        resumo["avaliacoes"] -= 1
+        resumo["soma_notas"] -= anterior
+        _contar_genero(id_perfil, id_jogo, -1)
+    if atual is not None:
+        resumo["avaliacoes"] += 1
+        resumo["soma_notas"] += atual
+        _contar_genero(id_perfil, id_jogo, 1)
+
+def _tirar_status(biblioteca: Counter, status: str) -> None:
+    biblioteca[status] -= 1
+    if biblioteca[status] <= 0:
+        del biblioteca[status]
+
+def _biblioteca_alterada(id_perfil: int, id_jogo: int, status_anterior: Optional[str], status_novo: Optional[str]) -> None:
+    if not _construido:
+        return
+    resumo = _resumo(id_perfil)
+    biblioteca = resumo["biblioteca"]
+    if status_anterior is not None:
+        _tirar_status(biblioteca, status_anterior)
+        resumo["status_jogo"].pop(id_jogo, None)
+        _contar_genero(id_perfil, id_jogo, -1)
+    if status_novo is not None:
+        biblioteca[status_novo] += 1
+        resumo["status_jogo"][id_jogo] = status_novo
+        _contar_genero(id_perfil, id_jogo, 1)
+
+def _favorito_alterado(id_perfil: int, id_jogo: int, favoritado: bool) -> None:
+    if not _construido:
+        return
+    resumo = _resumo(id_perfil)
+    delta = 1 if favoritado else -1
+    resumo["favoritos"] += delta
+    if favoritado:
+        resumo["favoritados"].add(id_jogo)
+    else:
+        resumo["favoritados"].discard(id_jogo)
+    _contar_genero(id_perfil, id_jogo, delta)
+
+def _jogo_cadastrado(jogo: Dict[str, Any]) -> None:
+    if _construido:
+        _genero_jogo[jogo.get("id")] = jogo.get("genero")
+
+def _jogo_atualizado(jogo: Dict[str, Any]) -> None:
+    """Troca de gênero: move as contagens só nos perfis que tocaram o jogo."""
+    if not _construido:
+        return
+    id_jogo, novo = jogo.get("id"), jogo.get("genero")
+    antigo = _genero_jogo.get(id_jogo)
+    _genero_jogo[id_jogo] = novo
+    if antigo == novo:
+        return
+    for id_perfil in _tocado_por.get(id_jogo, ()):
+        resumo = _resumos[id_perfil]
+        vezes = resumo["toques"][id_jogo]
+        _somar_genero(resumo["generos"], antigo, -vezes)
+        _somar_genero(resumo["generos"], novo, vezes)
+
+def _jogo_removido(id_jogo: int) -> None:
+    """
+    A cascata de Remover_Jogo avisa as avaliações removidas, mas tira
+    favoritos e entradas de biblioteca sem avisos individuais: desfaz aqui.
+    """
+    if not _construido:
+        return
+    for id_perfil in list(_tocado_por.get(id_jogo, ())):
+        resumo = _resumos[id_perfil]
+        status = resumo["status_jogo"].get(id_jogo)
+        if status is not None:
+            _biblioteca_alterada(id_perfil, id_jogo, status, None)
+        if id_jogo in resumo["favoritados"]:
+            _favorito_alterado(id_perfil, id_jogo, False)
+    _tocado_por.pop(id_jogo, None)
+    _genero_jogo.pop(id_jogo, None)
+
+def _perfil_removido(id_perfil: int) -> None:
+    resumo = _resumos.pop(id_perfil, None)
+    if resumo is not None:
+        for id_jogo in resumo["toques"]:
+            _tocado_por.get(id_jogo, set()).discard(id_perfil)
+
+# --- CONSULTA ---
+
+@consulta_indice
+def Resumo_Perfil(id_perfil: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Retorna {"avaliacoes", "media_notas", "favoritos", "generos_favoritos",
+    "biblioteca", "taxa_conclusao"}; taxa_conclusao é a fração da biblioteca
+    marcada como jogado ou platinado.
+    """
+    if not any(p.get("id") == id_perfil for p in perfis):
+        return NAO_ENCONTRADO, None
+    if not _construido:
+        _construir()
+    resumo = _resumos.get(id_perfil) or _novo_resumo()
+    quantidade = resumo["avaliacoes"]
+    biblioteca = resumo["biblioteca"]
+    total_biblioteca = sum(biblioteca.values())
+    concluidos = sum(biblioteca.get(s, 0) for s in STATUS_CONCLUIDOS)
+    return OK, {
+        "avaliacoes": quantidade,
+        "media_notas": round(resumo["soma_notas"] / quantidade, 2) if quantidade else None,
+        "favoritos": resumo["favoritos"],
+        "generos_favoritos": resumo["generos"].most_common(GENEROS_NO_RESUMO),
+        "biblioteca": dict(biblioteca),
+        "taxa_conclusao": round(concluidos / total_biblioteca, 2) if total_biblioteca else None,
+    }
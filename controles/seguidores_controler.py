@@ -1,19 +1,35 @@
-from typing import Tuple, Optional, List, Dict, Any
+from typing import Tuple, Optional, List, Dict, Any, Iterable
 
 from dados.database import perfis, salvar_perfis
 from utils.codigos import OK, NAO_ENCONTRADO, CONFLITO, DADOS_INVALIDOS
+from utils.travas import protegido
+from controles import eventos
 
 __all__ = [
     "Seguir_Perfil",
     "Parar_de_Seguir",
     "Listar_Seguidores",
     "Listar_Seguindo",
-    "Is_Seguindo"
+    "Is_Seguindo",
+    "Seguir_Perfis_em_lote",
+    "Parar_de_Seguir_em_lote"
 ]
 
 def _encontrar_perfil(id_perfil: int) -> Optional[Dict[str, Any]]:
     return next((p for p in perfis if p.get("id") == id_perfil or p.get("ID_perfil") == id_perfil), None)
 
+def _mapear_perfis(ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """Resolve vários ids de perfil em uma única passada."""
+    procurados = set(ids)
+    mapa = {}
+    for p in perfis:
+        for chave in ("id", "ID_perfil"):
+            valor = p.get(chave)
+            if valor in procurados and valor not in mapa:
+                mapa[valor] = p
+    return mapa
+
+@protegido(leitura=("perfis",), entidades=lambda id_seguidor, id_alvo: (id_seguidor, id_alvo))
 def Seguir_Perfil(id_seguidor: int, id_alvo: int) -> Tuple[int, Optional[Dict[str, Any]]]:
     """Faz id_seguidor seguir id_alvo."""
     if id_seguidor == id_alvo:
@@ -31,9 +47,11 @@ def Seguir_Perfil(id_seguidor: int, id_alvo: int) -> Tuple[int, Optional[Dict[st
 
     seguindo.append(id_alvo)
     seguidores.append(id_seguidor)
+    eventos.seguimento_alterado(id_seguidor, id_alvo, True)
     salvar_perfis()
     return OK, seguidor
 
+@protegido(leitura=("perfis",), entidades=lambda id_seguidor, id_alvo: (id_seguidor, id_alvo))
 def Parar_de_Seguir(id_seguidor: int, id_alvo: int) -> Tuple[int, Optional[Dict[str, Any]]]:
     """Faz id_seguidor parar de seguir id_alvo."""
     seguidor = _encontrar_perfil(id_seguidor)
@@ -48,23 +66,91 @@ def Parar_de_Seguir(id_seguidor: int, id_alvo: int) -> Tuple[int, Optional[Dict[
     seguindo.remove(id_alvo)
     if id_seguidor in alvo.get("seguidores", []):
         alvo["seguidores"].remove(id_seguidor)
+    eventos.seguimento_alterado(id_seguidor, id_alvo, False)
     salvar_perfis()
     return OK, seguidor
 
+@protegido(leitura=("perfis",))
 def Listar_Seguidores(id_perfil: int) -> Tuple[int, List[int]]:
     perfil = _encontrar_perfil(id_perfil)
     if perfil is None:
         return NAO_ENCONTRADO, []
     return OK, perfil.get("seguidores", [])
 
+@protegido(leitura=("perfis",))
 def Listar_Seguindo(id_perfil: int) -> Tuple[int, List[int]]:
     perfil = _encontrar_perfil(id_perfil)
     if perfil is None:
         return NAO_ENCONTRADO, []
     return OK, perfil.get("seguindo", [])
 
+@protegido(leitura=("perfis",))
 def Is_Seguindo(id_seguidor: int, id_alvo: int) -> bool:
     seguidor = _encontrar_perfil(id_seguidor)
     if seguidor is None:
         return False
-    return id_alvo in seguidor.get("seguindo", [])
\ No newline at end of file
+    return id_alvo in seguidor.get("seguindo", [])
+
+@protegido(escrita=("perfis",))
+def Seguir_Perfis_em_lote(id_seguidor: int, ids_alvo: Iterable[int]) -> Tuple[int, List[int]]:
+    """
+    Faz id_seguidor seguir vários perfis com uma única gravação.
+    Retorna um código por alvo, na ordem recebida (mesmas regras de Seguir_Perfil).
+    """
+    ids_alvo = list(ids_alvo)
+    mapa = _mapear_perfis([id_seguidor, *ids_alvo])
+    seguidor = mapa.get(id_seguidor)
+    if seguidor is None:
+        return NAO_ENCONTRADO, []
+
+    seguindo = seguidor.setdefault("seguindo", [])
+    ja_segue = set(seguindo)
+    codigos = []
+    for id_alvo in ids_alvo:
+        alvo = mapa.get(id_alvo)
+        if id_alvo == id_seguidor:
+            codigos.append(DADOS_INVALIDOS)
+        elif alvo is None:
+            codigos.append(NAO_ENCONTRADO)
+        elif id_alvo in ja_segue:
+            codigos.append(CONFLITO)
+        else:
+            ja_segue.add(id_alvo)
+            seguindo.append(id_alvo)
+            alvo.setdefault("seguidores", []).append(id_seguidor)
+            eventos.seguimento_alterado(id_seguidor, id_alvo, True)
+            codigos.append(OK)
+
+    if OK in codigos:
+        salvar_perfis()
+    return OK, codigos
+
+@protegido(escrita=("perfis",))
+def Parar_de_Seguir_em_lote(id_seguidor: int, ids_alvo: Iterable[int]) -> Tuple[int, List[int]]:
+    """Desfaz vários relacionamentos de id_seguidor com uma única gravação."""
+    ids_alvo = list(ids_alvo)
+    mapa = _mapear_perfis([id_seguidor, *ids_alvo])
+    seguidor = mapa.get(id_seguidor)
+    if seguidor is None:
+        return NAO_ENCONTRADO, []
+
+    seguindo = seguidor.get("seguindo", [])
+    ainda_segue = set(seguindo)
+    removidos = set()
+    codigos = []
+    for id_alvo in ids_alvo:
+        alvo = mapa.get(id_alvo)
+        if alvo is None or id_alvo not in ainda_segue:
+            codigos.append(NAO_ENCONTRADO)
+            continue
+        ainda_segue.discard(id_alvo)
+        removidos.add(id_alvo)
+        if id_seguidor in alvo.get("seguidores", []):
+            alvo["seguidores"].remove(id_seguidor)
+        eventos.seguimento_alterado(id_seguidor, id_alvo, False)
+        codigos.append(OK)
+
+    if removidos:
+        seguindo[:] = [i for i in seguindo if i not in removidos]
+        salvar_perfis()
+    return OK, codigos
@@ -0,0 +1,109 @@
+# controles/similaridade_controler.py
+"""
+Perfis com gosto parecido: cada perfil é um vetor esparso das notas que
+deu (id_jogo -> nota), normalizado para comprimento 1, e a semelhança é
+o cosseno (produto escalar dos vetores normalizados).
+
+Um índice invertido id_jogo -> {id_perfil: peso} limita os candidatos aos
+perfis que avaliaram ao menos um jogo em comum; o produto escalar é
+acumulado percorrendo só essas listas, e o top-k sai de um heap.
+"""
+import heapq
+import math
+from typing import Tuple, Dict, List, Any
+
+from dados.database import perfis, avaliacoes
+from utils.codigos import OK, NAO_ENCONTRADO, DADOS_INVALIDOS
+from utils.travas import consulta_indice
+
+__all__ = ["Perfis_Similares"]
+
+_construido = False
+_notas: Dict[int, Dict[int, float]] = {}           # id_perfil -> {id_jogo: nota}
+_vetores: Dict[int, Dict[int, float]] = {}         # id_perfil -> {id_jogo: peso normalizado}
+_postings: Dict[int, Dict[int, float]] = {}        # id_jogo -> {id_perfil: peso normalizado}
+
+def _descartar() -> None:
+    global _construido
+    _notas.clear()
+    _vetores.clear()
+    _postings.clear()
+    _construido = False
+
+def _retirar_vetor(id_perfil: int) -> None:
+    for id_jogo in _vetores.pop(id_perfil, {}):
+        lista = _postings.get(id_jogo)
+        if lista is not None:
+            lista.pop(id_perfil, None)
+            if not lista:
+                del _postings[id_jogo]
+
+def _normalizar(id_perfil: int) -> None:
+    """Refaz o vetor normalizado do perfil a partir das notas brutas."""
+    _retirar_vetor(id_perfil)
+    notas = _notas.get(id_perfil)
+    norma = math.sqrt(sum(n * n for n in notas.values())) if notas else 0.0
+    if not norma:
+        return  # só notas zero: não há direção para comparar
+    vetor = {id_jogo: n / norma for id_jogo, n in notas.items() if n}
+    _vetores[id_perfil] = vetor
+    for id_jogo, peso in vetor.items():
+        _postings.setdefault(id_jogo, {})[id_perfil] = peso
+
+def _construir() -> None:
+    global _construido
+    _descartar()
+    for a in avaliacoes:
+        _notas.setdefault(a.get("id_perfil"), {})[a.get("id_jogo")] = float(a.get("score", 0.0))
+    for id_perfil in _notas:
+        _normalizar(id_perfil)
+    _construido = True
+
+# --- GANCHOS ---
+
+def _nota_alterada(id_perfil: int, id_jogo: int, score) -> None:
+    """score None = avaliação removida."""
+    if not _construido:
+        return
+    notas = _notas.setdefault(id_perfil, {})
+    if score is None:
+        notas.pop(id_jogo, None)
+    else:
+        notas[id_jogo] = float(score)
+    if not notas:
+        del _notas[id_perfil]
+    _normalizar(id_perfil)
+
+def _perfil_removido(id_perfil: int) -> None:
+    if _construido:
+        _notas.pop(id_perfil, None)
+        _retirar_vetor(id_perfil)
+
+# --- CONSULTA ---
+
+@consulta_indice
+def Perfis_Similares(id_perfil: int, k: int = 10) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Os k perfis de gosto mais parecido com id_perfil.
+    Cada item: {"id_perfil", "similaridade", "em_comum"}.
+    """
+    if not isinstance(k, int) or k <= 0:
+        return DADOS_INVALIDOS, []
+    if not any(p.get("id") == id_perfil for p in perfis):
+        return NAO_ENCONTRADO, []
+    if not _construido:
+        _construir()
+
+    acumulado: Dict[int, float] = {}
+    em_comum: Dict[int, int] = {}
+    for id_jogo, peso in _vetores.get(id_perfil, {}).items():
+        for outro, peso_outro in _postings[id_jogo].items():
+            if outro != id_perfil:
+                acumulado[outro] = acumulado.get(outro, 0.0) + peso * peso_outro
+                em_comum[outro] = em_comum.get(outro, 0) + 1
+
+    melhores = heapq.nsmallest(k, acumulado.items(), key=lambda par: (-par[1], par[0]))
+    return OK, [
+        {"id_perfil": outro, "similaridade": round(sim, 4), "em_comum": em_comum[outro]}
+        for outro, sim in melhores
+    ]
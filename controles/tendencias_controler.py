@@ -0,0 +1,154 @@
+# controles/tendencias_controler.py
+"""
+Jogos em alta: pontuação de atividade com decaimento exponencial.
+
+Cada avaliação criada e cada inclusão/troca de status na biblioteca soma
+1 ao jogo, e essa contribuição decai com exp(-idade / tau), onde tau é a
+janela escolhida (dia, semana ou mês). Para não reescrever todas as
+pontuações a cada instante, guarda-se o valor "adiantado" até um instante
+de referência comum:
+
+    armazenado = soma exp((t_evento - referencia) / tau)
+    pontuacao(agora) = armazenado * exp(-(agora - referencia) / tau)
+
+Como o fator de correção é o mesmo para todos os jogos, a ordem não muda
+com o tempo e cada evento custa O(1) (mais a reinserção na lista ordenada
+do top-N). A referência é avançada quando o expoente fica grande demais.
+
+O top-N é resolvido por um mapa id -> jogo montado junto com o índice e
+mantido pelos avisos de cadastro/atualização/remoção de jogos, então a
+consulta não percorre o catálogo.
+
+Na construção a partir dos arquivos, só o último status de cada entrada
+da biblioteca é conhecido (campo "atualizado_em"); registros sem
+data (anteriores a este recurso) são ignorados.
+"""
+import bisect
+import math
+from typing import Tuple, Dict, List, Any, Optional
+
+from dados.database import perfis, jogos, avaliacoes
+from utils.codigos import OK, DADOS_INVALIDOS
+from utils.travas import consulta_indice
+from utils import tempo
+
+__all__ = ["Jogos_em_Alta", "JANELAS"]
+
+JANELAS = {"dia": 86400, "semana": 7 * 86400, "mes": 30 * 86400}
+LIMITE_EXPOENTE = 50.0
+
+_construido = False
+_referencia: Dict[str, float] = {}
+_valor: Dict[str, Dict[int, float]] = {}
+_ordenado: Dict[str, List[Tuple[float, int]]] = {}
+_jogos_por_id: Dict[int, Dict[str, Any]] = {}
+
+def _descartar() -> None:
+    global _construido
+    _referencia.clear()
+    _valor.clear()
+    _ordenado.clear()
+    _jogos_por_id.clear()
+    _construido = False
+
+def _rebasear(janela: str, momento: float) -> None:
+    """Move a referência para `momento`, reescalando todos os valores."""
+    fator = math.exp(-(momento - _referencia[janela]) / JANELAS[janela])
+    valores = _valor[janela]
+    for id_jogo in valores:
+        valores[id_jogo] *= fator
+    # escala positiva comum: a ordem se mantém
+    _ordenado[janela] = [(chave * fator, id_jogo) for chave, id_jogo in _ordenado[janela]]
+    _referencia[janela] = momento
+
+def _somar(janela: str, id_jogo: int, momento: float, peso: float) -> None:
+    tau = JANELAS[janela]
+    if (momento - _referencia[janela]) / tau > LIMITE_EXPOENTE:
+        _rebasear(janela, momento)
+    valores = _valor[janela]
+    lista = _ordenado[janela]
+    antigo = valores.get(id_jogo)
+    if antigo is not None:
+        pos = bisect.bisect_left(lista, (-antigo, id_jogo))
+        if pos < len(lista) and lista[pos][1] == id_jogo:
+            del lista[pos]
+    novo = (antigo or 0.0) + peso * math.exp((momento - _referencia[janela]) / tau)
+    if novo <= 1e-12:
+        valores.pop(id_jogo, None)
+        return
+    valores[id_jogo] = novo
+    bisect.insort(lista, (-novo, id_jogo))
+
+def _construir() -> None:
+    global _construido
+    _descartar()
+    inicio = tempo.agora()
+    for janela in JANELAS:
+        _referencia[janela] = float(inicio)
+        _valor[janela] = {}
+        _ordenado[janela] = []
+    _jogos_por_id.update((j.get("id"), j) for j in jogos)
+    _construido = True
+    for a in avaliacoes:
+        if a.get("criada_em") is not None:
+            _registrar(a.get("id_jogo"), a["criada_em"])
+    for p in perfis:
+        for entrada in p.get("biblioteca", []):
+            if entrada.get("atualizado_em") is not None:
+                _registrar(entrada.get("id_jogo"), entrada["atualizado_em"])
+
+# --- GANCHOS ---
+
+def _registrar(id_jogo: int, momento: Optional[float] = None) -> None:
+    if not _construido:
+        return
+    momento = tempo.agora() if momento is None else momento
+    for janela in JANELAS:
+        _somar(janela, id_jogo, momento, 1.0)
+
+def _retirar(id_jogo: int, momento: Optional[float]) -> None:
+    """Desfaz a contribuição de uma avaliação removida."""
+    if not _construido or momento is None:
+        return
+    for janela in JANELAS:
+        if id_jogo in _valor[janela]:
+            _somar(janela, id_jogo, momento, -1.0)
+
+def _jogo_cadastrado(jogo: Dict[str, Any]) -> None:
+    if _construido:
+        _jogos_por_id[jogo.get("id")] = jogo
+
+def _jogo_removido(id_jogo: int) -> None:
+    if not _construido:
+        return
+    _jogos_por_id.pop(id_jogo, None)
+    for janela in JANELAS:
+        antigo = _valor[janela].pop(id_jogo, None)
+        if antigo is not None:
+            lista = _ordenado[janela]
+            pos = bisect.bisect_left(lista, (-antigo, id_jogo))
+            if pos < len(lista) and lista[pos][1] == id_jogo:
+                del lista[pos]
+
+# --- CONSULTA ---
+
+@consulta_indice
+def Jogos_em_Alta(janela: str = "semana", n: int = 10) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Top-N de jogos por atividade recente na janela ("dia", "semana", "mes").
+    Cada item: {"jogo", "pontuacao"}, pontuacao ≈ eventos ponderados pela idade.
+    """
+    if janela not in JANELAS or not isinstance(n, int) or n <= 0:
+        return DADOS_INVALIDOS, []
+    if not _construido:
+        _construir()
+    fator = math.exp(-(tempo.agora() - _referencia[janela]) / JANELAS[janela])
+    resultado = []
+    for chave, id_jogo in _ordenado[janela]:
+        jogo = _jogos_por_id.get(id_jogo)
+        if jogo is None:
+            continue
+        resultado.append({"jogo": jogo, "pontuacao": round(-chave * fator, 3)})
+        if len(resultado) == n:
+            break
+    return OK, resultado
@@ -1,7 +1,14 @@
 # dados/database.py
 
+import atexit
 import json
 import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple
 
 BASE_DIR = os.path.dirname(__file__)
 PERFIS_FILE = os.path.join(BASE_DIR, "perfis.json")
@@ -11,6 +18,14 @@ AVALIACOES_FILE = os.path.join(BASE_DIR, 'avaliacoes.json')
 # Lista global de avaliações
 avaliacoes = []
 
+# Geração de cada coleção: incrementada a cada gravação, permite que
+# visões derivadas (ordenações, caches) saibam quando ficaram desatualizadas
+geracoes = {"perfis": 0, "jogos": 0, "avaliacoes": 0}
+
+# Uma trava por arquivo: gravações concorrentes da mesma coleção não se
+# intercalam e a geração é incrementada sem corrida
+_travas_arquivo = {nome: threading.Lock() for nome in geracoes}
+
 # perfis padrão
 default_perfis = [
     {"id": 1, "nome": "Danielle", "descricao": "Amante de RPGs", "avatar": "avatar1.png", "favoritos": []},
@@ -52,23 +67,283 @@ except Exception:
 
 # --- FUNÇÕES DE SALVAMENTO ---
 
-def salvar_perfis():
-    """Persiste a lista `perfis` em dados/perfis.json"""
+_persistir = True
+
+def configurar_arquivos(diretorio=None, sufixo=""):
+    """
+    Redireciona as gravações para `diretorio` (perfis<sufixo>.json, ...).
+    Com diretorio=None as coleções ficam só em memória. Usado pelos
+    processos do motor fragmentado, que não podem gravar nos arquivos
+    principais.
+    """
+    global PERFIS_FILE, JOGOS_FILE, AVALIACOES_FILE, _persistir
+    _persistir = diretorio is not None
+    if _persistir:
+        os.makedirs(diretorio, exist_ok=True)
+        PERFIS_FILE = os.path.join(diretorio, f"perfis{sufixo}.json")
+        JOGOS_FILE = os.path.join(diretorio, f"jogos{sufixo}.json")
+        AVALIACOES_FILE = os.path.join(diretorio, f"avaliacoes{sufixo}.json")
+
+# --- INSTANTÂNEOS (cópia na escrita) ---
+#
+# A cada lote gravado (ver persistência abaixo) a coleção é copiada de
+# forma congelada e a referência publicada em `_instantaneos` é trocada.
+# Leitores longos (listagem do catálogo, exportação) pegam essa
+# referência sem trava nenhuma: não bloqueiam escritores e enxergam um
+# estado fixo enquanto eles seguem. A mesma cópia é a que vai para o
+# disco, então persistir não custa uma cópia extra.
+
+class RegistroCongelado(dict):
+    """Registro somente leitura de um instantâneo (segue sendo um dict para json/csv)."""
+
+    def _somente_leitura(self, *args, **kwargs):
+        raise TypeError("registro de instantâneo é somente leitura")
+
+    __setitem__ = __delitem__ = __ior__ = _somente_leitura
+    clear = pop = popitem = setdefault = update = _somente_leitura
+
+    def __reduce__(self):
+        return (RegistroCongelado, (dict(self),))
+
+class Instantaneo(NamedTuple):
+    geracao: int
+    registros: tuple
+
+def _congelar(valor):
+    """
+    Cópia profunda congelada (dict -> RegistroCongelado, list -> tuple)
+    feita só com cópias atômicas (list(), dict.copy()), para não falhar
+    mesmo que outra thread altere uma entidade (sob a trava dela) durante
+    a cópia.
+    """
+    if isinstance(valor, dict):
+        copia = valor.copy()
+        for chave, item in copia.items():
+            if isinstance(item, (dict, list)):
+                copia[chave] = _congelar(item)
+        return RegistroCongelado(copia)
+    if isinstance(valor, list):
+        return tuple(_congelar(item) if isinstance(item, (dict, list)) else item for item in list(valor))
+    return valor
+
+_instantaneos = {}
+
+def instantaneo(nome):
+    """
+    Estado imutável da coleção `nome` no último lote gravado. Nunca trava:
+    cada coleção é consistente por si, mas cascatas gravam uma coleção
+    por vez, então dois instantâneos lidos em sequência podem refletir
+    momentos um pouco diferentes.
+    """
+    return _instantaneos[nome]
+
+def publicar_instantaneos(*nomes):
+    """Republica o instantâneo das coleções (após carregar/substituir listas sem gravar)."""
+    for nome in nomes or tuple(geracoes):
+        with _travas_arquivo[nome]:
+            _instantaneos[nome] = Instantaneo(geracoes[nome], _congelar(globals()[nome]))
+
+# --- PERSISTÊNCIA ASSÍNCRONA ---
+#
+# O salvamento só marca a coleção como pendente; copiar (o instantâneo
+# acima), serializar e escrever fica com um pool de I/O, uma vez por
+# lote, sob leitura da coleção. Cada coleção tem no máximo uma escrita
+# em andamento: salvamentos que chegam enquanto ela roda se juntam em uma
+# única escrita seguinte, do estado mais novo. A escrita vai para um arquivo temporário no
+# mesmo diretório, com fsync, e só então substitui o original (nunca fica
+# um JSON pela metade). salvar_* devolve um Future que resolve em True
+# quando aquela versão (ou uma mais nova) está em disco, ou com a exceção
+# da escrita.
+#
+# Commit em grupo: antes de escrever, a tarefa segura o lote aberto por
+# até `latencia_maxima` segundos (ou até juntar `tamanho_lote`
+# salvamentos), para que escritores concorrentes caiam na mesma escrita.
+# Com `confirmar` ligado, as funções @protegido que alteram dados só
+# retornam depois que as gravações feitas por elas estão em disco
+# (gravacoes_confirmadas); a espera acontece já sem travas, então os
+# outros escritores seguem entrando no lote enquanto isso. A tarefa só
+# segura o lote enquanto algum desses blocos que já salvou ainda executa.
+
+GRUPO = {"latencia_maxima": 0.002, "tamanho_lote": 128, "confirmar": True}
+
+def configurar_gravacao_em_grupo(latencia_maxima=None, tamanho_lote=None, confirmar=None):
+    """Ajusta o commit em grupo; parâmetros omitidos ficam como estão."""
+    if latencia_maxima is not None:
+        GRUPO["latencia_maxima"] = max(0.0, float(latencia_maxima))
+    if tamanho_lote is not None:
+        GRUPO["tamanho_lote"] = max(1, int(tamanho_lote))
+    if confirmar is not None:
+        GRUPO["confirmar"] = bool(confirmar)
+
+class _Fila:
+    def __init__(self):
+        self.pendente = None   # (lista, caminho, indent) ainda não escrita
+        self.futuro = None     # Future de quem está esperando o pendente
+        self.escrevendo = None # Future da escrita em andamento
+        self.mutacoes = 0      # salvamentos reunidos no pendente
+        self.aberta_em = 0.0   # quando o lote pendente foi aberto
+        self.agendada = False  # já há tarefa da coleção no pool
+
+_filas = {nome: _Fila() for nome in geracoes}
+_condicoes = {nome: threading.Condition(trava) for nome, trava in _travas_arquivo.items()}
+_da_thread = threading.local()
+# Blocos confirmados que já salvaram e ainda executam (podem salvar de novo)
+_em_execucao = 0
+_trava_execucao = threading.Lock()
+_pool = None
+_trava_pool = threading.Lock()
+
+def _pool_io():
+    global _pool
+    with _trava_pool:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=len(_filas), thread_name_prefix="persistencia")
+        return _pool
+
+def _escrever_atomico(caminho, registros, indent):
+    diretorio = os.path.dirname(caminho) or "."
+    descritor, temporario = tempfile.mkstemp(prefix=".gravando-", suffix=".json", dir=diretorio)
     try:
-        with open(PERFIS_FILE, "w", encoding="utf-8") as f:
-            json.dump(perfis, f, ensure_ascii=False, indent=2)
-        return True
-    except Exception:
-        return False
+        with os.fdopen(descritor, "w", encoding="utf-8") as f:
+            json.dump(registros, f, ensure_ascii=False, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+    except BaseException:
+        try:
+            os.remove(temporario)
+        except OSError:
+            pass
+        raise
 
-def salvar_jogos():
-    """Persiste a lista `jogos` em dados/jogos.json"""
+def _drenar(nome):
+    """Tarefa do pool: escreve o pendente da coleção até não sobrar nenhum."""
+    from utils import travas  # utils.travas importa este módulo
+    fila, condicao = _filas[nome], _condicoes[nome]
+    while True:
+        with condicao:
+            fila.escrevendo = None
+            # sem ninguém mais executando, esperar só atrasaria o único escritor
+            while fila.pendente is not None and fila.mutacoes < GRUPO["tamanho_lote"] and _em_execucao:
+                restante = fila.aberta_em + GRUPO["latencia_maxima"] - time.monotonic()
+                if restante <= 0:
+                    break
+                condicao.wait(restante)
+            if fila.pendente is None:
+                fila.agendada = False
+                return
+            (dados, caminho, indent), futuro = fila.pendente, fila.futuro
+            fila.pendente = fila.futuro = None
+            fila.escrevendo = futuro
+        try:
+            # escritores estruturais esperam só esta cópia; quem altera uma
+            # entidade sob leitura segue em paralelo (_congelar é atômica
+            # por registro) e o salvamento dele entra no lote seguinte
+            with travas.travar(leitura=(nome,)):
+                with _travas_arquivo[nome]:
+                    geracao = geracoes[nome]
+                registros = _congelar(dados)
+            _instantaneos[nome] = Instantaneo(geracao, registros)
+            if _persistir:
+                _escrever_atomico(caminho, registros, indent)
+        except Exception as erro:
+            futuro.set_exception(erro)
+        else:
+            futuro.set_result(True)
+
+def _gravar(nome, caminho, dados, indent):
+    with _travas_arquivo[nome]:
+        geracoes[nome] += 1
+        fila = _filas[nome]
+        if fila.pendente is None:
+            fila.futuro = Future()
+            fila.mutacoes = 0
+            fila.aberta_em = time.monotonic()
+        fila.pendente = (dados, caminho, indent)
+        fila.mutacoes += 1
+        if fila.mutacoes >= GRUPO["tamanho_lote"]:
+            _condicoes[nome].notify()
+        futuro = fila.futuro
+        _lembrar(nome, futuro)
+        if not fila.agendada:
+            fila.agendada = True
+            _pool_io().submit(_drenar, nome)
+        return futuro
+
+def _lembrar(nome, futuro):
+    global _em_execucao
+    futuros = getattr(_da_thread, "futuros", None)
+    if futuros is None:
+        return
+    if not futuros:
+        with _trava_execucao:
+            _em_execucao += 1
+    # só o último futuro de cada coleção: ele cobre os anteriores
+    futuros[nome] = futuro
+
+def _sair_da_execucao():
+    global _em_execucao
+    with _trava_execucao:
+        _em_execucao -= 1
+        ultimo = not _em_execucao
+    if ultimo:
+        for condicao in _condicoes.values():
+            with condicao:
+                condicao.notify_all()
+
+class Confirmacao:
+    """Resultado de gravacoes_confirmadas: `falha` guarda a exceção da escrita que falhou."""
+
+    def __init__(self):
+        self.falha = None
+
+@contextmanager
+def gravacoes_confirmadas(timeout=None):
+    """
+    Ao sair do bloco, espera ficarem em disco as gravações feitas nele por
+    esta thread. Não levanta: a alteração já está em memória (e vai na
+    próxima gravação), então a falha fica em `falha` do objeto devolvido.
+    Sem efeito com GRUPO["confirmar"] desligado ou dentro de outro bloco.
+    """
+    confirmacao = Confirmacao()
+    if not GRUPO["confirmar"] or getattr(_da_thread, "futuros", None) is not None:
+        yield confirmacao
+        return
+    _da_thread.futuros = {}
     try:
-        with open(JOGOS_FILE, "w", encoding="utf-8") as f:
-            json.dump(jogos, f, ensure_ascii=False, indent=2)
-        return True
-    except Exception:
-        return False
+        yield confirmacao
+    finally:
+        futuros = _da_thread.futuros
+        _da_thread.futuros = None
+        if futuros:
+            _sair_da_execucao()
+    for futuro in futuros.values():
+        try:
+            futuro.result(timeout)
+        except Exception as erro:
+            confirmacao.falha = confirmacao.falha or erro
+
+def aguardar_gravacoes(timeout=None):
+    """
+    Espera as escritas pendentes de todas as coleções terminarem. Levanta
+    a exceção da primeira que falhou (as demais seguem sendo tentadas).
+    """
+    futuros = []
+    for nome, fila in _filas.items():
+        with _travas_arquivo[nome]:
+            futuros += [f for f in (fila.escrevendo, fila.futuro) if f is not None]
+    for futuro in futuros:
+        futuro.result(timeout)
+
+atexit.register(aguardar_gravacoes)
+
+def salvar_perfis():
+    """Persiste a lista `perfis` em dados/perfis.json (Future de durabilidade)"""
+    return _gravar("perfis", PERFIS_FILE, perfis, 2)
+
+def salvar_jogos():
+    """Persiste a lista `jogos` em dados/jogos.json (Future de durabilidade)"""
+    return _gravar("jogos", JOGOS_FILE, jogos, 2)
 
 # --- LÓGICA DE AVALIAÇÕES (CORRIGIDA) ---
 
@@ -83,13 +358,10 @@ def carregar_avaliacoes():
     return []
 
 def salvar_avaliacoes():
-    try:
-        # FIX: encoding="utf-8" e ensure_ascii=False
-        with open(AVALIACOES_FILE, 'w', encoding="utf-8") as f:
-            json.dump(avaliacoes, f, indent=4, ensure_ascii=False)
-        return True
-    except Exception:
-        return False
+    # FIX: encoding="utf-8" e ensure_ascii=False (em _gravar)
+    return _gravar("avaliacoes", AVALIACOES_FILE, avaliacoes, 4)
 
 # Inicializa a lista carregando do arquivo
-avaliacoes = carregar_avaliacoes()
\ No newline at end of file
+avaliacoes = carregar_avaliacoes()
+
+publicar_instantaneos()
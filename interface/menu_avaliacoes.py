@@ -24,6 +24,7 @@ def exibir_menu_avaliacoes(perfil: Optional[Dict]):
         print("2. Avaliar / Editar avaliação")
         print("3. Remover avaliação")
         print("4. Listar avaliações de um jogo (Geral)")
+        print("5. Buscar avaliações por texto")
         print("0. Voltar")
         opcao = _input_strip("Escolha: ")
 
@@ -36,9 +37,10 @@ def exibir_menu_avaliacoes(perfil: Optional[Dict]):
                 print("  (nenhuma avaliação feita)")
             else:
                 print("\n📝 Suas avaliações:")
+                _, jogos_por_id = jogo_controler.Busca_Jogos(a.get("id_jogo") for a in minhas)
                 for a in minhas:
-                    cid, jogo = jogo_controler.Busca_Jogo(a.get("id_jogo"))
-                    titulo = jogo.get("titulo") if cid == OK and jogo else f"Jogo #{a.get('id_jogo')}"
+                    jogo = jogos_por_id.get(a.get("id_jogo"))
+                    titulo = jogo.get("titulo") if jogo else f"Jogo #{a.get('id_jogo')}"
                     print(f"  Jogo: {titulo} | Nota: {a.get('score')} | Opinião: {a.get('descricao','(sem opinião)')}")
 
         elif opcao == "2":
@@ -115,12 +117,31 @@ def exibir_menu_avaliacoes(perfil: Optional[Dict]):
                 print("  (nenhuma avaliação para este jogo)")
             else:
                 print(f"\n🗣️ Avaliações do Jogo #{id_j}:")
+                _, autores = perfil_controler.Busca_Perfis(a.get("id_perfil") for a in do_jogo)
                 for a in do_jogo:
                     # Busca nome do autor
-                    _, autor = perfil_controler.Busca_Perfil(a.get("id_perfil"))
+                    autor = autores.get(a.get("id_perfil"))
                     nome = autor.get("nome", "Desconhecido") if autor else "Desconhecido"
                     print(f"  👤 {nome}: Nota {a.get('score')} | {a.get('descricao', '')}")
 
+        elif opcao == "5":
+            termo = _input_strip("Buscar por: ")
+            codigo, encontradas = avaliacao_controler.Buscar_avaliacao(termo)
+            if codigo == DADOS_INVALIDOS:
+                print("❌ Termo de busca inválido.")
+            elif not encontradas:
+                print("  (nenhuma avaliação encontrada)")
+            else:
+                print(f"\n🔎 Resultados para '{termo}':")
+                _, jogos_por_id = jogo_controler.Busca_Jogos(a.get("id_jogo") for a in encontradas)
+                _, autores = perfil_controler.Busca_Perfis(a.get("id_perfil") for a in encontradas)
+                for a in encontradas:
+                    jogo = jogos_por_id.get(a.get("id_jogo"))
+                    titulo = jogo.get("titulo") if jogo else f"Jogo #{a.get('id_jogo')}"
+                    autor = autores.get(a.get("id_perfil"))
+                    nome = autor.get("nome", "Desconhecido") if autor else "Desconhecido"
+                    print(f"  {titulo} | 👤 {nome}: Nota {a.get('score')} | {a.get('descricao', '')}")
+
         elif opcao == "0":
             break
         else:
@@ -30,11 +30,12 @@ def exibir_menu_biblioteca(perfil: Optional[Dict]):
                 if not lista:
                     print("  (biblioteca vazia)")
                 else:
+                    _, por_id = jogo_controler.Busca_Jogos(e.get("id_jogo") for e in lista)
                     for i, e in enumerate(lista, start=1):
                         # FIX: Padronizado para 'id_jogo'
                         id_jogo = e.get("id_jogo")
-                        cid, jogo = jogo_controler.Busca_Jogo(id_jogo)
-                        titulo = jogo.get("titulo") if cid == OK and jogo else f"Jogo #{id_jogo}"
+                        jogo = por_id.get(id_jogo)
+                        titulo = jogo.get("titulo") if jogo else f"Jogo #{id_jogo}"
                         print(f"  {i}. {id_jogo} - {titulo} | Status: {e.get('status')}")
             else:
                 print("❌ Erro ao listar biblioteca.")
@@ -96,11 +97,12 @@ def exibir_menu_biblioteca(perfil: Optional[Dict]):
                 if not lista:
                     print("  (nenhum item com esse status)")
                 else:
+                    _, por_id = jogo_controler.Busca_Jogos(e.get("id_jogo") for e in lista)
                     for e in lista:
                         # FIX: Padronizado para 'id_jogo'
                         id_jogo = e.get("id_jogo")
-                        cid, jogo = jogo_controler.Busca_Jogo(id_jogo)
-                        titulo = jogo.get("titulo") if cid == OK and jogo else f"Jogo #{id_jogo}"
+                        jogo = por_id.get(id_jogo)
+                        titulo = jogo.get("titulo") if jogo else f"Jogo #{id_jogo}"
                         print(f"  {id_jogo} - {titulo} | Status: {e.get('status')}")
             elif codigo == DADOS_INVALIDOS:
                 print("❌ Status inválido.")
@@ -129,9 +131,10 @@ def exibir_menu_biblioteca(perfil: Optional[Dict]):
                 if not lista:
                     print("  (nenhum favorito)")
                 else:
+                    _, por_id = jogo_controler.Busca_Jogos(lista)
                     for jid in lista:
-                        cid, jogo = jogo_controler.Busca_Jogo(jid)
-                        titulo = jogo.get("titulo") if cid == OK and jogo else f"Jogo #{jid}"
+                        jogo = por_id.get(jid)
+                        titulo = jogo.get("titulo") if jogo else f"Jogo #{jid}"
                         print(f"  {jid} - {titulo}")
             else:
                 print("❌ Erro ao listar favoritos.")
@@ -27,9 +27,10 @@ def exibir_menu_favoritos(perfil: Optional[Dict]):
                 if not lista:
                     print("  (nenhum favorito)")
                 else:
+                    _, por_id = jogo_controler.Busca_Jogos(lista)
                     for jid in lista:
-                        c, jogo = jogo_controler.Busca_Jogo(jid)
-                        titulo = jogo.get("titulo") if c == OK and jogo else f"Jogo #{jid}"
+                        jogo = por_id.get(jid)
+                        titulo = jogo.get("titulo") if jogo else f"Jogo #{jid}"
                         print(f"  {jid} - {titulo}")
             else:
                 print("❌ Erro ao listar favoritos.")
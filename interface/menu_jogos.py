@@ -3,6 +3,9 @@ from controles import jogo_controler as jogo_controller
 from controles import perfil_controler
 from controles import avaliacao_controler as avaliacao_controller
 from controles import biblioteca_controler # Adicionado para gerenciar status
+from controles import ranking_controler
+from controles import recomendacao_controler
+from controles import tendencias_controler
 from utils.codigos import OK, DADOS_INVALIDOS, NAO_ENCONTRADO, CONFLITO
 
 def _buscar_avaliacao_especifica(id_perfil, id_jogo):
@@ -10,6 +13,11 @@ def _buscar_avaliacao_especifica(id_perfil, id_jogo):
     _, todas = avaliacao_controller.Listar_avaliacao()
     return next((a for a in todas if a.get("id_perfil") == id_perfil and a.get("id_jogo") == id_jogo), None)
 
+def _avaliacoes_do_perfil_por_jogo(id_perfil):
+    """Mapa id_jogo -> avaliação do perfil, montado em uma única passada."""
+    _, todas = avaliacao_controller.Listar_avaliacao()
+    return {a.get("id_jogo"): a for a in todas if a.get("id_perfil") == id_perfil}
+
 def _coletar_media_e_opinioes(id_jogo, perfil_atual=None):
     """
     Retorna (media, lista_opinioes) buscando na lista GLOBAL de avaliações.
@@ -26,9 +34,10 @@ def _coletar_media_e_opinioes(id_jogo, perfil_atual=None):
     quantidade = len(avals_deste_jogo)
     
     lista_opinioes = []
+    _, autores = perfil_controler.Busca_Perfis(a["id_perfil"] for a in avals_deste_jogo)
     for aval in avals_deste_jogo:
         # Busca nome do autor
-        _, autor = perfil_controler.Busca_Perfil(aval["id_perfil"])
+        autor = autores.get(aval["id_perfil"])
         nome_autor = autor["nome"] if autor else "(desconhecido)"
         
         lista_opinioes.append({
@@ -40,34 +49,6 @@ def _coletar_media_e_opinioes(id_jogo, perfil_atual=None):
     media = round(soma_notas / quantidade, 2)
     return media, lista_opinioes
 
-def _normalize(s: str) -> str:
-    return ' '.join(''.join(ch for ch in s.lower() if ch.isalnum() or ch.isspace()).split())
-
-def _is_subsequence(query: str, text: str) -> bool:
-    it = iter(text)
-    return all(ch in it for ch in query)
-
-def _smart_search_matches(lista_jogos, termo):
-    q = _normalize(termo)
-    if not q: return []
-    results = []
-    for j in lista_jogos:
-        title = j.get("titulo", "")
-        norm = _normalize(title)
-        score = 0
-        if q in norm: score += 100
-        initials = ''.join(w[0] for w in norm.split() if w)
-        if q in initials: score += 90
-        for w in norm.split():
-            if w.startswith(q):
-                score += 70
-                break
-        if _is_subsequence(q.replace(' ', ''), norm.replace(' ', '')): score += 50
-        if len(q) <= 2 and norm.startswith(q): score += 20
-        if score > 0: results.append((score, j))
-    results.sort(key=lambda x: (-x[0], x[1].get("titulo", "")))
-    return [r[1] for r in results]
-
 def exibir_menu(perfil):
     while True:
         print("\n=== CATÁLOGO DE JOGOS ===")
@@ -77,6 +58,10 @@ def exibir_menu(perfil):
         print("4. Remover jogo")
         print("5. Avaliar jogo")
         print("6. Minha biblioteca (Status)")
+        print("7. Filtrar por gênero e nota")
+        print("8. Ranking (nota ponderada)")
+        print("9. Recomendações para mim")
+        print("10. Em alta")
         print("0. Voltar")
         opcao = input("Escolha: ")
 
@@ -92,6 +77,14 @@ def exibir_menu(perfil):
             avaliar_jogo(perfil)
         elif opcao == "6":
             mostrar_biblioteca(perfil)
+        elif opcao == "7":
+            filtrar_jogos()
+        elif opcao == "8":
+            mostrar_ranking()
+        elif opcao == "9":
+            mostrar_recomendacoes(perfil)
+        elif opcao == "10":
+            mostrar_em_alta()
         elif opcao == "0":
             break
         else:
@@ -156,14 +149,25 @@ def remover_jogo():
     else:
         print("❌ Erro ao remover.")
 
+TAMANHO_PAGINA = 10
+
 def listar_jogos(perfil):
-    codigo, lista = jogo_controller.Listar_Jogo()
-    if codigo == OK:
-        print("\n📋 Catálogo de Jogos:")
-        if not lista:
-            print("  Nenhum jogo disponível.")
+    ordem = input("Ordenar por (id/titulo/nota_geral, ENTER = id): ").strip() or "id"
+    cursor = None
+    primeira = True
+    while True:
+        codigo, pagina = jogo_controller.Listar_Jogo_paginado(TAMANHO_PAGINA, cursor, ordem)
+        if codigo != OK:
+            print("❌ Erro ao listar jogos.")
             return
-        for j in lista:
+        if primeira:
+            print("\n📋 Catálogo de Jogos:")
+            if not pagina["itens"]:
+                print("  Nenhum jogo disponível.")
+                return
+            primeira = False
+        minhas = _avaliacoes_do_perfil_por_jogo(perfil["id"]) if perfil else {}
+        for j in pagina["itens"]:
             genero = j.get('genero', '-')
             # Usa o campo nota_geral direto do jogo (que é atualizado automaticamente)
             media = j.get("nota_geral", 0.0)
@@ -171,13 +175,70 @@ def listar_jogos(perfil):
             linha = f"  {j['id']} - {j['titulo']} ({genero}) - Nota geral: {media}"
             print(linha)
             
-            if perfil:
-                # FIX: Busca avaliação na lista global
-                aval = _buscar_avaliacao_especifica(perfil["id"], j["id"])
-                if aval:
-                    print(f"     → Sua nota: {aval.get('score')} | Sua opinião: {aval.get('descricao','(sem opinião)')}")
-    else:
-        print("❌ Erro ao listar jogos.")
+            aval = minhas.get(j["id"])
+            if aval:
+                print(f"     → Sua nota: {aval.get('score')} | Sua opinião: {aval.get('descricao','(sem opinião)')}")
+
+        cursor = pagina["proximo_cursor"]
+        if cursor is None or input("ENTER para mais, 0 para parar: ").strip() == "0":
+            return
+
+def filtrar_jogos():
+    generos_txt = input("Gêneros separados por vírgula (ENTER para todos): ").strip()
+    nota_txt = input("Nota mínima (ENTER para qualquer): ").strip().replace(',', '.')
+    generos = [g.strip() for g in generos_txt.split(",") if g.strip()] or None
+    try:
+        nota_min = float(nota_txt) if nota_txt else None
+    except ValueError:
+        print("⚠️  Nota inválida.")
+        return
+
+    codigo, res = jogo_controller.Filtrar_Jogos(generos, nota_min)
+    if codigo != OK:
+        print("❌ Filtro inválido.")
+        return
+    print(f"\n📋 {res['total']} jogo(s) encontrado(s):")
+    for j in res["jogos"]:
+        print(f"  {j['id']} - {j['titulo']} ({j.get('genero', '-')}) - Nota geral: {j.get('nota_geral', 0.0)}")
+    if res["facetas"]:
+        print("  Por gênero: " + ", ".join(f"{g} ({n})" for g, n in sorted(res["facetas"].items())))
+
+def mostrar_ranking():
+    genero = input("Gênero (ENTER para geral): ").strip() or None
+    _, top = ranking_controler.Top_Jogos(10, genero)
+    if not top:
+        print("  (nenhum jogo avaliado)")
+        return
+    print("\n🏆 Ranking:")
+    for pos, item in enumerate(top, start=1):
+        j = item["jogo"]
+        print(f"  {pos}. {j['titulo']} - Nota ponderada: {item['nota_ponderada']} ({item['quantidade']} avaliações)")
+
+def mostrar_em_alta():
+    janela = input("Janela (dia/semana/mes) [semana]: ").strip().lower() or "semana"
+    codigo, top = tendencias_controler.Jogos_em_Alta(janela, 10)
+    if codigo == DADOS_INVALIDOS:
+        print("❌ Janela inválida.")
+        return
+    if not top:
+        print("  (nenhuma atividade recente)")
+        return
+    print(f"\n🔥 Em alta ({janela}):")
+    for pos, item in enumerate(top, start=1):
+        print(f"  {pos}. {item['jogo']['titulo']} - {item['pontuacao']}")
+
+def mostrar_recomendacoes(perfil):
+    if not perfil:
+        return
+    _, recs = recomendacao_controler.Recomendar_Jogos(perfil["id"], 10)
+    if not recs:
+        print("  (avalie ou favorite mais jogos para receber recomendações)")
+        return
+    print("\n✨ Recomendados para você:")
+    for item in recs:
+        j = item["jogo"]
+        motivo = f" — porque você gostou de {item['porque']['titulo']}" if item["porque"] else ""
+        print(f"  {j['id']} - {j['titulo']} ({j.get('genero', '-')}){motivo}")
 
 def avaliar_jogo(perfil):
     codigo, lista = jogo_controller.Listar_Jogo()
@@ -193,9 +254,10 @@ def avaliar_jogo(perfil):
         target_id = int(escolha)
         jogo_selecionado = next((j for j in lista if j["id"] == target_id), None)
     else:
-        matches = [j for j in lista if escolha.lower() in j.get("titulo","").lower()]
+        # Busca inteligente por título (resultado mais relevante)
+        _, matches = jogo_controller.Pesquisar_Jogo(escolha, 1)
         if matches:
-            jogo_selecionado = matches[0] # Simplificado para o exemplo
+            jogo_selecionado = matches[0]
 
     if not jogo_selecionado:
         print("❌ Jogo não encontrado.")
@@ -236,15 +298,17 @@ def mostrar_biblioteca(perfil):
         return
 
     print("\n📚 Sua biblioteca (Status & Avaliações):")
+    _, jogos_por_id = jogo_controller.Busca_Jogos(e.get("id_jogo") for e in bibli)
+    minhas = _avaliacoes_do_perfil_por_jogo(perfil["id"])
     for i, entry in enumerate(bibli, start=1):
         id_jogo = entry.get("id_jogo") # FIX: chave padronizada
         status = entry.get("status", "sem status")
         
-        _, jogo = jogo_controller.Busca_Jogo(id_jogo)
+        jogo = jogos_por_id.get(id_jogo)
         titulo = jogo.get("titulo") if jogo else "Jogo Removido"
         
         # Busca avaliação correspondente
-        aval = _buscar_avaliacao_especifica(perfil["id"], id_jogo)
+        aval = minhas.get(id_jogo)
         nota_str = f"Nota: {aval['score']}" if aval else "Não avaliado"
         
         print(f"  {i}. {titulo} | Status: [{status.upper()}] | {nota_str}")
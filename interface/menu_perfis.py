@@ -1,7 +1,13 @@
 from typing import Optional, Dict
 from controles import perfil_controler
+from controles import feed_controler
+from controles import grafo_controler
+from controles import resumo_controler
+from controles import jogo_controler
 from utils.codigos import OK, CONFLITO, DADOS_INVALIDOS, NAO_ENCONTRADO
 
+TAMANHO_PAGINA = 20
+
 def _input_strip(prompt: str) -> str:
     return input(prompt).strip()
 
@@ -25,17 +31,25 @@ def exibir_menu_perfis(perfil_ativo: Optional[Dict]) -> bool:
         print("6. Parar de seguir")
         print("7. Listar meus seguidores")
         print("8. Listar quem sigo")
+        print("9. Feed de quem sigo")
+        print("10. Sugestões de perfis para seguir")
+        print("11. Perfis com gosto parecido")
         print("0. Voltar")
         opcao = _input_strip("Escolha: ")
 
         if opcao == "1":
-            codigo, lista = perfil_controler.Listar_Perfil()
-            if codigo == OK:
-                for p in lista:
+            cursor = None
+            while True:
+                codigo, pagina = perfil_controler.Listar_Perfil_paginado(TAMANHO_PAGINA, cursor, "nome")
+                if codigo != OK:
+                    print("❌ Erro ao listar perfis.")
+                    break
+                for p in pagina["itens"]:
                     nome = p.get('nome_usuario') or p.get('nome') or '(sem nome)'
                     print(f"  {p['id']} - {nome}")
-            else:
-                print("❌ Erro ao listar perfis.")
+                cursor = pagina["proximo_cursor"]
+                if cursor is None or _input_strip("ENTER para mais, 0 para parar: ") == "0":
+                    break
         elif opcao == "2":
             try:
                 idp = int(_input_strip("ID do perfil: "))
@@ -51,6 +65,14 @@ def exibir_menu_perfis(perfil_ativo: Optional[Dict]) -> bool:
                 print(f"🎮 Jogando: {p.get('jogando', 0)}")
                 print(f"✅ Jogados: {p.get('jogados', 0)}")
                 print(f"🏆 Platinados: {p.get('platinados', 0)}")
+                _, resumo = resumo_controler.Resumo_Perfil(p['id'])
+                if resumo:
+                    media = resumo["media_notas"] if resumo["media_notas"] is not None else "-"
+                    print(f"📝 Avaliações: {resumo['avaliacoes']} | Nota média dada: {media}")
+                    generos = ', '.join(g for g, _ in resumo["generos_favoritos"])
+                    print(f"🎯 Gêneros preferidos: {generos or '(nenhum)'}")
+                    if resumo["taxa_conclusao"] is not None:
+                        print(f"📈 Taxa de conclusão: {resumo['taxa_conclusao']:.0%}")
             else:
                 print("❌ Perfil não encontrado.")
         elif opcao == "3":
@@ -141,10 +163,11 @@ def exibir_menu_perfis(perfil_ativo: Optional[Dict]) -> bool:
             codigo, lista = perfil_controler.Listar_Seguidores(perfil_ativo['id'])
             if codigo == OK:
                 # resolve ids para nomes legíveis
+                _, por_id = perfil_controler.Busca_Perfis(lista)
                 nomes = []
                 for pid in lista:
-                    c, p = perfil_controler.Busca_Perfil(pid)
-                    if c == OK and p:
+                    p = por_id.get(pid)
+                    if p:
                         nomes.append(p.get("nome_usuario") or p.get("nome") or f"(#{pid})")
                     else:
                         nomes.append(f"(#{pid})")
@@ -158,16 +181,67 @@ def exibir_menu_perfis(perfil_ativo: Optional[Dict]) -> bool:
             codigo, lista = perfil_controler.Listar_Seguindo(perfil_ativo['id'])
             if codigo == OK:
                 # resolve ids para nomes legíveis
+                _, por_id = perfil_controler.Busca_Perfis(lista)
                 nomes = []
                 for pid in lista:
-                    c, p = perfil_controler.Busca_Perfil(pid)
-                    if c == OK and p:
+                    p = por_id.get(pid)
+                    if p:
                         nomes.append(p.get("nome_usuario") or p.get("nome") or f"(#{pid})")
                     else:
                         nomes.append(f"(#{pid})")
                 print("Seguindo:", ', '.join(nomes) if nomes else "(nenhum)")
             else:
                 print("❌ Erro ao obter lista de seguindo.")
+        elif opcao == "9":
+            if not perfil_ativo:
+                print("❌ Nenhum perfil ativo.")
+                continue
+            codigo, pagina = feed_controler.Feed_Perfil(perfil_ativo['id'], TAMANHO_PAGINA)
+            if codigo != OK:
+                print("❌ Erro ao carregar feed.")
+            elif not pagina["itens"]:
+                print("  (nada novo por aqui)")
+            else:
+                itens = pagina["itens"]
+                _, autores = perfil_controler.Busca_Perfis(a["id_perfil"] for a in itens)
+                _, jogos_por_id = jogo_controler.Busca_Jogos(a["id_jogo"] for a in itens)
+                for a in itens:
+                    autor = autores.get(a["id_perfil"], {})
+                    nome = autor.get("nome_usuario") or autor.get("nome") or f"(#{a['id_perfil']})"
+                    jogo = jogos_por_id.get(a["id_jogo"])
+                    titulo = jogo.get("titulo") if jogo else f"Jogo #{a['id_jogo']}"
+                    if a["tipo"] == "avaliacao":
+                        print(f"  👤 {nome} avaliou {titulo} com nota {a['valor']}")
+                    else:
+                        print(f"  👤 {nome} marcou {titulo} como {a['valor']}")
+        elif opcao == "10":
+            if not perfil_ativo:
+                print("❌ Nenhum perfil ativo.")
+                continue
+            codigo, sugestoes = grafo_controler.Sugestoes_Amigos(perfil_ativo['id'])
+            if codigo != OK:
+                print("❌ Erro ao gerar sugestões.")
+            elif not sugestoes:
+                print("  (sem sugestões por enquanto)")
+            else:
+                _, por_id = perfil_controler.Busca_Perfis(s["id_perfil"] for s in sugestoes)
+                for s in sugestoes:
+                    p = por_id.get(s["id_perfil"], {})
+                    nome = p.get("nome_usuario") or p.get("nome") or f"(#{s['id_perfil']})"
+                    print(f"  {s['id_perfil']} - {nome} ({s['em_comum']} conexões em comum)")
+        elif opcao == "11":
+            if not perfil_ativo:
+                print("❌ Nenhum perfil ativo.")
+                continue
+            _, similares = perfil_controler.Perfis_Similares(perfil_ativo['id'])
+            if not similares:
+                print("  (avalie mais jogos para encontrar perfis parecidos)")
+            else:
+                _, por_id = perfil_controler.Busca_Perfis(s["id_perfil"] for s in similares)
+                for s in similares:
+                    p = por_id.get(s["id_perfil"], {})
+                    nome = p.get("nome_usuario") or p.get("nome") or f"(#{s['id_perfil']})"
+                    print(f"  {s['id_perfil']} - {nome} ({s['similaridade']:.0%} parecido, {s['em_comum']} jogos em comum)")
         elif opcao == "0":
             # volta ao menu principal mantendo o perfil ativo
             return True
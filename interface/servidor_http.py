@@ -0,0 +1,359 @@
+# interface/servidor_http.py
+"""
+API HTTP/JSON local sobre os controladores, com asyncio (só biblioteca
+padrão). Uso:
+
+    python3 -m interface.servidor_http [--host 127.0.0.1] [--porta 8080]
+
+Cada chamada de controlador (que pode gravar os arquivos JSON) roda em um
+pool de threads, fora do laço de eventos; a segurança entre threads vem
+das travas de utils/travas.py. A resposta é sempre
+{"codigo": <utils.codigos>, "dados": ...} com o status HTTP
+correspondente (ver STATUS_HTTP). Nos PUT, o campo "versao" do corpo
+ativa a atualização condicional (409 se o registro mudou).
+"""
+import argparse
+import asyncio
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+from controles import avaliacao_controler
+from controles import biblioteca_controler
+from controles import estatisticas_controler
+from controles import favoritos_controler
+from controles import feed_controler
+from controles import grafo_controler
+from controles import jogo_controler
+from controles import perfil_controler
+from controles import ranking_controler
+from controles import recomendacao_controler
+from controles import resumo_controler
+from controles import tendencias_controler
+from utils.codigos import OK, DADOS_INVALIDOS, ERRO_DELETAR, CONFLITO, NAO_ENCONTRADO, ERRO_PERSISTENCIA
+
+STATUS_HTTP = {
+    OK: 200,
+    DADOS_INVALIDOS: 400,
+    NAO_ENCONTRADO: 404,
+    CONFLITO: 409,
+    ERRO_DELETAR: 500,
+    ERRO_PERSISTENCIA: 500,
+}
+MOTIVOS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+TAMANHO_MAXIMO_CORPO = 1 << 20
+TRABALHADORES = 8
+TEMPO_OCIOSO = 30.0
+
+# --- ROTAS ---
+# Cada manipulador recebe (parametros_do_caminho, consulta, corpo) e roda
+# no pool de threads; devolve (codigo, dado) como os controladores.
+
+Manipulador = Callable[[Dict[str, str], Dict[str, str], Dict[str, Any]], Tuple[int, Any]]
+_rotas: List[Tuple[str, "re.Pattern[str]", Manipulador, int]] = []
+
+def rota(metodo: str, caminho: str, status_criado: bool = False):
+    padrao = re.compile("^" + re.sub(r"{(\w+)}", r"(?P<\1>\\d+)", caminho) + "$")
+
+    def registrar(funcao: Manipulador) -> Manipulador:
+        _rotas.append((metodo, padrao, funcao, 201 if status_criado else 200))
+        return funcao
+    return registrar
+
+class ParametroInvalido(ValueError):
+    """Parâmetro da requisição que não pôde ser convertido (vira 400)."""
+
+def _int(valor: Optional[str], padrao: Optional[int] = None) -> Optional[int]:
+    if valor in (None, ""):
+        return padrao
+    try:
+        return int(valor)
+    except ValueError:
+        raise ParametroInvalido(valor) from None
+
+@rota("GET", "/jogos")
+def _listar_jogos(p, q, c):
+    return jogo_controler.Listar_Jogo_paginado(_int(q.get("tamanho"), 20), q.get("cursor"), q.get("ordenar_por", "id"))
+
+@rota("POST", "/jogos", status_criado=True)
+def _cadastrar_jogo(p, q, c):
+    return jogo_controler.Cadastrar_Jogo(c.get("titulo"), c.get("descricao"), c.get("genero"), None)
+
+@rota("GET", "/jogos/busca")
+def _pesquisar_jogo(p, q, c):
+    return jogo_controler.Pesquisar_Jogo(q.get("q", ""), _int(q.get("limite")))
+
+@rota("GET", "/jogos/ranking")
+def _ranking(p, q, c):
+    return ranking_controler.Top_Jogos(_int(q.get("n"), 10), q.get("genero"))
+
+@rota("GET", "/jogos/em-alta")
+def _em_alta(p, q, c):
+    return tendencias_controler.Jogos_em_Alta(q.get("janela", "semana"), _int(q.get("n"), 10))
+
+@rota("GET", "/jogos/{id}")
+def _busca_jogo(p, q, c):
+    return jogo_controler.Busca_Jogo(int(p["id"]))
+
+@rota("PUT", "/jogos/{id}")
+def _atualizar_jogo(p, q, c):
+    return jogo_controler.Atualizar_Jogo(int(p["id"]), c.get("titulo"), c.get("descricao"), c.get("genero"), None, c.get("versao"))
+
+@rota("DELETE", "/jogos/{id}")
+def _remover_jogo(p, q, c):
+    return jogo_controler.Remover_Jogo(int(p["id"]))
+
+@rota("GET", "/jogos/{id}/estatisticas")
+def _estatisticas_jogo(p, q, c):
+    return estatisticas_controler.Estatisticas_Jogo(int(p["id"]))
+
+@rota("GET", "/jogos/{id}/similares")
+def _jogos_similares(p, q, c):
+    return recomendacao_controler.Jogos_Similares(int(p["id"]), _int(q.get("n"), 10))
+
+@rota("GET", "/perfis")
+def _listar_perfis(p, q, c):
+    return perfil_controler.Listar_Perfil_paginado(_int(q.get("tamanho"), 20), q.get("cursor"), q.get("ordenar_por", "id"))
+
+@rota("POST", "/perfis", status_criado=True)
+def _criar_perfil(p, q, c):
+    return perfil_controler.Criar_Perfil(c.get("nome"), c.get("descricao"), c.get("avatar"))
+
+@rota("GET", "/perfis/{id}")
+def _busca_perfil(p, q, c):
+    return perfil_controler.Busca_Perfil(int(p["id"]))
+
+@rota("PUT", "/perfis/{id}")
+def _atualizar_perfil(p, q, c):
+    return perfil_controler.Atualizar_Dados(int(p["id"]), c.get("nome"), c.get("descricao"), c.get("avatar"), c.get("versao"))
+
+@rota("DELETE", "/perfis/{id}")
+def _desativar_conta(p, q, c):
+    return perfil_controler.Desativar_Conta(int(p["id"]))
+
+@rota("GET", "/perfis/{id}/seguidores")
+def _seguidores(p, q, c):
+    return perfil_controler.Listar_Seguidores(int(p["id"]))
+
+@rota("GET", "/perfis/{id}/seguindo")
+def _seguindo(p, q, c):
+    return perfil_controler.Listar_Seguindo(int(p["id"]))
+
+@rota("POST", "/perfis/{id}/seguindo/{alvo}")
+def _seguir(p, q, c):
+    return perfil_controler.Seguir_Perfil(int(p["id"]), int(p["alvo"]))
+
+@rota("DELETE", "/perfis/{id}/seguindo/{alvo}")
+def _parar_de_seguir(p, q, c):
+    return perfil_controler.Parar_de_Seguir(int(p["id"]), int(p["alvo"]))
+
+@rota("GET", "/perfis/{id}/mutuos")
+def _mutuos(p, q, c):
+    return grafo_controler.Seguidores_Mutuos(int(p["id"]))
+
+@rota("GET", "/perfis/{id}/sugestoes")
+def _sugestoes(p, q, c):
+    return grafo_controler.Sugestoes_Amigos(int(p["id"]), _int(q.get("profundidade"), 2), _int(q.get("n"), 10))
+
+@rota("GET", "/perfis/{id}/similares")
+def _perfis_similares(p, q, c):
+    return perfil_controler.Perfis_Similares(int(p["id"]), _int(q.get("n"), 10))
+
+@rota("GET", "/perfis/{id}/resumo")
+def _resumo(p, q, c):
+    return resumo_controler.Resumo_Perfil(int(p["id"]))
+
+@rota("GET", "/perfis/{id}/feed")
+def _feed(p, q, c):
+    return feed_controler.Feed_Perfil(int(p["id"]), _int(q.get("tamanho"), 20), _int(q.get("antes_de")))
+
+@rota("GET", "/perfis/{id}/recomendacoes")
+def _recomendacoes(p, q, c):
+    return recomendacao_controler.Recomendar_Jogos(int(p["id"]), _int(q.get("n"), 10))
+
+@rota("GET", "/perfis/{id}/favoritos")
+def _listar_favoritos(p, q, c):
+    return favoritos_controler.Listar_Favoritos(int(p["id"]))
+
+@rota("POST", "/perfis/{id}/favoritos/{id_jogo}")
+def _favoritar(p, q, c):
+    return favoritos_controler.Favoritar_Jogo(int(p["id"]), int(p["id_jogo"]))
+
+@rota("DELETE", "/perfis/{id}/favoritos/{id_jogo}")
+def _desfavoritar(p, q, c):
+    return favoritos_controler.Desfavoritar_Jogo(int(p["id"]), int(p["id_jogo"]))
+
+@rota("GET", "/perfis/{id}/biblioteca")
+def _listar_biblioteca(p, q, c):
+    if q.get("status"):
+        return biblioteca_controler.Listar_Biblioteca_por_status(int(p["id"]), q["status"])
+    return biblioteca_controler.Listar_Biblioteca(int(p["id"]))
+
+@rota("PUT", "/perfis/{id}/biblioteca/{id_jogo}")
+def _status_biblioteca(p, q, c):
+    id_perfil, id_jogo = int(p["id"]), int(p["id_jogo"])
+    codigo, dado = biblioteca_controler.Atualizar_Status_Jogo(id_perfil, id_jogo, c.get("status"))
+    if codigo == NAO_ENCONTRADO:
+        # ainda não está na biblioteca: PUT inclui
+        codigo, dado = biblioteca_controler.Adicionar_Jogo(id_perfil, id_jogo, c.get("status"))
+    return codigo, dado
+
+@rota("DELETE", "/perfis/{id}/biblioteca/{id_jogo}")
+def _remover_da_biblioteca(p, q, c):
+    return biblioteca_controler.Remover_Jogo(int(p["id"]), int(p["id_jogo"]))
+
+@rota("GET", "/avaliacoes")
+def _listar_avaliacoes(p, q, c):
+    return avaliacao_controler.Listar_avaliacao_paginado(_int(q.get("tamanho"), 20), q.get("cursor"), q.get("ordenar_por", "id"))
+
+@rota("POST", "/avaliacoes", status_criado=True)
+def _avaliar(p, q, c):
+    return avaliacao_controler.Avaliar_jogo(c.get("id_jogo"), c.get("score"), c.get("descricao", ""), c.get("id_perfil"))
+
+@rota("GET", "/avaliacoes/busca")
+def _buscar_avaliacoes(p, q, c):
+    return avaliacao_controler.Buscar_avaliacao(q.get("q", ""), _int(q.get("id_jogo")), _int(q.get("id_perfil")), _int(q.get("limite"), 10))
+
+@rota("GET", "/avaliacoes/{id}")
+def _busca_avaliacao(p, q, c):
+    return avaliacao_controler.Listar_avaliacao_por_id(int(p["id"]))
+
+@rota("PUT", "/avaliacoes/{id}")
+def _editar_avaliacao(p, q, c):
+    return avaliacao_controler.Editar_avaliacao(int(p["id"]), c.get("score"), c.get("descricao"), c.get("versao"))
+
+@rota("DELETE", "/avaliacoes/{id}")
+def _remover_avaliacao(p, q, c):
+    return avaliacao_controler.Remover_avaliacao(int(p["id"]))
+
+# --- DESPACHO ---
+
+def _resolver(metodo: str, caminho: str) -> Tuple[Optional[Manipulador], Dict[str, str], int]:
+    """Devolve (manipulador, parâmetros, status_sucesso); status 404/405 se não houver rota."""
+    caminho_existe = False
+    for metodo_rota, padrao, funcao, status in _rotas:
+        achado = padrao.match(caminho)
+        if achado:
+            caminho_existe = True
+            if metodo_rota == metodo:
+                return funcao, achado.groupdict(), status
+    return None, {}, 405 if caminho_existe else 404
+
+def _executar(funcao: Manipulador, parametros: Dict[str, str], consulta: Dict[str, str], corpo: Dict[str, Any], status_ok: int) -> Tuple[int, bytes]:
+    """Roda no pool: chama o controlador e já serializa a resposta."""
+    try:
+        codigo, dado = funcao(parametros, consulta, corpo)
+    except ParametroInvalido:
+        codigo, dado = DADOS_INVALIDOS, None
+    except Exception:
+        # falha interna do controlador (inclusive ValueError/TypeError vindos
+        # dele): o cliente recebe 500 em vez de ver a conexão cair
+        return 500, json.dumps({"codigo": None, "dados": None}).encode("utf-8")
+    status = status_ok if codigo == OK else STATUS_HTTP.get(codigo, 500)
+    # sem indent o json usa o codificador em C, que copia os itens de cada
+    # dict antes de percorrer (seguro mesmo com outra thread alterando)
+    return status, json.dumps({"codigo": codigo, "dados": dado}, ensure_ascii=False, default=str).encode("utf-8")
+
+async def _atender(leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter, executor: ThreadPoolExecutor) -> None:
+    laco = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                linha = await asyncio.wait_for(leitor.readline(), TEMPO_OCIOSO)
+            except asyncio.TimeoutError:
+                break
+            if not linha.strip():
+                break
+            try:
+                metodo, alvo, versao = linha.decode("latin-1").split()
+            except ValueError:
+                break
+
+            cabecalhos = {}
+            while True:
+                linha = await leitor.readline()
+                if linha in (b"\r\n", b"\n", b""):
+                    break
+                nome, _, valor = linha.decode("latin-1").partition(":")
+                cabecalhos[nome.strip().lower()] = valor.strip()
+
+            manter = cabecalhos.get("connection", "").lower() != "close" and versao == "HTTP/1.1"
+            try:
+                tamanho = int(cabecalhos.get("content-length") or 0)
+                if tamanho < 0:
+                    raise ValueError
+            except ValueError:
+                # sem tamanho confiável não há como achar o fim do corpo: responde e fecha
+                await _responder(escritor, 400, b'{"codigo": 1, "dados": null}', False)
+                break
+            if tamanho > TAMANHO_MAXIMO_CORPO:
+                await _responder(escritor, 413, b'{"codigo": 1, "dados": null}', False)
+                break
+            bruto = await leitor.readexactly(tamanho) if tamanho else b""
+
+            partes = urlsplit(alvo)
+            consulta = {k: v[-1] for k, v in parse_qs(partes.query).items()}
+            funcao, parametros, status = _resolver(metodo.upper(), partes.path.rstrip("/") or "/")
+            if funcao is None:
+                resposta = json.dumps({"codigo": None, "dados": None}).encode("utf-8")
+            else:
+                try:
+                    corpo = json.loads(bruto) if bruto else {}
+                    if not isinstance(corpo, dict):
+                        raise ValueError
+                except ValueError:
+                    status, resposta = 400, json.dumps({"codigo": DADOS_INVALIDOS, "dados": None}).encode("utf-8")
+                else:
+                    status, resposta = await laco.run_in_executor(executor, _executar, funcao, parametros, consulta, corpo, status)
+            await _responder(escritor, status, resposta, manter)
+            if not manter:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        escritor.close()
+
+async def _responder(escritor: asyncio.StreamWriter, status: int, corpo: bytes, manter: bool) -> None:
+    cabecalho = (
+        f"HTTP/1.1 {status} {MOTIVOS.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(corpo)}\r\n"
+        f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n"
+    )
+    escritor.write(cabecalho.encode("latin-1") + corpo)
+    await escritor.drain()
+
+async def iniciar_servidor(host: str = "127.0.0.1", porta: int = 8080, trabalhadores: int = TRABALHADORES) -> asyncio.AbstractServer:
+    """Abre o servidor (porta 0 = escolhida pelo sistema) e devolve o asyncio.Server."""
+    executor = ThreadPoolExecutor(max_workers=trabalhadores, thread_name_prefix="controles")
+    servidor = await asyncio.start_server(lambda l, e: _atender(l, e, executor), host, porta)
+    servidor.executor = executor
+    return servidor
+
+async def _servir(host: str, porta: int) -> None:
+    servidor = await iniciar_servidor(host, porta)
+    endereco = servidor.sockets[0].getsockname()
+    print(f"🌐 Servindo em http://{endereco[0]}:{endereco[1]} (Ctrl+C para sair)")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        servidor.executor.shutdown(wait=True)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="API HTTP/JSON do Letterbox Games.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8080)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_servir(args.host, args.porta))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,5 @@
 import pytest
-from utils.codigos import OK, DADOS_INVALIDOS, NAO_ENCONTRADO
+from utils.codigos import OK, DADOS_INVALIDOS, NAO_ENCONTRADO, CONFLITO
 import dados.database as db
 import controles.avaliacao_controler as aval_ctrl
 import controles.perfil_controler as perfil_ctrl
@@ -63,4 +63,79 @@ def test_remover_avaliacao_atualiza_media():
     assert c_rm == OK
     
     # Deve sobrar apenas a nota 10.0 do p1
-    assert jogo["nota_geral"] == pytest.approx(10.0)
\ No newline at end of file
+    assert jogo["nota_geral"] == pytest.approx(10.0)
+
+def test_avaliar_em_lote_codigos_e_media():
+    _, p1 = perfil_ctrl.Criar_Perfil("l1")
+    _, p2 = perfil_ctrl.Criar_Perfil("l2")
+    db.jogos.append({"id": 2, "titulo": "Portal 2", "genero": "Puzzle", "descricao": "", "nota_geral": 0.0})
+    aval_ctrl.Avaliar_jogo(1, 4.0, "", p1["id"])
+
+    code, resultados = aval_ctrl.Avaliar_jogos_em_lote([
+        {"id_jogo": 1, "score": 8.0, "descricao": "bom", "id_perfil": p2["id"]},
+        (2, 9.0, "ótimo", p1["id"]),
+        (2, 7.0, "", p2["id"]),
+        (1, 6.0, "", p1["id"]),     # p1 já avaliou o jogo 1
+        (2, 5.0, "", p2["id"]),     # duplicado dentro do próprio lote
+        (1, 11.0, "", p2["id"]),    # nota fora da faixa (checada antes da duplicidade)
+        (999, 5.0, "", p1["id"]),   # jogo inexistente
+        (1, 5.0, ""),               # item malformado
+    ])
+    assert code == OK
+    assert [c for c, _ in resultados] == [OK, OK, OK, CONFLITO, CONFLITO, DADOS_INVALIDOS, NAO_ENCONTRADO, DADOS_INVALIDOS]
+
+    jogo1 = next(j for j in db.jogos if j["id"] == 1)
+    jogo2 = next(j for j in db.jogos if j["id"] == 2)
+    assert jogo1["nota_geral"] == pytest.approx(6.0)   # (4 + 8) / 2
+    assert jogo2["nota_geral"] == pytest.approx(8.0)   # (9 + 7) / 2
+    assert len({a["id"] for a in db.avaliacoes}) == 4
+
+def test_avaliar_em_lote_ids_nao_hashaveis_e_atividade(monkeypatch):
+    from controles import eventos
+    atividades = []
+    monkeypatch.setattr(eventos, "atividade_registrada", lambda autor, tipo, id_jogo, valor: atividades.append((autor["id"], tipo, id_jogo, valor)))
+    _, p = perfil_ctrl.Criar_Perfil("lote")
+
+    _, resultados = aval_ctrl.Avaliar_jogos_em_lote([
+        ([1], 5.0, "", p["id"]),
+        (1, 5.0, "", {"id": p["id"]}),
+        (1, 8.0, "", p["id"]),
+    ])
+    assert [c for c, _ in resultados] == [DADOS_INVALIDOS, DADOS_INVALIDOS, OK]
+    assert atividades == [(p["id"], "avaliacao", 1, 8.0)]
+
+def test_editar_avaliacao_com_versao():
+    _, perfil = perfil_ctrl.Criar_Perfil("versionado")
+    _, av = aval_ctrl.Avaliar_jogo(1, 5.0, "ok", perfil["id"])
+    assert av["versao"] == 1
+
+    code, av = aval_ctrl.Editar_avaliacao(av["id"], 7.0, None, versao=1)
+    assert code == OK and av["versao"] == 2
+    # Escritor com leitura antiga perde a corrida e nada é alterado
+    assert aval_ctrl.Editar_avaliacao(av["id"], 1.0, None, versao=1) == (CONFLITO, None)
+    assert av["score"] == 7.0
+    # Sem versão, a edição continua incondicional
+    assert aval_ctrl.Editar_avaliacao(av["id"], None, "ótimo")[1]["versao"] == 3
+
+def test_edicao_e_aviso_aos_indices_sao_atomicos(monkeypatch):
+    import threading
+    from controles import eventos
+    from controles import estatisticas_controler as est_ctrl
+    _, perfil = perfil_ctrl.Criar_Perfil("corrida")
+    _, av = aval_ctrl.Avaliar_jogo(1, 8.0, "", perfil["id"])
+    est_ctrl._descartar()
+
+    leitor = threading.Thread(target=est_ctrl.Estatisticas_Jogo, args=(1,))
+    original = eventos.avaliacao_alterada
+
+    def com_leitor_no_meio(anterior, atual):
+        # um leitor que constrói o índice tenta entrar entre a escrita e o aviso
+        leitor.start()
+        leitor.join(0.2)
+        original(anterior, atual)
+    monkeypatch.setattr(eventos, "avaliacao_alterada", com_leitor_no_meio)
+
+    aval_ctrl.Editar_avaliacao(av["id"], 3.0, None)
+    leitor.join(5)
+    _, estat = est_ctrl.Estatisticas_Jogo(1)
+    assert estat["quantidade"] == 1
@@ -0,0 +1,82 @@
+import pytest
+from utils.codigos import OK, DADOS_INVALIDOS
+import dados.database as db
+import controles.avaliacao_controler as aval_ctrl
+import controles.busca_controler as busca_ctrl
+import controles.jogo_controler as jogo_ctrl
+import controles.perfil_controler as perfil_ctrl
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    busca_ctrl._descartar_indice()
+
+    db.jogos.extend([
+        {"id": 1, "titulo": "Dark Souls", "genero": "RPG", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Hollow Knight", "genero": "Metroidvania", "descricao": "", "nota_geral": 0.0},
+    ])
+    yield
+
+def _ids(lista):
+    return [a["id"] for a in lista]
+
+def test_busca_com_acentos_e_ranqueamento():
+    _, p1 = perfil_ctrl.Criar_Perfil("b1")
+    _, p2 = perfil_ctrl.Criar_Perfil("b2")
+    _, a1 = aval_ctrl.Avaliar_jogo(1, 9.0, "A luta contra o chefe é épica", p1["id"])
+    _, a2 = aval_ctrl.Avaliar_jogo(2, 8.0, "Chefe difícil, chefe memorável, exploração ótima", p1["id"])
+    aval_ctrl.Avaliar_jogo(1, 7.0, "Trilha sonora bonita", p2["id"])
+
+    # "epica" sem acento encontra "épica"
+    code, res = aval_ctrl.Buscar_avaliacao("epica")
+    assert code == OK and _ids(res) == [a1["id"]]
+
+    # Mais ocorrências de "chefe" ranqueiam primeiro
+    code, res = aval_ctrl.Buscar_avaliacao("chefe")
+    assert _ids(res) == [a2["id"], a1["id"]]
+
+    code, _ = aval_ctrl.Buscar_avaliacao("de o a")
+    assert code == DADOS_INVALIDOS
+
+def test_filtros_por_jogo_e_autor():
+    _, p1 = perfil_ctrl.Criar_Perfil("f1")
+    _, p2 = perfil_ctrl.Criar_Perfil("f2")
+    _, a1 = aval_ctrl.Avaliar_jogo(1, 9.0, "boss fight incrível", p1["id"])
+    _, a2 = aval_ctrl.Avaliar_jogo(2, 8.0, "boss fight justo", p2["id"])
+
+    _, res = aval_ctrl.Buscar_avaliacao("boss fight", id_jogo=2)
+    assert _ids(res) == [a2["id"]]
+    _, res = aval_ctrl.Buscar_avaliacao("boss fight", id_perfil=p1["id"])
+    assert _ids(res) == [a1["id"]]
+
+def test_indice_incremental_editar_e_remover():
+    _, p1 = perfil_ctrl.Criar_Perfil("i1")
+    _, a1 = aval_ctrl.Avaliar_jogo(1, 9.0, "roguelike viciante", p1["id"])
+    _, res = aval_ctrl.Buscar_avaliacao("viciante")  # constrói o índice
+    assert _ids(res) == [a1["id"]]
+
+    # Avaliação criada depois da construção também é indexada
+    _, a2 = aval_ctrl.Avaliar_jogo(2, 6.0, "também viciante", p1["id"])
+    _, res = aval_ctrl.Buscar_avaliacao("viciante")
+    assert set(_ids(res)) == {a1["id"], a2["id"]}
+
+    aval_ctrl.Editar_avaliacao(a1["id"], None, "cansativo")
+    _, res = aval_ctrl.Buscar_avaliacao("viciante")
+    assert _ids(res) == [a2["id"]]
+    _, res = aval_ctrl.Buscar_avaliacao("cansativo")
+    assert _ids(res) == [a1["id"]]
+
+    aval_ctrl.Remover_avaliacao(a2["id"])
+    _, res = aval_ctrl.Buscar_avaliacao("viciante")
+    assert res == []
+
+    # Remoção de jogo em cascata também limpa o índice
+    jogo_ctrl.Remover_Jogo(1)
+    _, res = aval_ctrl.Buscar_avaliacao("cansativo")
+    assert res == []
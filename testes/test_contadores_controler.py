@@ -0,0 +1,77 @@
+import pytest
+from utils.codigos import OK, DADOS_INVALIDOS
+from utils.esbocos import HyperLogLog, CountMin
+import dados.database as db
+import controles.avaliacao_controler as aval_ctrl
+import controles.biblioteca_controler as bib_ctrl
+import controles.contadores_controler as cont_ctrl
+import controles.favoritos_controler as fav_ctrl
+import controles.perfil_controler as perfil_ctrl
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    cont_ctrl._descartar()
+
+    db.jogos.extend([
+        {"id": 1, "titulo": "God of War", "genero": "Ação", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Portal 2", "genero": "Puzzle", "descricao": "", "nota_geral": 0.0},
+    ])
+    yield
+
+def test_hyperloglog_estima_e_mescla():
+    a, b = HyperLogLog(), HyperLogLog()
+    for i in range(6000):
+        a.adicionar(i)
+    for i in range(3000, 9000):
+        b.adicionar(i)
+    assert abs(a.estimar() - 6000) / 6000 < 0.08
+    a.mesclar(b)
+    assert abs(a.estimar() - 9000) / 9000 < 0.08
+    with pytest.raises(ValueError):
+        a.mesclar(HyperLogLog(12))
+
+def test_countmin_nunca_subestima():
+    cms = CountMin(256, 4)
+    for i in range(2000):
+        cms.adicionar(i % 50)
+    assert all(cms.estimar(k) >= 40 for k in range(50))
+    outro = CountMin(256, 4)
+    outro.adicionar("x", 5)
+    cms.mesclar(outro)
+    assert cms.estimar("x") >= 5
+
+def test_contadores_alimentados_pelos_eventos():
+    ids = [perfil_ctrl.Criar_Perfil(n)[1]["id"] for n in ("a", "b", "c")]
+    aval_ctrl.Avaliar_jogo(1, 8.0, "", ids[0])
+    assert cont_ctrl.Jogadores_Distintos(1) == (OK, 1)
+
+    bib_ctrl.Adicionar_Jogo(ids[0], 1, "jogando")
+    bib_ctrl.Adicionar_Jogo(ids[1], 1, "jogando")
+    bib_ctrl.Atualizar_Status_Jogo(ids[1], 1, "jogado")
+    fav_ctrl.Favoritar_Jogo(ids[2], 1)
+
+    assert cont_ctrl.Jogadores_Distintos(1) == (OK, 3)
+    assert cont_ctrl.Frequencia_Evento(1, "biblioteca") == (OK, 2)
+    assert cont_ctrl.Frequencia_Evento(2, "favorito") == (OK, 0)
+    assert cont_ctrl.Frequencia_Evento(1, "compra")[0] == DADOS_INVALIDOS
+
+def test_mesclar_contadores_de_outro_fragmento():
+    _, p = perfil_ctrl.Criar_Perfil("a")
+    fav_ctrl.Favoritar_Jogo(p["id"], 2)
+
+    outro = {"distintos": {2: HyperLogLog(cont_ctrl.PRECISAO_HLL)},
+             "frequencias": CountMin(cont_ctrl.LARGURA_CMS, cont_ctrl.PROFUNDIDADE_CMS)}
+    outro["distintos"][2].adicionar(999)
+    outro["frequencias"].adicionar(("favorito", 2))
+
+    assert cont_ctrl.Mesclar_Contadores(outro) == (OK, None)
+    assert cont_ctrl.Jogadores_Distintos(2) == (OK, 2)
+    assert cont_ctrl.Frequencia_Evento(2, "favorito") == (OK, 2)
+    assert cont_ctrl.Mesclar_Contadores({"distintos": {2: HyperLogLog(4)}})[0] == DADOS_INVALIDOS
@@ -0,0 +1,100 @@
+import pytest
+from utils.codigos import OK, NAO_ENCONTRADO
+import dados.database as db
+import controles.avaliacao_controler as aval_ctrl
+import controles.estatisticas_controler as est_ctrl
+import controles.jogo_controler as jogo_ctrl
+import controles.perfil_controler as perfil_ctrl
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    est_ctrl._descartar()
+
+    db.jogos.extend([
+        {"id": 1, "titulo": "God of War", "genero": "Ação", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Portal 2", "genero": "Puzzle", "descricao": "", "nota_geral": 0.0},
+    ])
+    yield
+
+def _perfis(n):
+    return [perfil_ctrl.Criar_Perfil(f"est{i}")[1]["id"] for i in range(n)]
+
+def test_estatisticas_por_jogo():
+    ids = _perfis(4)
+    for id_perfil, nota in zip(ids, [2.0, 4.0, 4.0, 10.0]):
+        aval_ctrl.Avaliar_jogo(1, nota, "", id_perfil)
+
+    code, est = est_ctrl.Estatisticas_Jogo(1)
+    assert code == OK
+    assert est["quantidade"] == 4
+    assert est["media"] == pytest.approx(5.0)
+    assert est["mediana"] == pytest.approx(4.0)
+    assert est["desvio_padrao"] == pytest.approx(3.0)
+    assert est["histograma"] == [0, 0, 1, 0, 2, 0, 0, 0, 0, 0, 1]
+
+    assert est_ctrl.Estatisticas_Jogo(2)[0] == NAO_ENCONTRADO
+
+def test_estatisticas_incrementais():
+    ids = _perfis(3)
+    aval_ctrl.Avaliar_jogo(1, 6.0, "", ids[0])
+    est_ctrl.Estatisticas_Catalogo()  # constrói os agrupamentos
+
+    _, nova = aval_ctrl.Avaliar_jogo(1, 8.0, "", ids[1])
+    aval_ctrl.Avaliar_jogos_em_lote([(2, 3.0, "", ids[0]), (2, 5.0, "", ids[2])])
+    _, est = est_ctrl.Estatisticas_Jogo(1)
+    assert est["quantidade"] == 2 and est["mediana"] == pytest.approx(7.0)
+
+    aval_ctrl.Editar_avaliacao(nova["id"], 10.0, None)
+    _, est = est_ctrl.Estatisticas_Jogo(1)
+    assert est["media"] == pytest.approx(8.0)
+
+    aval_ctrl.Remover_avaliacao(nova["id"])
+    _, catalogo = est_ctrl.Estatisticas_Catalogo()
+    assert catalogo[1]["quantidade"] == 1
+    assert catalogo[2]["media"] == pytest.approx(4.0)
+
+    # Remover o jogo remove as avaliações em cascata
+    jogo_ctrl.Remover_Jogo(2)
+    _, catalogo = est_ctrl.Estatisticas_Catalogo()
+    assert set(catalogo) == {1}
+
+    # O estado incremental coincide com uma reconstrução completa
+    incremental = dict(catalogo)
+    est_ctrl._descartar()
+    assert est_ctrl.Estatisticas_Catalogo()[1] == incremental
+
+def test_consulta_nao_espera_escritor_depois_de_construida():
+    import threading
+    from utils import travas
+    ids = _perfis(1)
+    aval_ctrl.Avaliar_jogo(1, 6.0, "", ids[0])
+    est_ctrl.Estatisticas_Jogo(1)  # constrói o índice
+
+    dentro, liberar, resultado = threading.Event(), threading.Event(), []
+
+    def escritor_longo():
+        with travas.travar(escrita=("avaliacoes",)):
+            dentro.set()
+            liberar.wait(5)
+
+    escritor = threading.Thread(target=escritor_longo)
+    escritor.start()
+    dentro.wait(5)
+    leitor = threading.Thread(target=lambda: resultado.append(est_ctrl.Estatisticas_Catalogo()))
+    leitor.start()
+    leitor.join(2)
+    terminou = not leitor.is_alive()
+    liberar.set()
+    escritor.join(5)
+    leitor.join(5)
+    assert terminou
+    assert resultado[0][1][1]["quantidade"] == 1
+    # a projeção colunar vem do instantâneo, sem trava
+    assert list(est_ctrl.Colunas_Avaliacoes()[1]["score"]) == [6.0]
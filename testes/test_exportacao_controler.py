@@ -0,0 +1,55 @@
+import csv
+import json
+import pytest
+from utils.codigos import OK, DADOS_INVALIDOS, NAO_ENCONTRADO
+import dados.database as db
+import controles.exportacao_controler as exp_ctrl
+
+@pytest.fixture(autouse=True)
+def clean_db():
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+
+    db.jogos.extend([
+        {"id": 1, "titulo": "God of War", "genero": "Ação", "descricao": "", "nota_geral": 8.0},
+        {"id": 2, "titulo": "Portal 2", "genero": "Puzzle", "descricao": "", "nota_geral": 0.0},
+    ])
+    db.perfis.extend([
+        {"id": 1, "nome": "ana", "nome_usuario": "ana", "descricao": "", "avatar": "",
+         "seguidores": [2], "seguindo": [], "jogando": 1, "jogados": 0, "platinados": 0,
+         "favoritos": [1, 2], "biblioteca": [{"id_jogo": 1, "status": "jogando"}]},
+        {"id": 2, "nome": "bia", "nome_usuario": "bia", "descricao": "", "avatar": "",
+         "seguidores": [], "seguindo": [1], "jogando": 0, "jogados": 0, "platinados": 0,
+         "favoritos": [], "biblioteca": []},
+    ])
+    db.avaliacoes.append({"id": 1, "id_jogo": 1, "id_perfil": 1, "score": 8.0, "descricao": "ótimo"})
+    db.publicar_instantaneos()
+    yield
+
+def test_exportar_jsonl(tmp_path):
+    code, resumo = exp_ctrl.Exportar_Dados(str(tmp_path))
+    assert code == OK
+    assert resumo == {"perfis.jsonl": 2, "jogos.jsonl": 2, "avaliacoes.jsonl": 1}
+
+    linhas = (tmp_path / "perfis.jsonl").read_text(encoding="utf-8").splitlines()
+    assert json.loads(linhas[0])["favoritos"] == [1, 2]
+    assert json.loads((tmp_path / "avaliacoes.jsonl").read_text(encoding="utf-8"))["descricao"] == "ótimo"
+
+def test_exportar_csv_com_arestas(tmp_path):
+    code, resumo = exp_ctrl.Exportar_Dados(str(tmp_path), "csv", arestas=True)
+    assert code == OK
+    assert resumo["perfil_favoritos.csv"] == 2
+    assert resumo["perfil_biblioteca.csv"] == 1
+    assert resumo["perfil_seguidores.csv"] == 1
+
+    with open(tmp_path / "perfis.csv", encoding="utf-8", newline="") as f:
+        linhas = list(csv.DictReader(f))
+    assert "favoritos" not in linhas[0] and linhas[1]["nome"] == "bia"
+
+    with open(tmp_path / "perfil_seguidores.csv", encoding="utf-8", newline="") as f:
+        assert list(csv.DictReader(f)) == [{"id_perfil": "1", "id_seguidor": "2"}]
+
+def test_exportar_parametros_invalidos(tmp_path):
+    assert exp_ctrl.Exportar_Dados(str(tmp_path), "xml")[0] == DADOS_INVALIDOS
+    assert exp_ctrl.Exportar_Dados(str(tmp_path / "nao_existe"))[0] == NAO_ENCONTRADO
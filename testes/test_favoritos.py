@@ -12,6 +12,7 @@ def clean_db(monkeypatch):
     db.jogos.clear()
     db.jogos.extend([
         {"id": 1, "titulo": "God of War", "genero": "Ação", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Portal 2", "genero": "Puzzle", "descricao": "", "nota_geral": 0.0},
     ])
     yield
 
@@ -29,4 +30,16 @@ def test_favoritar_desfavoritar_listar():
     code_des, _ = fav_ctrl.Desfavoritar_Jogo(p["id"], 1)
     assert code_des == OK
     code_des_again, _ = fav_ctrl.Desfavoritar_Jogo(p["id"], 1)
-    assert code_des_again == NAO_ENCONTRADO
\ No newline at end of file
+    assert code_des_again == NAO_ENCONTRADO
+
+def test_favoritar_e_desfavoritar_em_lote():
+    _, p = perfil_ctrl.Criar_Perfil("lotefav")
+    fav_ctrl.Favoritar_Jogo(p["id"], 2)
+
+    code, codigos = fav_ctrl.Favoritar_Jogos_em_lote(p["id"], [1, 2, 999, 1])
+    assert code == OK and codigos == [OK, CONFLITO, NAO_ENCONTRADO, CONFLITO]
+    assert p["favoritos"] == [2, 1]
+
+    code, codigos = fav_ctrl.Desfavoritar_Jogos_em_lote(p["id"], [2, 2])
+    assert codigos == [OK, NAO_ENCONTRADO]
+    assert p["favoritos"] == [1]
@@ -0,0 +1,94 @@
+import pytest
+from utils.codigos import OK, NAO_ENCONTRADO
+import dados.database as db
+import controles.avaliacao_controler as aval_ctrl
+import controles.biblioteca_controler as bib_ctrl
+import controles.feed_controler as feed_ctrl
+import controles.perfil_controler as perfil_ctrl
+import controles.seguidores_controler as seg_ctrl
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    feed_ctrl._descartar()
+
+    db.jogos.extend([
+        {"id": 1, "titulo": "God of War", "genero": "Ação", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Portal 2", "genero": "Puzzle", "descricao": "", "nota_geral": 0.0},
+    ])
+    yield
+
+def _tipos(itens):
+    return [(a["tipo"], a["id_perfil"], a["id_jogo"], a["valor"]) for a in itens]
+
+def test_feed_recebe_atividades_dos_seguidos():
+    _, leitor = perfil_ctrl.Criar_Perfil("leitor")
+    _, amigo = perfil_ctrl.Criar_Perfil("amigo")
+    _, estranho = perfil_ctrl.Criar_Perfil("estranho")
+    seg_ctrl.Seguir_Perfil(leitor["id"], amigo["id"])
+
+    aval_ctrl.Avaliar_jogo(1, 9.0, "", amigo["id"])
+    bib_ctrl.Adicionar_Jogo(amigo["id"], 2, "jogando")
+    bib_ctrl.Atualizar_Status_Jogo(amigo["id"], 2, "platinado")
+    aval_ctrl.Avaliar_jogo(2, 5.0, "", estranho["id"])
+
+    code, pagina = feed_ctrl.Feed_Perfil(leitor["id"], 2)
+    assert code == OK
+    assert _tipos(pagina["itens"]) == [
+        ("biblioteca", amigo["id"], 2, "platinado"),
+        ("biblioteca", amigo["id"], 2, "jogando"),
+    ]
+    _, pagina2 = feed_ctrl.Feed_Perfil(leitor["id"], 2, pagina["proximo_cursor"])
+    assert _tipos(pagina2["itens"]) == [("avaliacao", amigo["id"], 1, 9.0)]
+    assert pagina2["proximo_cursor"] is None
+
+    # Depois de deixar de seguir, as atividades do autor somem do feed
+    seg_ctrl.Parar_de_Seguir(leitor["id"], amigo["id"])
+    assert feed_ctrl.Feed_Perfil(leitor["id"])[1]["itens"] == []
+    assert feed_ctrl.Feed_Perfil(999)[0] == NAO_ENCONTRADO
+
+def test_celebridade_usa_fan_out_na_leitura(monkeypatch):
+    monkeypatch.setattr(feed_ctrl, "LIMIAR_CELEBRIDADE", 1)
+    _, famoso = perfil_ctrl.Criar_Perfil("famoso")
+    _, f1 = perfil_ctrl.Criar_Perfil("f1")
+    _, f2 = perfil_ctrl.Criar_Perfil("f2")
+    seg_ctrl.Seguir_Perfil(f1["id"], famoso["id"])
+
+    aval_ctrl.Avaliar_jogo(1, 10.0, "", famoso["id"])        # 1 seguidor: fan-out normal
+    seg_ctrl.Seguir_Perfil(f2["id"], famoso["id"])
+    bib_ctrl.Adicionar_Jogo(famoso["id"], 2, "jogado")        # 2 seguidores: só caixa de saída
+
+    assert feed_ctrl._timelines[f1["id"]][-1]["tipo"] == "avaliacao"
+    assert f2["id"] not in feed_ctrl._timelines
+
+    _, pagina = feed_ctrl.Feed_Perfil(f1["id"])
+    # Sem duplicatas: a avaliação veio da timeline e também da caixa de saída
+    assert _tipos(pagina["itens"]) == [
+        ("biblioteca", famoso["id"], 2, "jogado"),
+        ("avaliacao", famoso["id"], 1, 10.0),
+    ]
+    _, pagina = feed_ctrl.Feed_Perfil(f2["id"])
+    assert len(pagina["itens"]) == 2
+
+def test_perfil_removido_sai_do_feed():
+    _, leitor = perfil_ctrl.Criar_Perfil("leitor")
+    _, amigo = perfil_ctrl.Criar_Perfil("amigo")
+    seg_ctrl.Seguir_Perfil(amigo["id"], leitor["id"])
+    seg_ctrl.Seguir_Perfil(leitor["id"], amigo["id"])
+    aval_ctrl.Avaliar_jogo(1, 9.0, "", leitor["id"])
+    aval_ctrl.Avaliar_jogo(2, 7.0, "", amigo["id"])
+    assert feed_ctrl.Feed_Perfil(leitor["id"])[1]["itens"]
+
+    perfil_ctrl.Desativar_Conta(leitor["id"])
+    assert leitor["id"] not in feed_ctrl._timelines
+    assert leitor["id"] not in feed_ctrl._publicacoes
+    assert feed_ctrl.Feed_Perfil(leitor["id"])[0] == NAO_ENCONTRADO
+    # perfis criados depois do mapa montado também são achados
+    _, novo = perfil_ctrl.Criar_Perfil("novo")
+    assert feed_ctrl.Feed_Perfil(novo["id"]) == (OK, {"itens": [], "proximo_cursor": None})
@@ -0,0 +1,113 @@
+import pytest
+from utils.codigos import OK, CONFLITO, NAO_ENCONTRADO
+import dados.database as db
+from controles.fragmentos_controler import MotorFragmentado, fragmento_do_perfil
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    db.jogos.extend([
+        {"id": 1, "titulo": "God of War", "genero": "Ação", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Portal 2", "genero": "Puzzle", "descricao": "", "nota_geral": 0.0},
+    ])
+    yield
+
+@pytest.fixture(scope="module")
+def motor():
+    # Os processos recebem as coleções vazias (a fixture acima roda antes)
+    db.perfis.clear()
+    db.avaliacoes.clear()
+    db.jogos[:] = [
+        {"id": 1, "titulo": "God of War", "genero": "Ação", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Portal 2", "genero": "Puzzle", "descricao": "", "nota_geral": 0.0},
+    ]
+    with MotorFragmentado(2) as m:
+        yield m
+
+def _perfis_em_fragmentos_diferentes(motor, prefixo):
+    ids = []
+    for i in range(10):
+        codigo, perfil = motor.criar_perfil(f"{prefixo}{i}")
+        assert codigo == OK
+        ids.append(perfil["id"])
+    a = ids[0]
+    b = next(i for i in ids if fragmento_do_perfil(i, 2) != fragmento_do_perfil(a, 2))
+    return a, b, ids
+
+def test_ids_e_nomes_globais(motor):
+    a, b, ids = _perfis_em_fragmentos_diferentes(motor, "global")
+    assert len(set(ids)) == len(ids)
+    assert motor.criar_perfil("GLOBAL0")[0] == CONFLITO
+    assert motor.busca_perfil(b)[1]["nome"].startswith("global")
+
+def test_seguir_entre_fragmentos_e_desativar(motor):
+    a, b, _ = _perfis_em_fragmentos_diferentes(motor, "seg")
+    versao = motor.busca_perfil(a)[1]["versao"]
+    assert motor.seguir(a, b) == (OK, None)
+    assert motor.seguir(a, b)[0] == CONFLITO
+    assert b in motor.busca_perfil(a)[1]["seguindo"]
+    assert a in motor.busca_perfil(b)[1]["seguidores"]
+    assert motor.busca_perfil(a)[1]["versao"] == versao + 1
+
+    assert motor.desativar_conta(b) == (OK, None)
+    assert motor.busca_perfil(b)[0] == NAO_ENCONTRADO
+    assert b not in motor.busca_perfil(a)[1]["seguindo"]
+    assert motor.busca_perfil(a)[1]["versao"] == versao + 2
+    assert motor.seguir(a, b)[0] == NAO_ENCONTRADO
+
+def test_notas_globais_e_remocao_de_jogo(motor):
+    a, b, _ = _perfis_em_fragmentos_diferentes(motor, "nota")
+    _, resultados = motor.avaliar_em_lote([(1, 10.0, "", a), (1, 6.0, "", b), (2, 7.0, "", a)])
+    assert [c for c, _ in resultados] == [OK, OK, OK]
+    assert len({av["id"] for _, av in resultados}) == 3
+
+    assert motor.busca_jogo(1)[1]["nota_geral"] == 8.0
+    codigo, jogo = motor.cadastrar_jogo("Celeste", "", "Plataforma")
+    assert codigo == OK
+    motor.avaliar_jogo(jogo["id"], 9.0, "", b)
+
+    assert motor.remover_jogo(1) == (OK, None)
+    _, dados = motor.consolidar()
+    assert {j["titulo"] for j in dados["jogos"]} == {"Portal 2", "Celeste"}
+    assert all(av["id_jogo"] != 1 for av in dados["avaliacoes"])
+    assert next(j for j in dados["jogos"] if j["titulo"] == "Celeste")["nota_geral"] == 9.0
+
+def test_replicas_divergentes_do_catalogo_levantam_erro(motor):
+    # jogo que só existe no fragmento 0: a próxima alocação de id diverge
+    _, so_no_zero = motor._chamar(0, "cadastrar_jogo", "Só no zero", "", "Teste", None)
+    with pytest.raises(RuntimeError, match="divergiram"):
+        motor.cadastrar_jogo("Hades", "", "Roguelike")
+    assert all(j["titulo"] != "Hades" for j in motor._chamar(1, "listar_jogos")[1])
+    assert all(j["titulo"] != "Hades" for j in motor._chamar(0, "listar_jogos")[1])
+
+    with pytest.raises(RuntimeError, match="divergiram"):
+        motor.remover_jogo(so_no_zero["id"])
+    assert motor.cadastrar_jogo("Hades", "", "Roguelike")[0] == OK
+
+def test_falha_ao_desfazer_seguir_e_levantada(motor, monkeypatch):
+    from utils.codigos import DADOS_INVALIDOS
+    a, b, _ = _perfis_em_fragmentos_diferentes(motor, "desfaz")
+    chamar = motor._chamar
+    falhas = {"desfazer": False}
+
+    def chamar_com_falha(fragmento, operacao, *args):
+        if operacao == "ligar" and args[1] == "seguidores":
+            return DADOS_INVALIDOS, None
+        if operacao == "ligar" and args[3] is False and falhas["desfazer"]:
+            return NAO_ENCONTRADO, None
+        return chamar(fragmento, operacao, *args)
+    monkeypatch.setattr(motor, "_chamar", chamar_com_falha)
+
+    # segundo passo falha e o primeiro é desfeito
+    assert motor.seguir(a, b) == (DADOS_INVALIDOS, None)
+    assert b not in chamar(fragmento_do_perfil(a, 2), "busca_perfil", a)[1].get("seguindo", [])
+
+    falhas["desfazer"] = True
+    with pytest.raises(RuntimeError, match="desfazer"):
+        motor.seguir(a, b)
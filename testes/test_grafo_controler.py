@@ -0,0 +1,66 @@
+import pytest
+from utils.codigos import OK, NAO_ENCONTRADO, DADOS_INVALIDOS
+import dados.database as db
+import controles.grafo_controler as grafo_ctrl
+import controles.perfil_controler as perfil_ctrl
+import controles.seguidores_controler as seg_ctrl
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    grafo_ctrl._descartar()
+    yield
+
+def _criar(*nomes):
+    return [perfil_ctrl.Criar_Perfil(n)[1]["id"] for n in nomes]
+
+def test_mutuos_e_mais_seguidos():
+    a, b, c = _criar("a", "b", "c")
+    seg_ctrl.Seguir_Perfil(a, b)
+    seg_ctrl.Seguir_Perfil(b, a)
+    seg_ctrl.Seguir_Perfil(c, b)
+
+    assert grafo_ctrl.Seguidores_Mutuos(a) == (OK, [b])
+    assert grafo_ctrl.Seguidores_Mutuos(c) == (OK, [])
+    _, top = grafo_ctrl.Mais_Seguidos(2)
+    assert top == [{"id_perfil": b, "seguidores": 2}, {"id_perfil": a, "seguidores": 1}]
+    assert grafo_ctrl.Seguidores_Mutuos(999)[0] == NAO_ENCONTRADO
+
+def test_alteracoes_apos_construcao_sao_aplicadas():
+    a, b, c = _criar("a", "b", "c")
+    seg_ctrl.Seguir_Perfil(a, b)
+    grafo_ctrl.Mais_Seguidos()  # constrói o CSR
+
+    seg_ctrl.Seguir_Perfil(b, a)
+    seg_ctrl.Parar_de_Seguir(a, b)
+    seg_ctrl.Seguir_Perfis_em_lote(c, [a, b])
+
+    assert grafo_ctrl.Seguidores_Mutuos(a) == (OK, [])
+    assert grafo_ctrl.Seguidores_Mutuos(b) == (OK, [])
+    _, top = grafo_ctrl.Mais_Seguidos()
+    assert top == [{"id_perfil": a, "seguidores": 2}, {"id_perfil": b, "seguidores": 1}]
+
+    perfil_ctrl.Desativar_Conta(c)
+    _, top = grafo_ctrl.Mais_Seguidos()
+    assert top == [{"id_perfil": a, "seguidores": 1}]
+
+def test_sugestoes_por_conexoes_em_comum():
+    eu, x, y, z, w, longe = _criar("eu", "x", "y", "z", "w", "longe")
+    seg_ctrl.Seguir_Perfis_em_lote(eu, [x, y])
+    seg_ctrl.Seguir_Perfis_em_lote(x, [z, w, eu])
+    seg_ctrl.Seguir_Perfil(y, z)
+    seg_ctrl.Seguir_Perfil(z, longe)
+
+    codigo, sugestoes = grafo_ctrl.Sugestoes_Amigos(eu)
+    assert codigo == OK
+    assert [(s["id_perfil"], s["em_comum"]) for s in sugestoes] == [(z, 2), (w, 1)]
+
+    _, profundas = grafo_ctrl.Sugestoes_Amigos(eu, profundidade=3)
+    assert profundas[-1] == {"id_perfil": longe, "em_comum": 0, "distancia": 3}
+    assert grafo_ctrl.Sugestoes_Amigos(eu, profundidade=1)[0] == DADOS_INVALIDOS
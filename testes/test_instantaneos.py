@@ -0,0 +1,40 @@
+import pickle
+import pytest
+import dados.database as db
+import controles.jogo_controler as jogo_ctrl
+
+@pytest.fixture(autouse=True)
+def clean_db():
+    db.jogos.clear()
+    db.jogos.append({"id": 1, "titulo": "Celeste", "genero": "Plataforma", "descricao": "", "nota_geral": 0.0, "tags": ["indie"]})
+    db.publicar_instantaneos("jogos")
+    yield
+
+def test_instantaneo_fica_fixo_enquanto_escritor_segue():
+    antes = db.instantaneo("jogos")
+    jogo_ctrl.Cadastrar_Jogo("Hades", "", "Roguelike", None)
+    db.jogos[0]["titulo"] = "alterado sem salvar"
+
+    assert [j["titulo"] for j in antes.registros] == ["Celeste"]
+    depois = db.instantaneo("jogos")
+    assert depois.geracao == db.geracoes["jogos"] > antes.geracao
+    assert [j["titulo"] for j in depois.registros] == ["Celeste", "Hades"]
+
+def test_registros_do_instantaneo_sao_imutaveis():
+    registro = db.instantaneo("jogos").registros[0]
+    with pytest.raises(TypeError):
+        registro["titulo"] = "x"
+    with pytest.raises(TypeError):
+        registro.update(titulo="x")
+    assert registro["tags"] == ("indie",)
+    # continua serializável (pipes do motor fragmentado) e copiável para edição
+    assert pickle.loads(pickle.dumps(registro)) == registro
+    assert dict(registro)["titulo"] == "Celeste"
+
+def test_listar_jogo_instantaneo_le_o_instantaneo():
+    _, lista = jogo_ctrl.Listar_Jogo_instantaneo()
+    assert [j["id"] for j in lista] == [1]
+    assert isinstance(lista[0], db.RegistroCongelado)
+    # Listar_Jogo continua devolvendo os registros vivos, como Busca_Jogo
+    _, vivos = jogo_ctrl.Listar_Jogo()
+    assert vivos[0] is jogo_ctrl.Busca_Jogo(1)[1]
@@ -2,6 +2,7 @@ import pytest
 from utils.codigos import OK, DADOS_INVALIDOS, CONFLITO, NAO_ENCONTRADO
 import dados.database as db
 import controles.jogo_controler as jogo_ctrl
+from utils import paginacao
 
 @pytest.fixture(autouse=True)
 def clean_db(monkeypatch):
@@ -14,6 +15,9 @@ def clean_db(monkeypatch):
     db.jogos.clear()
     db.perfis.clear()
     db.avaliacoes.clear() 
+    jogo_ctrl._incrementar_geracao() # Invalida o cache de busca entre testes
+    jogo_ctrl._descartar_facetas()
+    paginacao.descartar_visoes()
 
     # Dados iniciais
     db.jogos.extend([
@@ -59,4 +63,195 @@ def test_busca_atualiza_remove_jogo():
     
     # 4. Busca após remover (Erro 4) [cite: 124-126]
     code_busca, _ = jogo_ctrl.Busca_Jogo(1)
-    assert code_busca == NAO_ENCONTRADO
\ No newline at end of file
+    assert code_busca == NAO_ENCONTRADO
+
+def test_pesquisar_jogo_por_titulo_e_iniciais():
+    code, res = jogo_ctrl.Pesquisar_Jogo("portal")
+    assert code == OK and res[0]["titulo"] == "Portal 2"
+
+    # Iniciais: "gow" -> God of War
+    code, res = jogo_ctrl.Pesquisar_Jogo("gow", 1)
+    assert code == OK and [j["id"] for j in res] == [1]
+
+    code, _ = jogo_ctrl.Pesquisar_Jogo("   ")
+    assert code == DADOS_INVALIDOS
+
+def test_cache_busca_hits_e_invalidacao():
+    _, antes = jogo_ctrl.Estatisticas_Cache_Busca()
+    jogo_ctrl.Pesquisar_Jogo("Zelda")
+    jogo_ctrl.Pesquisar_Jogo("  zelda ")  # mesma consulta normalizada
+    _, depois = jogo_ctrl.Estatisticas_Cache_Busca()
+    assert depois["misses"] - antes["misses"] == 1
+    assert depois["hits"] - antes["hits"] == 1
+
+    # Cadastrar incrementa a geração: o resultado em cache não pode ser reaproveitado
+    _, res = jogo_ctrl.Pesquisar_Jogo("zelda")
+    assert res == []
+    jogo_ctrl.Cadastrar_Jogo("Zelda Breath of the Wild", None, "Aventura", None)
+    _, res = jogo_ctrl.Pesquisar_Jogo("zelda")
+    assert [j["titulo"] for j in res] == ["Zelda Breath of the Wild"]
+
+def test_cache_busca_limite_lru(monkeypatch):
+    monkeypatch.setattr(jogo_ctrl, "TAMANHO_CACHE_BUSCA", 2)
+    jogo_ctrl.Pesquisar_Jogo("god")
+    jogo_ctrl.Pesquisar_Jogo("portal")
+    jogo_ctrl.Pesquisar_Jogo("god")      # "god" passa a ser o mais recente
+    jogo_ctrl.Pesquisar_Jogo("war")      # expulsa "portal"
+    _, stats = jogo_ctrl.Estatisticas_Cache_Busca()
+    assert stats["tamanho"] == 2
+    assert ("portal", None) not in jogo_ctrl._cache_busca
+    assert ("god", None) in jogo_ctrl._cache_busca
+
+def _seed_facetas():
+    db.jogos.extend([
+        {"id": 3, "titulo": "Elden Ring", "genero": "RPG", "descricao": "", "nota_geral": 9.5},
+        {"id": 4, "titulo": "Persona 5", "genero": "rpg", "descricao": "", "nota_geral": 8.0},
+        {"id": 5, "titulo": "Final Fantasy XV", "genero": "RPG", "descricao": "", "nota_geral": 6.0},
+    ])
+    db.jogos[0]["nota_geral"] = 8.5  # God of War (Ação)
+
+def test_filtrar_jogos_genero_e_nota():
+    _seed_facetas()
+    code, res = jogo_ctrl.Filtrar_Jogos(["RPG"], nota_min=8)
+    assert code == OK
+    assert [j["titulo"] for j in res["jogos"]] == ["Elden Ring", "Persona 5"]
+    assert res["total"] == 2
+    # Facetas consideram só a faixa de nota: 2 RPGs e 1 Ação com nota >= 8
+    assert res["facetas"] == {"RPG": 2, "Ação": 1}
+
+    code, res = jogo_ctrl.Filtrar_Jogos(limite=2)
+    assert [j["id"] for j in res["jogos"]] == [3, 1]
+    assert res["total"] == 5
+
+    code, _ = jogo_ctrl.Filtrar_Jogos(nota_min=9, nota_max=1)
+    assert code == DADOS_INVALIDOS
+
+def test_filtrar_jogos_acompanha_mutacoes():
+    import controles.avaliacao_controler as aval_ctrl
+    import controles.perfil_controler as perfil_ctrl
+    _seed_facetas()
+    jogo_ctrl.Filtrar_Jogos()  # constrói os índices
+
+    # Nova avaliação altera nota_geral e o índice de notas acompanha
+    _, p = perfil_ctrl.Criar_Perfil("faceta")
+    aval_ctrl.Avaliar_jogo(5, 10.0, "", p["id"])
+    _, res = jogo_ctrl.Filtrar_Jogos(["rpg"], nota_min=9.8)
+    assert [j["id"] for j in res["jogos"]] == [5]
+
+    # Mudança de gênero e remoção
+    jogo_ctrl.Atualizar_Jogo(4, "Persona 5", "", "JRPG", None)
+    _, res = jogo_ctrl.Filtrar_Jogos(["RPG"])
+    assert 4 not in [j["id"] for j in res["jogos"]]
+    assert res["facetas"]["JRPG"] == 1
+
+    jogo_ctrl.Remover_Jogo(3)
+    code, novo = jogo_ctrl.Cadastrar_Jogo("Hades", None, "Ação", None)
+    _, res = jogo_ctrl.Filtrar_Jogos(["Acao"])
+    assert [j["id"] for j in res["jogos"]] == [1, novo["id"]]
+    assert "RPG" in res["facetas"] and res["facetas"]["RPG"] == 1
+
+def test_importar_jogos_csv(tmp_path):
+    arquivo = tmp_path / "catalogo.csv"
+    arquivo.write_text(
+        "titulo,genero,descricao\n"
+        "Hades,Ação,rogue-lite\n"
+        "god of war,Ação,\n"      # duplicado do catálogo (CONFLITO)
+        ",Puzzle,\n"              # sem título (DADOS_INVALIDOS)
+        "Celeste,Plataforma,\n"
+        "HADES,Ação,\n",          # duplicado dentro do próprio arquivo
+        encoding="utf-8",
+    )
+    code, res = jogo_ctrl.Importar_Jogos(str(arquivo))
+    assert code == OK
+    assert [j["titulo"] for j in res["importados"]] == ["Hades", "Celeste"]
+    assert [j["id"] for j in res["importados"]] == [3, 4]
+    assert res["erros"] == [(3, CONFLITO), (4, DADOS_INVALIDOS), (6, CONFLITO)]
+    assert len(db.jogos) == 4
+
+def test_importar_jogos_atualiza_facetas_construidas():
+    jogo_ctrl.Filtrar_Jogos()  # constrói os índices
+    linhas = [f'{{"titulo": "Jogo {i}", "genero": "Açao"}}' for i in range(50)]
+    _, res = jogo_ctrl.Importar_Jogos(linhas, "jsonl")
+    _, filtrado = jogo_ctrl.Filtrar_Jogos(["acao"])
+    assert {j["id"] for j in filtrado["jogos"]} == {j["id"] for j in db.jogos if j["genero"] in ("Ação", "Açao")}
+    assert len(filtrado["jogos"]) == 51
+    assert jogo_ctrl._indice_notas == sorted(jogo_ctrl._indice_notas)
+    assert len(jogo_ctrl._indice_notas) == len(db.jogos)
+
+def test_importar_jogos_com_byte_invalido_no_meio(tmp_path):
+    arquivo = tmp_path / "catalogo.csv"
+    linhas = "".join(f"Jogo {i},Ação,\n" for i in range(2000))
+    arquivo.write_bytes(b"titulo,genero,descricao\n" + linhas.encode("utf-8") + b"Ruim \xff,A\xe7\xe3o,\n")
+    assert jogo_ctrl.Pesquisar_Jogo("Jogo 1") == (OK, [])
+
+    code, res = jogo_ctrl.Importar_Jogos(str(arquivo))
+    assert code == OK
+    # a leitura para no trecho ilegível, mas o que já entrou fica publicado
+    assert res["importados"] and res["erros"][-1][1] == DADOS_INVALIDOS
+    assert len(db.jogos) == 2 + len(res["importados"])
+    assert jogo_ctrl.Pesquisar_Jogo("Jogo 1")[1]
+
+def test_importar_jogos_jsonl():
+    linhas = [
+        '{"titulo": "Hollow Knight", "genero": "Metroidvania"}',
+        'isto não é json',
+        '',
+        '{"titulo": "Portal 2", "genero": "Puzzle"}',
+    ]
+    code, res = jogo_ctrl.Importar_Jogos(linhas, "jsonl")
+    assert code == OK
+    assert [j["titulo"] for j in res["importados"]] == ["Hollow Knight"]
+    assert res["erros"] == [(2, DADOS_INVALIDOS), (4, CONFLITO)]
+
+    code, _ = jogo_ctrl.Importar_Jogos(linhas, "xml")
+    assert code == DADOS_INVALIDOS
+    code, _ = jogo_ctrl.Importar_Jogos("/nao/existe.csv")
+    assert code == NAO_ENCONTRADO
+
+def test_listar_jogo_paginado_por_id_e_nota():
+    _seed_facetas()
+    vistos = []
+    cursor = None
+    while True:
+        code, pagina = jogo_ctrl.Listar_Jogo_paginado(2, cursor)
+        assert code == OK
+        vistos.extend(j["id"] for j in pagina["itens"])
+        cursor = pagina["proximo_cursor"]
+        if cursor is None:
+            break
+    assert vistos == [1, 2, 3, 4, 5]
+
+    _, p1 = jogo_ctrl.Listar_Jogo_paginado(2, ordenar_por="nota_geral")
+    assert [j["id"] for j in p1["itens"]] == [3, 1]
+    _, p2 = jogo_ctrl.Listar_Jogo_paginado(2, p1["proximo_cursor"], "nota_geral")
+    assert [j["id"] for j in p2["itens"]] == [4, 5]
+
+    # Cursor de outra ordenação ou corrompido é rejeitado
+    code, _ = jogo_ctrl.Listar_Jogo_paginado(2, p1["proximo_cursor"], "titulo")
+    assert code == DADOS_INVALIDOS
+    code, _ = jogo_ctrl.Listar_Jogo_paginado(2, "???")
+    assert code == DADOS_INVALIDOS
+    code, _ = jogo_ctrl.Listar_Jogo_paginado(0)
+    assert code == DADOS_INVALIDOS
+
+def test_listar_jogo_paginado_visao_atualizada_apos_cadastro():
+    _, p1 = jogo_ctrl.Listar_Jogo_paginado(1, ordenar_por="titulo")
+    assert [j["titulo"] for j in p1["itens"]] == ["God of War"]
+    jogo_ctrl.Cadastrar_Jogo("Hades", None, "Ação", None)
+    _, p2 = jogo_ctrl.Listar_Jogo_paginado(5, p1["proximo_cursor"], "titulo")
+    assert [j["titulo"] for j in p2["itens"]] == ["Hades", "Portal 2"]
+    assert p2["proximo_cursor"] is None
+
+def test_busca_jogos_em_lote():
+    code, por_id = jogo_ctrl.Busca_Jogos([2, 1, 999, 2])
+    assert code == OK
+    assert set(por_id) == {1, 2} and por_id[2]["titulo"] == "Portal 2"
+    assert jogo_ctrl.Busca_Jogos([]) == (OK, {})
+
+def test_atualizar_jogo_com_versao():
+    _, jogo = jogo_ctrl.Cadastrar_Jogo("Hades", "", "Roguelike", None)
+    assert jogo["versao"] == 1
+    code, jogo = jogo_ctrl.Atualizar_Jogo(jogo["id"], "Hades", "deuses", "Roguelike", None, versao=1)
+    assert code == OK and jogo["versao"] == 2
+    assert jogo_ctrl.Atualizar_Jogo(jogo["id"], "Hades II", "", "Roguelike", None, versao=1) == (CONFLITO, None)
+    assert jogo["titulo"] == "Hades"
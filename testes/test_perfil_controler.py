@@ -2,6 +2,8 @@ import pytest
 from utils.codigos import OK, DADOS_INVALIDOS, NAO_ENCONTRADO, CONFLITO
 import dados.database as db
 import controles.perfil_controler as perfil_ctrl
+import controles.similaridade_controler as simil_ctrl
+from utils import paginacao
 
 @pytest.fixture(autouse=True)
 def clean_db(monkeypatch):
@@ -14,6 +16,8 @@ def clean_db(monkeypatch):
     db.perfis.clear()
     db.jogos.clear()
     db.avaliacoes.clear() # FIX: Limpa avaliações anteriores
+    paginacao.descartar_visoes()
+    simil_ctrl._descartar()
 
     # Dados iniciais
     db.jogos.extend([
@@ -101,4 +105,65 @@ def test_desativar_conta_remove_avaliacoes():
     assert jogo["nota_geral"] == 10.0
     
     # Verifica se o perfil sumiu
-    assert p2 not in db.perfis
\ No newline at end of file
+    assert p2 not in db.perfis
+
+def test_listar_perfil_paginado_por_nome():
+    for nome in ["carla", "Ana", "bruno"]:
+        perfil_ctrl.Criar_Perfil(nome)
+    code, p1 = perfil_ctrl.Listar_Perfil_paginado(2, ordenar_por="nome")
+    assert code == OK and [p["nome"] for p in p1["itens"]] == ["Ana", "bruno"]
+    _, p2 = perfil_ctrl.Listar_Perfil_paginado(2, p1["proximo_cursor"], "nome")
+    assert [p["nome"] for p in p2["itens"]] == ["carla"] and p2["proximo_cursor"] is None
+
+def test_listar_perfil_paginado_por_id_com_id_imposto():
+    perfil_ctrl.Criar_Perfil("alto", id_perfil=50)
+    for nome in ["baixo1", "baixo2"]:
+        perfil_ctrl.Criar_Perfil(nome)
+    perfil_ctrl.Criar_Perfil("meio", id_perfil=20)
+    ids = []
+    cursor = None
+    while True:
+        _, pagina = perfil_ctrl.Listar_Perfil_paginado(1, cursor)
+        ids += [p["id"] for p in pagina["itens"]]
+        cursor = pagina["proximo_cursor"]
+        if cursor is None:
+            break
+    assert ids == sorted(p["id"] for p in db.perfis) and len(ids) == 4
+
+def test_busca_perfis_em_lote():
+    _, a = perfil_ctrl.Criar_Perfil("multi_a")
+    _, b = perfil_ctrl.Criar_Perfil("multi_b")
+    code, por_id = perfil_ctrl.Busca_Perfis([b["id"], 999, a["id"]])
+    assert code == OK and por_id == {a["id"]: a, b["id"]: b}
+
+def test_perfis_similares_por_cosseno():
+    db.jogos.append({"id": 3, "titulo": "Celeste", "genero": "Plataforma", "descricao": "", "nota_geral": 0.0})
+    ids = [perfil_ctrl.Criar_Perfil(n)[1]["id"] for n in ("eu", "gemeo", "oposto", "isolado")]
+    eu, gemeo, oposto, isolado = ids
+    for id_jogo, nota in ((1, 9.0), (2, 2.0)):
+        perfil_ctrl.Avaliar_Jogo(eu, id_jogo, nota)
+        perfil_ctrl.Avaliar_Jogo(gemeo, id_jogo, nota)
+    perfil_ctrl.Avaliar_Jogo(oposto, 1, 1.0)
+    perfil_ctrl.Avaliar_Jogo(oposto, 2, 10.0)
+    perfil_ctrl.Avaliar_Jogo(isolado, 3, 8.0)
+
+    code, similares = perfil_ctrl.Perfis_Similares(eu)
+    assert code == OK
+    assert [s["id_perfil"] for s in similares] == [gemeo, oposto]
+    assert similares[0]["similaridade"] == 1.0 and similares[0]["em_comum"] == 2
+
+    # Índice acompanha edições e remoções
+    perfil_ctrl.Remover_Avaliacao(gemeo, 1)
+    perfil_ctrl.Desativar_Conta(oposto)
+    _, similares = perfil_ctrl.Perfis_Similares(eu)
+    assert [s["id_perfil"] for s in similares] == [gemeo]
+    assert similares[0]["similaridade"] < 0.5
+    assert perfil_ctrl.Perfis_Similares(999)[0] == NAO_ENCONTRADO
+
+def test_atualizar_dados_com_versao():
+    _, perfil = perfil_ctrl.Criar_Perfil("otimista")
+    assert perfil["versao"] == 1
+    code, perfil = perfil_ctrl.Atualizar_Dados(perfil["id"], descricao="nova", versao=1)
+    assert code == OK and perfil["versao"] == 2
+    assert perfil_ctrl.Atualizar_Dados(perfil["id"], nome="outro", versao=1) == (CONFLITO, None)
+    assert perfil["nome"] == "otimista"
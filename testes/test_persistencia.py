@@ -0,0 +1,134 @@
+import json
+import threading
+import time
+import pytest
+import dados.database as db
+from utils.codigos import OK, ERRO_PERSISTENCIA
+
+@pytest.fixture(autouse=True)
+def arquivos_temporarios(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "_persistir", True)
+    monkeypatch.setattr(db, "JOGOS_FILE", str(tmp_path / "jogos.json"))
+    db.jogos.clear()
+    yield
+    db.aguardar_gravacoes()
+
+def _ler(caminho):
+    with open(caminho, encoding="utf-8") as f:
+        return json.load(f)
+
+def test_salvar_devolve_futuro_e_grava_atomicamente(tmp_path):
+    db.jogos.append({"id": 1, "titulo": "Celeste"})
+    assert db.salvar_jogos().result(timeout=5) is True
+    assert _ler(db.JOGOS_FILE) == [{"id": 1, "titulo": "Celeste"}]
+    assert [p.name for p in tmp_path.iterdir()] == ["jogos.json"]
+
+def test_copia_fica_fora_da_thread_de_quem_salva(monkeypatch):
+    threads = set()
+    original = db._congelar
+
+    def registrando(valor):
+        threads.add(threading.current_thread().name)
+        return original(valor)
+    monkeypatch.setattr(db, "_congelar", registrando)
+
+    db.jogos.append({"id": 1, "titulo": "Celeste"})
+    db.salvar_jogos().result(timeout=5)
+    assert threads and all(nome.startswith("persistencia") for nome in threads)
+    assert db.instantaneo("jogos").registros == ({"id": 1, "titulo": "Celeste"},)
+
+def test_rajada_de_salvamentos_vira_uma_escrita(monkeypatch):
+    comecou, liberar, escritas = threading.Event(), threading.Event(), []
+    original = db._escrever_atomico
+
+    def lenta(caminho, registros, indent):
+        escritas.append(len(registros))
+        comecou.set()
+        liberar.wait(5)
+        original(caminho, registros, indent)
+    monkeypatch.setattr(db, "_escrever_atomico", lenta)
+
+    futuros = []
+    for i in range(5):
+        db.jogos.append({"id": i + 1})
+        futuros.append(db.salvar_jogos())
+        comecou.wait(5)
+    liberar.set()
+    assert all(f.result(timeout=5) for f in futuros)
+    # a primeira escrita já estava em andamento; as outras quatro se juntaram
+    assert escritas == [1, 5]
+    assert futuros[1] is futuros[4]
+    assert len(_ler(db.JOGOS_FILE)) == 5
+
+def test_erro_de_escrita_chega_pelo_futuro(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "JOGOS_FILE", str(tmp_path / "inexistente" / "jogos.json"))
+    futuro = db.salvar_jogos()
+    assert isinstance(futuro.exception(timeout=5), FileNotFoundError)
+
+def test_commit_em_grupo_confirma_escritores_juntos(monkeypatch):
+    from utils.travas import protegido
+    monkeypatch.setitem(db.GRUPO, "latencia_maxima", 5.0)
+    monkeypatch.setitem(db.GRUPO, "tamanho_lote", 4)
+    escritas = []
+    original = db._escrever_atomico
+
+    def contando(caminho, registros, indent):
+        escritas.append(len(registros))
+        original(caminho, registros, indent)
+    monkeypatch.setattr(db, "_escrever_atomico", contando)
+
+    @protegido(escrita=("jogos",))
+    def cadastrar(i):
+        db.jogos.append({"id": i})
+        db.salvar_jogos()
+
+    todos_dentro = threading.Barrier(4)
+    vistos = {}
+
+    def cliente(i):
+        with db.gravacoes_confirmadas():
+            cadastrar(i)
+            # ainda executando depois de salvar: o lote espera por eles
+            todos_dentro.wait(5)
+        # confirmado: o próprio registro já está no arquivo
+        vistos[i] = any(j["id"] == i for j in _ler(db.JOGOS_FILE))
+
+    threads = [threading.Thread(target=cliente, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+    # o lote fechou pelo tamanho, muito antes da latência máxima
+    assert escritas == [4]
+    assert vistos == {0: True, 1: True, 2: True, 3: True}
+
+def test_leitura_em_andamento_nao_segura_o_lote(monkeypatch):
+    from utils.travas import protegido
+    import controles.jogo_controler as jogo_ctrl
+    monkeypatch.setitem(db.GRUPO, "latencia_maxima", 5.0)
+    dentro, liberar = threading.Event(), threading.Event()
+
+    @protegido(leitura=("perfis",))
+    def leitura_longa():
+        dentro.set()
+        liberar.wait(5)
+
+    leitor = threading.Thread(target=leitura_longa)
+    leitor.start()
+    dentro.wait(5)
+    try:
+        inicio = time.monotonic()
+        code, _ = jogo_ctrl.Cadastrar_Jogo("Hades", "", "Roguelike", None)
+        assert code == OK
+        assert time.monotonic() - inicio < 2.0
+    finally:
+        liberar.set()
+        leitor.join(5)
+
+def test_falha_de_escrita_vira_codigo_de_erro(tmp_path, monkeypatch):
+    import controles.jogo_controler as jogo_ctrl
+    monkeypatch.setattr(db, "JOGOS_FILE", str(tmp_path / "inexistente" / "jogos.json"))
+    code, jogo = jogo_ctrl.Cadastrar_Jogo("Hades", "", "Roguelike", None)
+    # a alteração ficou em memória; a falha chega como código, sem exceção
+    assert code == ERRO_PERSISTENCIA
+    assert jogo["titulo"] == "Hades"
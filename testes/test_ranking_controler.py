@@ -0,0 +1,74 @@
+import pytest
+from utils.codigos import OK, DADOS_INVALIDOS
+import dados.database as db
+import controles.avaliacao_controler as aval_ctrl
+import controles.jogo_controler as jogo_ctrl
+import controles.perfil_controler as perfil_ctrl
+import controles.ranking_controler as rank_ctrl
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    rank_ctrl._descartar()
+
+    db.jogos.extend([
+        {"id": 1, "titulo": "Mario Kart", "genero": "Corrida", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Elden Ring", "genero": "RPG", "descricao": "", "nota_geral": 0.0},
+        {"id": 3, "titulo": "Persona 5", "genero": "RPG", "descricao": "", "nota_geral": 0.0},
+    ])
+    yield
+
+def _perfis(n):
+    return [perfil_ctrl.Criar_Perfil(f"rk{i}")[1]["id"] for i in range(n)]
+
+def _ids(top):
+    return [item["jogo"]["id"] for item in top]
+
+def test_poucos_votos_nao_dominam_o_ranking():
+    ids = _perfis(10)
+    aval_ctrl.Avaliar_jogo(1, 10.0, "", ids[0])              # um único 10
+    for id_perfil in ids:
+        aval_ctrl.Avaliar_jogo(2, 9.0, "", id_perfil)        # dez 9
+    for id_perfil in ids[:4]:
+        aval_ctrl.Avaliar_jogo(3, 6.0, "", id_perfil)
+
+    code, top = rank_ctrl.Top_Jogos(3)
+    assert code == OK
+    assert _ids(top) == [2, 1, 3]
+    assert top[0]["quantidade"] == 10
+    # NP = (soma + m*C) / (v + m), C = 124/15
+    c = 124 / 15
+    assert top[1]["nota_ponderada"] == pytest.approx(round((10 + 5 * c) / 6, 2))
+
+    _, top_rpg = rank_ctrl.Top_Jogos(5, "rpg")
+    assert _ids(top_rpg) == [2, 3]
+    assert rank_ctrl.Top_Jogos(0)[0] == DADOS_INVALIDOS
+
+def test_ranking_incremental_igual_a_reconstrucao():
+    ids = _perfis(8)
+    aval_ctrl.Avaliar_jogo(1, 10.0, "", ids[0])
+    rank_ctrl.Top_Jogos()  # materializa
+
+    for id_perfil in ids:
+        aval_ctrl.Avaliar_jogo(3, 9.5, "", id_perfil)
+    _, av = aval_ctrl.Avaliar_jogo(2, 2.0, "", ids[1])
+    aval_ctrl.Editar_avaliacao(av["id"], 7.0, None)
+    jogo_ctrl.Atualizar_Jogo(1, "Mario Kart", "", "RPG", None)
+    _, incremental = rank_ctrl.Top_Jogos(10)
+    _, incremental_rpg = rank_ctrl.Top_Jogos(10, "RPG")
+    assert _ids(incremental)[0] == 3
+
+    jogo_ctrl.Remover_Jogo(3)
+    _, apos_remocao = rank_ctrl.Top_Jogos(10)
+    assert 3 not in _ids(apos_remocao)
+
+    rank_ctrl._descartar()
+    _, reconstruido = rank_ctrl.Top_Jogos(10)
+    assert _ids(reconstruido) == _ids(apos_remocao)
+    assert _ids(incremental_rpg) == [3, 1, 2]
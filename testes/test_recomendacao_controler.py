@@ -0,0 +1,93 @@
+import pytest
+from utils.codigos import OK, NAO_ENCONTRADO
+import dados.database as db
+import controles.avaliacao_controler as aval_ctrl
+import controles.favoritos_controler as fav_ctrl
+import controles.jogo_controler as jogo_ctrl
+import controles.perfil_controler as perfil_ctrl
+import controles.recomendacao_controler as rec_ctrl
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    rec_ctrl._descartar()
+
+    db.jogos.extend([
+        {"id": 1, "titulo": "Dark Souls", "genero": "RPG", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Elden Ring", "genero": "RPG", "descricao": "", "nota_geral": 0.0},
+        {"id": 3, "titulo": "Stardew Valley", "genero": "Simulação", "descricao": "", "nota_geral": 0.0},
+        {"id": 4, "titulo": "Animal Crossing", "genero": "Simulação", "descricao": "", "nota_geral": 0.0},
+    ])
+    yield
+
+def _perfil(nome, notas):
+    _, p = perfil_ctrl.Criar_Perfil(nome)
+    for id_jogo, nota in notas.items():
+        aval_ctrl.Avaliar_jogo(id_jogo, nota, "", p["id"])
+    return p["id"]
+
+def _ids(itens):
+    return [item["jogo"]["id"] for item in itens]
+
+def test_similares_e_recomendacao_porque_gostou():
+    # Quem gosta de souls gosta de souls; quem gosta de simulação, de simulação
+    _perfil("a", {1: 10, 2: 9, 3: 2, 4: 1})
+    _perfil("b", {1: 9, 2: 10, 3: 3, 4: 2})
+    _perfil("c", {1: 2, 2: 1, 3: 10, 4: 9})
+    novo = _perfil("d", {1: 10, 3: 3})
+
+    _, similares = rec_ctrl.Jogos_Similares(1)
+    assert _ids(similares)[0] == 2
+
+    code, recs = rec_ctrl.Recomendar_Jogos(novo)
+    assert code == OK
+    assert _ids(recs)[0] == 2
+    assert recs[0]["porque"]["id"] == 1
+    assert 1 not in _ids(recs) and 3 not in _ids(recs)
+
+    assert rec_ctrl.Recomendar_Jogos(999)[0] == NAO_ENCONTRADO
+
+def test_atualizacao_incremental_igual_a_reconstrucao():
+    _perfil("a", {1: 10, 2: 9, 3: 2})
+    b = _perfil("b", {1: 9, 3: 3})
+    rec_ctrl.Jogos_Similares(1)  # constrói o modelo
+
+    # Novas avaliações, favoritos, edição, remoção de conta e de jogo
+    _, av = aval_ctrl.Avaliar_jogo(2, 10.0, "", b)
+    c = _perfil("c", {3: 10, 4: 9, 1: 1})
+    fav_ctrl.Favoritar_Jogo(c, 2)
+    aval_ctrl.Editar_avaliacao(av["id"], 4.0, None)
+    e = _perfil("e", {1: 8, 4: 2})
+    perfil_ctrl.Desativar_Conta(e)
+    jogo_ctrl.Remover_Jogo(4)
+
+    incremental = {j: rec_ctrl.Jogos_Similares(j, 5)[1] for j in (1, 2, 3)}
+    rec_incremental = rec_ctrl.Recomendar_Jogos(b)[1]
+    rec_ctrl._descartar()
+    reconstruido = {j: rec_ctrl.Jogos_Similares(j, 5)[1] for j in (1, 2, 3)}
+    for j in (1, 2, 3):
+        assert _ids(incremental[j]) == _ids(reconstruido[j])
+        for x, y in zip(incremental[j], reconstruido[j]):
+            assert x["similaridade"] == pytest.approx(y["similaridade"], abs=1e-3)
+    assert _ids(rec_incremental) == _ids(rec_ctrl.Recomendar_Jogos(b)[1])
+
+def test_perfis_e_jogos_criados_depois_do_modelo():
+    _perfil("a", {1: 10, 2: 9, 3: 2})
+    rec_ctrl.Jogos_Similares(1)  # constrói o modelo
+
+    _, jogo = jogo_ctrl.Cadastrar_Jogo("Hollow Knight", "", "Metroidvania", None)
+    _perfil("b", {1: 10, jogo["id"]: 9, 3: 1})
+    novo = _perfil("c", {1: 10, 3: 2})
+
+    code, recs = rec_ctrl.Recomendar_Jogos(novo)
+    assert code == OK
+    assert jogo["id"] in _ids(recs)
+
+    perfil_ctrl.Desativar_Conta(novo)
+    assert rec_ctrl.Recomendar_Jogos(novo)[0] == NAO_ENCONTRADO
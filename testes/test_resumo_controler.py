@@ -0,0 +1,90 @@
+import pytest
+from utils.codigos import OK, NAO_ENCONTRADO
+import dados.database as db
+import controles.avaliacao_controler as aval_ctrl
+import controles.biblioteca_controler as bib_ctrl
+import controles.favoritos_controler as fav_ctrl
+import controles.jogo_controler as jogo_ctrl
+import controles.perfil_controler as perfil_ctrl
+import controles.resumo_controler as resumo_ctrl
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    resumo_ctrl._descartar()
+
+    db.jogos.extend([
+        {"id": 1, "titulo": "God of War", "genero": "Ação", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Portal 2", "genero": "Puzzle", "descricao": "", "nota_geral": 0.0},
+        {"id": 3, "titulo": "Bayonetta", "genero": "Ação", "descricao": "", "nota_geral": 0.0},
+    ])
+    yield
+
+def test_resumo_construido_de_uma_vez():
+    _, p = perfil_ctrl.Criar_Perfil("ana")
+    aval_ctrl.Avaliar_jogo(1, 8.0, "", p["id"])
+    aval_ctrl.Avaliar_jogo(2, 6.0, "", p["id"])
+    fav_ctrl.Favoritar_Jogo(p["id"], 3)
+    bib_ctrl.Adicionar_Jogo(p["id"], 1, "platinado")
+    bib_ctrl.Adicionar_Jogo(p["id"], 2, "jogando")
+
+    codigo, resumo = resumo_ctrl.Resumo_Perfil(p["id"])
+    assert codigo == OK
+    assert resumo["avaliacoes"] == 2
+    assert resumo["media_notas"] == 7.0
+    assert resumo["favoritos"] == 1
+    assert resumo["generos_favoritos"][0] == ("Ação", 3)
+    assert resumo["taxa_conclusao"] == 0.5
+    assert resumo_ctrl.Resumo_Perfil(999) == (NAO_ENCONTRADO, None)
+
+def test_resumo_acompanha_alteracoes():
+    _, p = perfil_ctrl.Criar_Perfil("bia")
+    _, vazio = resumo_ctrl.Resumo_Perfil(p["id"])
+    assert vazio["media_notas"] is None and vazio["taxa_conclusao"] is None
+
+    _, av = aval_ctrl.Avaliar_jogo(2, 4.0, "", p["id"])
+    aval_ctrl.Editar_avaliacao(av["id"], 10.0, "")
+    fav_ctrl.Favoritar_Jogo(p["id"], 2)
+    bib_ctrl.Adicionar_Jogo(p["id"], 2, "jogando")
+    bib_ctrl.Atualizar_Status_Jogo(p["id"], 2, "jogado")
+    _, resumo = resumo_ctrl.Resumo_Perfil(p["id"])
+    assert resumo["media_notas"] == 10.0
+    assert resumo["generos_favoritos"] == [("Puzzle", 3)]
+    assert resumo["biblioteca"] == {"jogado": 1}
+    assert resumo["taxa_conclusao"] == 1.0
+
+    aval_ctrl.Remover_avaliacao(av["id"])
+    fav_ctrl.Desfavoritar_Jogo(p["id"], 2)
+    _, resumo = resumo_ctrl.Resumo_Perfil(p["id"])
+    assert resumo["avaliacoes"] == 0
+    assert resumo["favoritos"] == 0
+    assert resumo["generos_favoritos"] == [("Puzzle", 1)]
+
+def test_catalogo_alterado_aplica_deltas():
+    _, a = perfil_ctrl.Criar_Perfil("ana")
+    _, b = perfil_ctrl.Criar_Perfil("bia")
+    resumo_ctrl.Resumo_Perfil(a["id"])  # constrói o índice
+    _, novo = jogo_ctrl.Cadastrar_Jogo("Hades", "", "Roguelike", None)
+    for p in (a, b):
+        aval_ctrl.Avaliar_jogo(novo["id"], 9.0, "", p["id"])
+        fav_ctrl.Favoritar_Jogo(p["id"], novo["id"])
+    bib_ctrl.Adicionar_Jogo(a["id"], novo["id"], "platinado")
+    bib_ctrl.Adicionar_Jogo(a["id"], 2, "jogando")
+    assert resumo_ctrl.Resumo_Perfil(a["id"])[1]["generos_favoritos"][0] == ("Roguelike", 3)
+
+    jogo_ctrl.Atualizar_Jogo(novo["id"], "Hades", "", "Ação", None)
+    incremental = resumo_ctrl.Resumo_Perfil(a["id"])[1]
+    assert incremental["generos_favoritos"] == [("Ação", 3), ("Puzzle", 1)]
+
+    jogo_ctrl.Remover_Jogo(novo["id"])
+    incremental = {p["id"]: resumo_ctrl.Resumo_Perfil(p["id"])[1] for p in (a, b)}
+    assert incremental[a["id"]]["biblioteca"] == {"jogando": 1}
+    assert incremental[b["id"]]["favoritos"] == 0
+    resumo_ctrl._descartar()
+    assert incremental == {p["id"]: resumo_ctrl.Resumo_Perfil(p["id"])[1] for p in (a, b)}
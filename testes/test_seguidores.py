@@ -65,4 +65,23 @@ def test_desativar_remove_referencias():
     
     # A lista de "Seguindo" do P1 não deve mais ter o ID do P2
     c_list, seguindo = seg_ctrl.Listar_Seguindo(p1["id"])
-    assert c_list == OK and p2["id"] not in seguindo
\ No newline at end of file
+    assert c_list == OK and p2["id"] not in seguindo
+
+def test_seguir_e_parar_em_lote():
+    _, a = perfil_ctrl.Criar_Perfil("lote_a")
+    _, b = perfil_ctrl.Criar_Perfil("lote_b")
+    _, c = perfil_ctrl.Criar_Perfil("lote_c")
+    seg_ctrl.Seguir_Perfil(a["id"], c["id"])
+
+    code, codigos = seg_ctrl.Seguir_Perfis_em_lote(a["id"], [b["id"], c["id"], a["id"], 999, b["id"]])
+    assert code == OK
+    assert codigos == [OK, CONFLITO, DADOS_INVALIDOS, NAO_ENCONTRADO, CONFLITO]
+    assert a["seguindo"] == [c["id"], b["id"]]
+    assert b["seguidores"] == [a["id"]]
+
+    code, codigos = seg_ctrl.Parar_de_Seguir_em_lote(a["id"], [c["id"], c["id"], 999])
+    assert codigos == [OK, NAO_ENCONTRADO, NAO_ENCONTRADO]
+    assert a["seguindo"] == [b["id"]] and c["seguidores"] == []
+
+    code, codigos = seg_ctrl.Seguir_Perfis_em_lote(999, [a["id"]])
+    assert code == NAO_ENCONTRADO and codigos == []
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import pytest
+from utils.codigos import OK, CONFLITO, NAO_ENCONTRADO, DADOS_INVALIDOS
+import dados.database as db
+from interface import servidor_http
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    db.jogos.extend([
+        {"id": 1, "titulo": "God of War", "genero": "Ação", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Portal 2", "genero": "Puzzle", "descricao": "", "nota_geral": 0.0},
+    ])
+    yield
+
+async def _pedir(porta, metodo, caminho, corpo=None):
+    leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+    dados = json.dumps(corpo).encode("utf-8") if corpo is not None else b""
+    escritor.write(
+        f"{metodo} {caminho} HTTP/1.1\r\nHost: teste\r\nConnection: close\r\n"
+        f"Content-Length: {len(dados)}\r\n\r\n".encode("latin-1") + dados
+    )
+    await escritor.drain()
+    resposta = await leitor.read()
+    escritor.close()
+    cabecalho, _, corpo_resposta = resposta.partition(b"\r\n\r\n")
+    status = int(cabecalho.split()[1])
+    return status, json.loads(corpo_resposta)
+
+def _com_servidor(cenario):
+    async def rodar():
+        servidor = await servidor_http.iniciar_servidor("127.0.0.1", 0)
+        porta = servidor.sockets[0].getsockname()[1]
+        try:
+            await cenario(porta)
+        finally:
+            servidor.close()
+            await servidor.wait_closed()
+            servidor.executor.shutdown(wait=True)
+    asyncio.run(rodar())
+
+def test_crud_e_mapeamento_de_status():
+    async def cenario(porta):
+        status, r = await _pedir(porta, "POST", "/perfis", {"nome": "ana"})
+        assert (status, r["codigo"]) == (201, OK)
+        id_perfil = r["dados"]["id"]
+        assert (await _pedir(porta, "POST", "/perfis", {"nome": "ana"}))[0] == 409
+
+        status, r = await _pedir(porta, "POST", "/avaliacoes", {"id_jogo": 1, "score": 9, "id_perfil": id_perfil})
+        assert status == 201 and r["dados"]["score"] == 9.0
+        status, r = await _pedir(porta, "POST", "/avaliacoes", {"id_jogo": 1, "score": 11, "id_perfil": id_perfil})
+        assert (status, r["codigo"]) == (400, DADOS_INVALIDOS)
+
+        status, r = await _pedir(porta, "GET", "/jogos/1")
+        assert status == 200 and r["dados"]["nota_geral"] == 9.0
+        assert (await _pedir(porta, "GET", "/jogos/99"))[1]["codigo"] == NAO_ENCONTRADO
+
+        status, r = await _pedir(porta, "PUT", f"/perfis/{id_perfil}/biblioteca/2", {"status": "jogando"})
+        assert status == 200
+        status, r = await _pedir(porta, "GET", f"/perfis/{id_perfil}/biblioteca?status=jogando")
+        assert r["dados"] == [{"id_jogo": 2, "status": "jogando", "atualizado_em": r["dados"][0]["atualizado_em"]}]
+    _com_servidor(cenario)
+
+def test_rotas_invalidas_e_paginacao():
+    async def cenario(porta):
+        assert (await _pedir(porta, "GET", "/nada"))[0] == 404
+        assert (await _pedir(porta, "PATCH", "/jogos"))[0] == 405
+        assert (await _pedir(porta, "GET", "/jogos?tamanho=abc"))[0] == 400
+
+        status, r = await _pedir(porta, "GET", "/jogos?tamanho=1&ordenar_por=titulo")
+        assert status == 200 and r["dados"]["itens"][0]["titulo"] == "God of War"
+        cursor = r["dados"]["proximo_cursor"]
+        status, r = await _pedir(porta, "GET", f"/jogos?tamanho=1&ordenar_por=titulo&cursor={cursor}")
+        assert r["dados"]["itens"][0]["titulo"] == "Portal 2"
+    _com_servidor(cenario)
+
+def test_clientes_concorrentes():
+    async def cenario(porta):
+        respostas = await asyncio.gather(*[
+            _pedir(porta, "POST", "/perfis", {"nome": f"p{i}"}) for i in range(30)
+        ])
+        assert all(status == 201 for status, _ in respostas)
+        assert len({r["dados"]["id"] for _, r in respostas}) == 30
+    _com_servidor(cenario)
+
+def test_cabecalho_invalido_e_falha_interna_tem_resposta(monkeypatch):
+    from controles import jogo_controler
+
+    def quebra(*args, **kwargs):
+        raise RuntimeError("ordem de travas violada")
+    monkeypatch.setattr(jogo_controler, "Busca_Jogo", quebra)
+    # erros de tipo/valor dentro do controlador não são culpa do cliente
+    monkeypatch.setattr(jogo_controler, "Pesquisar_Jogo", lambda *a: int("x"))
+
+    async def cenario(porta):
+        leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+        escritor.write(b"POST /perfis HTTP/1.1\r\nContent-Length: abc\r\n\r\n")
+        await escritor.drain()
+        resposta = await leitor.read()
+        escritor.close()
+        assert resposta.split()[1] == b"400"
+
+        status, r = await _pedir(porta, "GET", "/jogos/1")
+        assert (status, r["codigo"]) == (500, None)
+        assert (await _pedir(porta, "GET", "/jogos/busca?q=a"))[0] == 500
+        assert (await _pedir(porta, "GET", "/jogos/busca?q=a&limite=x"))[0] == 400
+    _com_servidor(cenario)
@@ -0,0 +1,85 @@
+import pytest
+from utils.codigos import OK, DADOS_INVALIDOS
+import dados.database as db
+import controles.avaliacao_controler as aval_ctrl
+import controles.biblioteca_controler as bib_ctrl
+import controles.jogo_controler as jogo_ctrl
+import controles.perfil_controler as perfil_ctrl
+import controles.tendencias_controler as tend_ctrl
+from utils import tempo
+
+DIA = 86400
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    tend_ctrl._descartar()
+
+    db.jogos.extend([
+        {"id": 1, "titulo": "God of War", "genero": "Ação", "descricao": "", "nota_geral": 0.0},
+        {"id": 2, "titulo": "Portal 2", "genero": "Puzzle", "descricao": "", "nota_geral": 0.0},
+    ])
+    yield
+
+@pytest.fixture
+def relogio(monkeypatch):
+    atual = {"t": 1_700_000_000}
+    monkeypatch.setattr(tempo, "agora", lambda: atual["t"])
+    return atual
+
+def _titulos(top):
+    return [item["jogo"]["titulo"] for item in top]
+
+def test_registros_recebem_datas(relogio):
+    _, p = perfil_ctrl.Criar_Perfil("ana")
+    _, av = aval_ctrl.Avaliar_jogo(1, 8.0, "", p["id"])
+    assert av["criada_em"] == relogio["t"]
+    relogio["t"] += 10
+    aval_ctrl.Editar_avaliacao(av["id"], 9.0, None)
+    assert av["atualizada_em"] == relogio["t"]
+    _, perfil = bib_ctrl.Adicionar_Jogo(p["id"], 2, "jogando")
+    assert perfil["biblioteca"][0]["atualizado_em"] == relogio["t"]
+
+def test_atividade_recente_vence_atividade_antiga(relogio):
+    ids = [perfil_ctrl.Criar_Perfil(n)[1]["id"] for n in ("a", "b", "c")]
+    for id_perfil in ids:
+        aval_ctrl.Avaliar_jogo(1, 8.0, "", id_perfil)
+    relogio["t"] += 10 * DIA
+    bib_ctrl.Adicionar_Jogo(ids[0], 2, "jogando")
+
+    _, semana = tend_ctrl.Jogos_em_Alta("semana")
+    assert _titulos(semana) == ["Portal 2", "God of War"]
+    assert semana[0]["pontuacao"] == 1.0
+
+    # Construção incremental e a partir dos arquivos concordam
+    tend_ctrl._descartar()
+    assert tend_ctrl.Jogos_em_Alta("semana")[1] == semana
+
+    _, mes = tend_ctrl.Jogos_em_Alta("mes")
+    assert _titulos(mes) == ["God of War", "Portal 2"]
+
+def test_remocoes_e_janela_invalida(relogio):
+    _, p = perfil_ctrl.Criar_Perfil("ana")
+    tend_ctrl.Jogos_em_Alta()
+    _, av = aval_ctrl.Avaliar_jogo(1, 8.0, "", p["id"])
+    aval_ctrl.Avaliar_jogo(2, 8.0, "", p["id"])
+    aval_ctrl.Remover_avaliacao(av["id"])
+    assert _titulos(tend_ctrl.Jogos_em_Alta("dia")[1]) == ["Portal 2"]
+
+    jogo_ctrl.Remover_Jogo(2)
+    assert tend_ctrl.Jogos_em_Alta("dia") == (OK, [])
+    assert tend_ctrl.Jogos_em_Alta("ano")[0] == DADOS_INVALIDOS
+
+def test_jogo_cadastrado_depois_do_indice_aparece(relogio):
+    _, p = perfil_ctrl.Criar_Perfil("ana")
+    tend_ctrl.Jogos_em_Alta()
+    _, novo = jogo_ctrl.Cadastrar_Jogo("Hades", "", "Roguelike", None)
+    aval_ctrl.Avaliar_jogo(novo["id"], 9.0, "", p["id"])
+    jogo_ctrl.Atualizar_Jogo(novo["id"], "Hades II", "", "Roguelike", None)
+    assert _titulos(tend_ctrl.Jogos_em_Alta()[1]) == ["Hades II"]
@@ -0,0 +1,120 @@
+import threading
+import pytest
+from utils import travas
+from utils.codigos import OK
+import dados.database as db
+import controles.favoritos_controler as fav_ctrl
+import controles.perfil_controler as perfil_ctrl
+import controles.seguidores_controler as seg_ctrl
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(db, "salvar_perfis", lambda: True)
+    monkeypatch.setattr(db, "salvar_jogos", lambda: True)
+    monkeypatch.setattr(db, "salvar_avaliacoes", lambda: True)
+
+    db.perfis.clear()
+    db.jogos.clear()
+    db.avaliacoes.clear()
+    db.jogos.extend([
+        {"id": i, "titulo": f"Jogo {i}", "genero": "Ação", "descricao": "", "nota_geral": 0.0}
+        for i in range(1, 21)
+    ])
+    yield
+
+def _em_paralelo(alvos):
+    threads = [threading.Thread(target=alvo) for alvo in alvos]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    assert not any(t.is_alive() for t in threads)
+
+def test_leitores_simultaneos_e_escritor_exclusivo():
+    trava = travas.TravaLeituraEscrita("teste")
+    dentro = threading.Barrier(3, timeout=5)
+
+    def ler():
+        trava.adquirir_leitura()
+        try:
+            dentro.wait()  # só passa se os três leitores estiverem dentro juntos
+        finally:
+            trava.liberar_leitura()
+    _em_paralelo([ler, ler, ler])
+
+    trava.adquirir_escrita()
+    trava.adquirir_leitura()  # quem escreve também pode ler
+    liberado = threading.Event()
+
+    def ler_depois():
+        trava.adquirir_leitura()
+        liberado.set()
+        trava.liberar_leitura()
+    t = threading.Thread(target=ler_depois)
+    t.start()
+    assert not liberado.wait(0.1)
+    trava.liberar_leitura()
+    trava.liberar_escrita()
+    assert liberado.wait(5)
+    t.join()
+
+def test_ordem_de_travas_e_promocao_sao_recusadas():
+    with travas.travar(leitura=("avaliacoes",)):
+        with pytest.raises(RuntimeError):
+            with travas.travar(leitura=("perfis",)):
+                pass
+    with travas.travar(leitura=("jogos",)):
+        with pytest.raises(RuntimeError):
+            with travas.travar(escrita=("jogos",)):
+                pass
+    with travas.travar(escrita=("perfis", "jogos")):
+        with travas.travar(leitura=("jogos",)):
+            pass
+
+def test_seguir_concorrente_com_desativar_conta():
+    ids = [perfil_ctrl.Criar_Perfil(f"p{i}")[1]["id"] for i in range(12)]
+    alvo = ids[0]
+
+    def seguir(id_perfil):
+        return lambda: [seg_ctrl.Seguir_Perfil(id_perfil, outro) for outro in ids if outro != id_perfil]
+
+    _em_paralelo([seguir(i) for i in ids[1:]] + [lambda: perfil_ctrl.Desativar_Conta(alvo)])
+
+    restantes = {p["id"] for p in db.perfis}
+    assert alvo not in restantes
+    for p in db.perfis:
+        # nenhuma referência pendurada e seguidores/seguindo simétricos
+        assert set(p["seguindo"]) <= restantes
+        for seguido in p["seguindo"]:
+            assert p["id"] in next(q for q in db.perfis if q["id"] == seguido)["seguidores"]
+
+def test_favoritar_em_paralelo_no_mesmo_perfil():
+    _, perfil = perfil_ctrl.Criar_Perfil("ana")
+    jogos = list(range(1, 21))
+
+    def favoritar(parte):
+        return lambda: [fav_ctrl.Favoritar_Jogo(perfil["id"], j) for j in parte]
+
+    _em_paralelo([favoritar(jogos[i::4]) for i in range(4)])
+    assert sorted(perfil["favoritos"]) == jogos
+    assert fav_ctrl.Listar_Favoritos(perfil["id"]) == (OK, perfil["favoritos"])
+
+def test_leituras_paginadas_compartilham_indices(monkeypatch):
+    from utils import paginacao
+    import controles.jogo_controler as jogo_ctrl
+    dentro = threading.Barrier(3, timeout=5)
+    original = paginacao.paginar
+
+    def paginar(*args, **kwargs):
+        dentro.wait()  # só passa com as três consultas dentro de `indices` juntas
+        return original(*args, **kwargs)
+    monkeypatch.setattr(paginacao, "paginar", paginar)
+
+    resultados = []
+    _em_paralelo([lambda: resultados.append(jogo_ctrl.Listar_Jogo_paginado(5)[0])] * 3)
+    assert resultados == [OK] * 3
+    # aviso aos índices continua exclusivo e não pode vir de dentro de uma leitura
+    with travas.travar_indices(compartilhada=True):
+        with pytest.raises(RuntimeError):
+            with travas.travar_indices():
+                pass
@@ -5,3 +5,4 @@ DADOS_INVALIDOS = 1
 ERRO_DELETAR = 2
 CONFLITO = 3
 NAO_ENCONTRADO = 4
+ERRO_PERSISTENCIA = 5
@@ -0,0 +1,80 @@
+# utils/esbocos.py
+"""
+Esboços probabilísticos de memória fixa e mescláveis:
+
+- HyperLogLog: estimativa de cardinalidade (quantos itens distintos).
+- CountMin: estimativa de frequência por chave (nunca subestima).
+
+O hash é derivado de blake2b sobre repr(item), e não de hash(), para que
+esboços montados em processos diferentes possam ser mesclados.
+"""
+import hashlib
+import math
+from array import array
+from typing import Any, List
+
+def _hash64(item: Any, salt: bytes = b"") -> int:
+    digest = hashlib.blake2b(repr(item).encode("utf-8"), digest_size=8, salt=salt).digest()
+    return int.from_bytes(digest, "big")
+
+class HyperLogLog:
+    """Contador de distintos com 2**precisao registradores de 1 byte."""
+
+    def __init__(self, precisao: int = 10):
+        if not 4 <= precisao <= 16:
+            raise ValueError("precisao deve estar entre 4 e 16")
+        self.precisao = precisao
+        self.registradores = bytearray(1 << precisao)
+
+    def adicionar(self, item: Any) -> None:
+        h = _hash64(item)
+        p = self.precisao
+        indice = h >> (64 - p)
+        resto = h & ((1 << (64 - p)) - 1)
+        posicao = (64 - p) - resto.bit_length() + 1
+        if posicao > self.registradores[indice]:
+            self.registradores[indice] = posicao
+
+    def estimar(self) -> int:
+        m = len(self.registradores)
+        alfa = 0.7213 / (1 + 1.079 / m)
+        estimativa = alfa * m * m / sum(2.0 ** -r for r in self.registradores)
+        vazios = self.registradores.count(0)
+        if estimativa <= 2.5 * m and vazios:
+            estimativa = m * math.log(m / vazios)  # correção para poucos itens
+        return int(round(estimativa))
+
+    def mesclar(self, outro: "HyperLogLog") -> None:
+        if outro.precisao != self.precisao:
+            raise ValueError("esboços com precisões diferentes")
+        self.registradores = bytearray(map(max, self.registradores, outro.registradores))
+
+class CountMin:
+    """Frequências aproximadas em `profundidade` linhas de `largura` contadores."""
+
+    def __init__(self, largura: int = 2048, profundidade: int = 4):
+        if largura <= 0 or not 1 <= profundidade <= 8:
+            raise ValueError("dimensões inválidas")
+        self.largura = largura
+        self.profundidade = profundidade
+        self.tabela = array("Q", bytes(8 * largura * profundidade))
+
+    def _posicoes(self, chave: Any) -> List[int]:
+        digest = hashlib.blake2b(repr(chave).encode("utf-8"), digest_size=8 * self.profundidade).digest()
+        return [
+            linha * self.largura + int.from_bytes(digest[8 * linha:8 * linha + 8], "big") % self.largura
+            for linha in range(self.profundidade)
+        ]
+
+    def adicionar(self, chave: Any, quantidade: int = 1) -> None:
+        for pos in self._posicoes(chave):
+            self.tabela[pos] += quantidade
+
+    def estimar(self, chave: Any) -> int:
+        return min(self.tabela[pos] for pos in self._posicoes(chave))
+
+    def mesclar(self, outro: "CountMin") -> None:
+        if (outro.largura, outro.profundidade) != (self.largura, self.profundidade):
+            raise ValueError("esboços com dimensões diferentes")
+        for i, valor in enumerate(outro.tabela):
+            self.tabela[i] += valor
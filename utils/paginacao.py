@@ -0,0 +1,81 @@
+# utils/paginacao.py
+"""
+Paginação por cursor (keyset).
+Cada ordenação é uma função que devolve uma tupla terminada no id do
+registro, de modo que a chave é única e o cursor é simplesmente a chave
+do último item entregue, codificada de forma opaca.
+"""
+import base64
+import bisect
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.codigos import OK, DADOS_INVALIDOS
+
+Chave = Callable[[Dict[str, Any]], Tuple]
+
+# Visões ordenadas em cache: (colecao, ordenacao) -> (geracao, lista ordenada)
+_visoes: Dict[Tuple[str, str], Tuple[int, List[Dict[str, Any]]]] = {}
+
+def codificar_cursor(ordenar_por: str, chave: Tuple) -> str:
+    bruto = json.dumps([ordenar_por, *chave], ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(bruto).decode("ascii")
+
+def decodificar_cursor(cursor: str) -> Optional[Tuple[str, Tuple]]:
+    try:
+        valores = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError, AttributeError):
+        return None
+    if not isinstance(valores, list) or len(valores) < 2 or not isinstance(valores[0], str):
+        return None
+    return valores[0], tuple(valores[1:])
+
+def descartar_visoes() -> None:
+    _visoes.clear()
+
+def _visao_ordenada(colecao: str, ordenar_por: str, lista: List[Dict[str, Any]], chave: Chave, geracao: int) -> List[Dict[str, Any]]:
+    """
+    Lista ordenada por `chave`, reordenada apenas quando a geração da coleção muda.
+    Roda só com leitura de `indices`: dois leitores podem reordenar ao mesmo
+    tempo; cada um troca a entrada inteira e nenhum volta a uma geração mais antiga.
+    """
+    em_cache = _visoes.get((colecao, ordenar_por))
+    if em_cache is not None and em_cache[0] == geracao:
+        return em_cache[1]
+    visao = sorted(lista, key=chave)
+    atual = _visoes.get((colecao, ordenar_por))
+    if atual is None or atual[0] < geracao:
+        _visoes[(colecao, ordenar_por)] = (geracao, visao)
+    return visao
+
+def paginar(colecao: str, lista: List[Dict[str, Any]], ordenacoes: Dict[str, Chave], geracao: int,
+            tamanho_pagina: int, cursor: Optional[str] = None, ordenar_por: str = "id") -> Tuple[int, Dict[str, Any]]:
+    """
+    Retorna {"itens": [...], "proximo_cursor": str | None}.
+    Todas as ordenações, inclusive "id", usam uma visão ordenada em cache:
+    ids impostos (Criar_Perfil(id_perfil=...), Avaliar_jogo(id_avaliacao=...))
+    podem deixar a própria lista fora de ordem. A reordenação só acontece
+    quando a geração muda (e é linear se a lista já estiver em ordem); o
+    custo por página é O(log n + tamanho_pagina).
+    """
+    chave = ordenacoes.get(ordenar_por)
+    if chave is None or not isinstance(tamanho_pagina, int) or tamanho_pagina <= 0:
+        return DADOS_INVALIDOS, {}
+
+    ordenada = _visao_ordenada(colecao, ordenar_por, lista, chave, geracao)
+
+    inicio = 0
+    if cursor is not None:
+        decodificado = decodificar_cursor(cursor)
+        if decodificado is None or decodificado[0] != ordenar_por:
+            return DADOS_INVALIDOS, {}
+        try:
+            inicio = bisect.bisect_right(ordenada, decodificado[1], key=chave)
+        except TypeError:
+            return DADOS_INVALIDOS, {}
+
+    itens = ordenada[inicio:inicio + tamanho_pagina]
+    proximo = None
+    if itens and inicio + tamanho_pagina < len(ordenada):
+        proximo = codificar_cursor(ordenar_por, chave(itens[-1]))
+    return OK, {"itens": itens, "proximo_cursor": proximo}
@@ -0,0 +1,6 @@
+# utils/tempo.py
+import time
+
+def agora() -> int:
+    """Instante atual em segundos desde a época Unix (UTC), como gravado nos registros."""
+    return int(time.time())
@@ -0,0 +1,27 @@
+# utils/texto.py
+"""
+Utilitários de texto: normalização com remoção de acentos e tokenização
+para textos em português.
+"""
+import re
+import unicodedata
+from typing import List
+
+# Palavras muito frequentes que não ajudam a ranquear resultados
+STOPWORDS = {
+    "a", "o", "as", "os", "um", "uma", "uns", "umas", "de", "do", "da", "dos",
+    "das", "em", "no", "na", "nos", "nas", "e", "ou", "que", "com", "por",
+    "para", "pra", "se", "ao", "aos", "mas", "muito", "mais",
+}
+
+_RE_TOKEN = re.compile(r"[a-z0-9]+")
+
+def remover_acentos(texto: str) -> str:
+    """'Ação' -> 'Acao'."""
+    decomposto = unicodedata.normalize("NFKD", texto)
+    return "".join(ch for ch in decomposto if not unicodedata.combining(ch))
+
+def tokenizar(texto: str) -> List[str]:
+    """Minúsculas, sem acentos, apenas alfanuméricos e sem stopwords."""
+    texto = remover_acentos((texto or "").lower())
+    return [t for t in _RE_TOKEN.findall(texto) if t not in STOPWORDS]
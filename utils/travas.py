@@ -0,0 +1,237 @@
+# utils/travas.py
+"""
+Modelo de concorrência dos controladores.
+
+- Cada coleção (perfis, jogos, avaliacoes) tem uma trava leitura/escrita
+  reentrante: consultas tomam leitura e rodam em paralelo; alterações
+  estruturais (inserir/remover da lista, varreduras que precisam de
+  exclusão, cascatas) tomam escrita.
+- Alterações locais a um perfil (seguir, favoritar, biblioteca) tomam
+  leitura da coleção mais a trava da entidade, de modo que perfis
+  diferentes são alterados em paralelo.
+- Os índices derivados (controles/eventos.py e os módulos que ele avisa,
+  caches de busca e paginação) ficam sob a trava leitura/escrita
+  `indices`: avisos, construções e consultas que alteram um índice tomam
+  escrita; consultas que só leem índices já prontos (protegido com
+  le_indices=True) tomam leitura e rodam em paralelo.
+
+Ordem obrigatória de aquisição (evita deadlock):
+
+    perfis -> jogos -> avaliacoes -> entidades (ids crescentes) -> indices
+
+Uma thread pode readquirir o que já tem, e quem tem escrita pode ler,
+mas não é possível promover leitura a escrita nem voltar na ordem:
+nesses casos é levantado RuntimeError, para o erro aparecer no teste e
+não como travamento em produção. Por isso cada função pública declara
+de uma vez todas as coleções que a cascata dela toca.
+"""
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Optional, Tuple, Hashable
+
+from dados import database
+from utils.codigos import ERRO_PERSISTENCIA
+
+COLECOES = ("perfis", "jogos", "avaliacoes")
+
+class TravaLeituraEscrita:
+    """Trava leitura/escrita reentrante com preferência para escritores."""
+
+    def __init__(self, nome: str):
+        self.nome = nome
+        self._condicao = threading.Condition(threading.Lock())
+        self._leitores: Dict[int, int] = {}
+        self._escritor = None
+        self._profundidade = 0
+        self._escritores_esperando = 0
+
+    def adquirir_leitura(self) -> None:
+        eu = threading.get_ident()
+        with self._condicao:
+            if self._escritor != eu and eu not in self._leitores:
+                # leitor novo espera escritores ativos e na fila
+                while self._escritor is not None or self._escritores_esperando:
+                    self._condicao.wait()
+            self._leitores[eu] = self._leitores.get(eu, 0) + 1
+
+    def liberar_leitura(self) -> None:
+        eu = threading.get_ident()
+        with self._condicao:
+            restante = self._leitores[eu] - 1
+            if restante:
+                self._leitores[eu] = restante
+            else:
+                del self._leitores[eu]
+                if not self._leitores:
+                    self._condicao.notify_all()
+
+    def adquirir_escrita(self) -> None:
+        eu = threading.get_ident()
+        with self._condicao:
+            if self._escritor == eu:
+                self._profundidade += 1
+                return
+            if eu in self._leitores:
+                raise RuntimeError(f"trava '{self.nome}': leitura não pode ser promovida a escrita")
+            self._escritores_esperando += 1
+            try:
+                while self._escritor is not None or self._leitores:
+                    self._condicao.wait()
+            finally:
+                self._escritores_esperando -= 1
+            self._escritor = eu
+            self._profundidade = 1
+
+    def liberar_escrita(self) -> None:
+        with self._condicao:
+            self._profundidade -= 1
+            if not self._profundidade:
+                self._escritor = None
+                self._condicao.notify_all()
+
+colecoes = {nome: TravaLeituraEscrita(nome) for nome in COLECOES}
+indices = TravaLeituraEscrita("indices")
+
+_travas_entidades: Dict[Tuple[str, Hashable], threading.RLock] = {}
+_mutex_entidades = threading.Lock()
+_estado = threading.local()
+
+def _mantidas() -> Dict[str, int]:
+    if not hasattr(_estado, "colecoes"):
+        _estado.colecoes = {}
+        _estado.entidades = {}
+        _estado.indices = 0
+    return _estado.colecoes
+
+def _checar_colecao(nome: str) -> None:
+    mantidas = _mantidas()
+    if nome in mantidas:
+        return
+    posicao = COLECOES.index(nome)
+    if any(COLECOES.index(outra) > posicao for outra in mantidas) or _estado.entidades or _estado.indices:
+        raise RuntimeError(f"ordem de travas violada ao adquirir '{nome}'")
+
+@contextmanager
+def travar(leitura: Iterable[str] = (), escrita: Iterable[str] = ()):
+    """Adquire as travas das coleções pedidas na ordem global."""
+    leitura, escrita = set(leitura), set(escrita)
+    adquiridas = []
+    mantidas = _mantidas()
+    try:
+        for nome in COLECOES:
+            if nome not in leitura and nome not in escrita:
+                continue
+            _checar_colecao(nome)
+            trava = colecoes[nome]
+            if nome in escrita:
+                trava.adquirir_escrita()
+                adquiridas.append((nome, trava.liberar_escrita))
+            else:
+                trava.adquirir_leitura()
+                adquiridas.append((nome, trava.liberar_leitura))
+            mantidas[nome] = mantidas.get(nome, 0) + 1
+        yield
+    finally:
+        for nome, liberar in reversed(adquiridas):
+            liberar()
+            mantidas[nome] -= 1
+            if not mantidas[nome]:
+                del mantidas[nome]
+
+@contextmanager
+def travar_entidades(colecao: str, ids: Iterable[Hashable]):
+    """Travas de entidades da mesma coleção, sempre em ordem crescente de id."""
+    _mantidas()
+    chaves = sorted({(colecao, i) for i in ids}, key=lambda c: (str(type(c[1])), c[1]))
+    novas = [c for c in chaves if c not in _estado.entidades]
+    if novas and (_estado.entidades or _estado.indices):
+        raise RuntimeError("ordem de travas violada: entidades devem ser travadas de uma vez")
+    with _mutex_entidades:
+        travas = [_travas_entidades.setdefault(c, threading.RLock()) for c in chaves]
+    adquiridas = []
+    try:
+        for chave, trava in zip(chaves, travas):
+            trava.acquire()
+            adquiridas.append((chave, trava))
+            _estado.entidades[chave] = _estado.entidades.get(chave, 0) + 1
+        yield
+    finally:
+        for chave, trava in reversed(adquiridas):
+            _estado.entidades[chave] -= 1
+            if not _estado.entidades[chave]:
+                del _estado.entidades[chave]
+            trava.release()
+
+def descartar_entidade(colecao: str, id_entidade: Hashable) -> None:
+    """Esquece a trava de uma entidade removida (chamar sob escrita da coleção)."""
+    with _mutex_entidades:
+        _travas_entidades.pop((colecao, id_entidade), None)
+
+@contextmanager
+def travar_indices(compartilhada: bool = False):
+    """Escrita em `indices`; com compartilhada=True, leitura (não pode ser promovida depois)."""
+    _mantidas()
+    if compartilhada:
+        indices.adquirir_leitura()
+        liberar = indices.liberar_leitura
+    else:
+        indices.adquirir_escrita()
+        liberar = indices.liberar_escrita
+    _estado.indices += 1
+    try:
+        yield
+    finally:
+        _estado.indices -= 1
+        liberar()
+
+def protegido(leitura: Iterable[str] = (), escrita: Iterable[str] = (), usa_indices: bool = False,
+              entidades: Optional[Callable[..., Iterable[Hashable]]] = None, colecao_entidades: str = "perfis",
+              le_indices: bool = False):
+    """
+    Decorador: executa a função com as travas de coleção pedidas e, com
+    usa_indices, a trava `indices` (le_indices=True: só leitura). Se
+    `entidades` for dado, é chamado com os mesmos argumentos da função e
+    devolve os ids a travar (em `colecao_entidades`) depois das coleções.
+    Nas funções que alteram dados (com `escrita` ou `entidades`), a
+    chamada mais externa, depois de soltar tudo, espera as gravações que
+    fez ficarem em disco (commit em grupo, ver dados/database.py); se a
+    escrita falhou, o código devolvido vira ERRO_PERSISTENCIA.
+    """
+    leitura, escrita = tuple(leitura), tuple(escrita)
+    altera = bool(escrita) or entidades is not None
+
+    def decorador(funcao):
+        def executar(*args, **kwargs):
+            with travar(leitura, escrita):
+                ids = entidades(*args, **kwargs) if entidades else ()
+                with travar_entidades(colecao_entidades, ids):
+                    if not usa_indices:
+                        return funcao(*args, **kwargs)
+                    with travar_indices(compartilhada=le_indices):
+                        return funcao(*args, **kwargs)
+
+        if not altera:
+            return functools.wraps(funcao)(executar)
+
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            # o bloco envolve as travas: a espera pelo disco é feita já sem elas
+            with database.gravacoes_confirmadas() as confirmacao:
+                resultado = executar(*args, **kwargs)
+            if confirmacao.falha is not None and isinstance(resultado, tuple):
+                return ERRO_PERSISTENCIA, resultado[1]
+            return resultado
+        return envolvida
+    return decorador
+
+def sob_indices(funcao):
+    """Decorador para avisos e manutenção dos índices derivados."""
+    @functools.wraps(funcao)
+    def envolvida(*args, **kwargs):
+        with travar_indices():
+            return funcao(*args, **kwargs)
+    return envolvida
+
+# Consultas que podem (re)construir um índice lendo todas as coleções
+consulta_indice = protegido(leitura=COLECOES, usa_indices=True)
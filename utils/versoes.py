@@ -0,0 +1,18 @@
+# utils/versoes.py
+"""
+Versões por registro para concorrência otimista: todo perfil, jogo e
+avaliação nasce com "versao" 1, e cada atualização bem-sucedida a
+incrementa. As funções de atualização aceitam `versao` (a versão que o
+chamador leu) e devolvem CONFLITO se o registro mudou desde então.
+Registros antigos, sem o campo, contam como versão 0.
+"""
+from typing import Any, Dict, Optional
+
+VERSAO_INICIAL = 1
+
+def confere(registro: Dict[str, Any], esperada: Optional[int]) -> bool:
+    """True se não há versão esperada ou se ela é a atual."""
+    return esperada is None or registro.get("versao", 0) == esperada
+
+def avancar(registro: Dict[str, Any]) -> None:
+    registro["versao"] = registro.get("versao", 0) + 1